@@ -4,7 +4,7 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   26 July 2013
+Modified:   18 October 2026
 
 Provides the asset objects.
 
@@ -19,6 +19,7 @@ Date          Author          Version     Description
 ----------    ------------    --------    -----------------------------
 2013-07-25    shenely         1.0         Initial revision
 2013-07-26    shenely         1.1         Rearranged arguments
+2026-10-18                    1.2         Epoch queue replaces requeue
 
 """
 
@@ -28,7 +29,6 @@ Date          Author          Version     Description
 #
 #Built-in libraries
 from datetime import datetime,timedelta
-from Queue import PriorityQueue
 
 #External libraries
 import zmq
@@ -36,11 +36,11 @@ from bson.tz_util import utc
 
 #Internal libraries
 from . import BaseAsset
-from epoch import EpochState
-from core.routine import control,queue,method,socket
+from epoch import EpochQueue
+from core.routine import control,method,socket
 from message import INERTIAL_PRODUCT,GEOGRAPHIC_PRODUCT
 from message.routine import telemetry,product
-from epoch.routine import order
+from epoch.routine import queue
 from state.routine import interpolate,transform
 #
 ##################
@@ -57,7 +57,7 @@ __all__ = ["AssetController"]
 ####################
 # Constant section #
 #
-__version__ = "1.1"#current version [major.minor]
+__version__ = "1.2"#current version [major.minor]
 
 EPOCH_ADDRESS = "{asset!s}.{segment!s}.Epoch"
 TELEMETRY_ADDRESS = "{asset!s}.{segment!s}.Telemetry"
@@ -115,31 +115,23 @@ class AssetController(BaseAsset):
         self.application.Behavior("Special asset controller")
         
         if interpolator is HERMITE_INTERPOLATOR:
-            seed = EpochState(**kwargs["seed"])
+            state_queue = EpochQueue()
             
-            state_queue = PriorityQueue()
+            put_state = queue.PriorityPut()
+            put_state.queue = state_queue
             
-            put_state = queue.PutQueue(state_queue)
-            get_state = queue.GetQueue(state_queue)
+            get_state = queue.PriorityGet()
+            get_state.queue = state_queue
+            get_state.lower = remove
+            get_state.upper = interpolate1
             
             extract_state = telemetry.ExtractState()
             
-            interpolate_after = order.AfterEpoch(seed,interpolate1)
-            update_interpolate = method.ExecuteMethod(interpolate_after.set_reference)
-            
-            remove_after = order.AfterEpoch(seed,remove)
-            update_remove = method.ExecuteMethod(remove_after.set_reference)
-            
             interpolate_state = interpolate.HermiteInterpolate()
             rotate_interpolate = method.ExecuteMethod(interpolate_state.set_state)
             
             state_split = control.SplitControl(self.application.processor)
             
-            self.application.Scenario("Update epoch").\
-                From("Split epoch",self.segment.epoch_split).\
-                Then("Update remove",update_remove).\
-                And("Update interpolate",update_interpolate)
-                
             self.application.Scenario("State extraction").\
                 From("Split telemetry",telemetry_split).\
                 When("Extract state",extract_state).\
@@ -147,15 +139,9 @@ class AssetController(BaseAsset):
                 
             self.application.Scenario("Update state").\
                 From("Split epoch",self.segment.epoch_split).\
-                When("Get state",get_state).\
-                Given("After lower",remove_after).Is(True).\
-                And("After upper",interpolate_after).Is(False).\
+                When("Get states between lower and upper",get_state).\
                 Then("Update state",rotate_interpolate)
             
-            self.application.Scenario("Requeue state").\
-                Given("After upper",interpolate_after).Is(True).\
-                Then("Put state",put_state)
-            
             self.application.Scenario("Hermite interpolator").\
                 From("Split epoch",self.segment.epoch_split).\
                 When("Interpolate state",interpolate_state).\
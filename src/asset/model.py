@@ -4,7 +4,7 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   26 July 2013
+Modified:   18 October 2026
 
 Provides the asset model.
 
@@ -19,6 +19,7 @@ Date          Author          Version     Description
 ----------    ------------    --------    -----------------------------
 2013-07-25    shenely         1.0         Initial revision
 2013-07-26    shenely         1.1         Rearranged arguments
+2026-10-18                    1.2         Epoch queue replaces requeue
 
 """
 
@@ -28,7 +29,6 @@ Date          Author          Version     Description
 #
 #Built-in libraries
 from datetime import datetime,timedelta
-from Queue import PriorityQueue
 
 #External libraries
 import zmq
@@ -36,11 +36,11 @@ from bson.tz_util import utc
 
 #Internal libraries
 from . import BaseAsset
-from epoch import EpochState
+from epoch import EpochQueue
 from state import KeplerianState
 import message
-from core.routine import queue,method,socket
-from epoch.routine import order
+from core.routine import method,socket
+from epoch.routine import order,queue
 from state.routine import propagate,transform
 from message.routine import telemetry
 #
@@ -58,7 +58,7 @@ __all__ = ["AssetModel"]
 ####################
 # Constant section #
 #
-__version__ = "1.1"#current version [major.minor]
+__version__ = "1.2"#current version [major.minor]
 
 EPOCH_ADDRESS = "{asset!s}.{segment!s}.Epoch"
 TELEMETRY_ADDRESS = "{asset!s}.{segment!s}.Telemetry"
@@ -92,39 +92,25 @@ class AssetModel(BaseAsset):
 
         pub_telemetry = socket.PublishSocket(telemetry_socket,telemetry_address)
         
-        state_queue = PriorityQueue()
+        state_queue = EpochQueue()
         
-        seed = EpochState(**kwargs["seed"])
+        put_telemetry = queue.PriorityPut()
+        put_telemetry.queue = state_queue
         
-        put_telemetry = queue.PutQueue(state_queue)
-        get_telemetry = queue.GetQueue(state_queue)
-
-        publish_after = order.AfterEpoch(seed,publish)
-        update_publish = method.ExecuteMethod(publish_after.set_reference)
-        
-        remove_after = order.AfterEpoch(seed,remove)
-        update_remove = method.ExecuteMethod(remove_after.set_reference)
+        get_telemetry = queue.PriorityGet()
+        get_telemetry.queue = state_queue
+        get_telemetry.lower = remove
+        get_telemetry.upper = publish
         
         format_telemetry = telemetry.FormatTelemetry()
         
         self.application.Behavior("General asset model")
-        
-        self.application.Scenario("Update epoch").\
-            From("Epoch split",self.segment.epoch_split).\
-            Then("Update publish threshold with epoch",update_publish).\
-            And("Update remove threshold with epoch",update_remove)
             
         self.application.Scenario("Publish telemetry").\
             From("Epoch split",self.segment.epoch_split).\
-            When("Telemetry message is in queue",get_telemetry).\
-            Given("Telemetry epoch after remove threshold (is true)",remove_after).Is(True).\
-            And("Telemetry epoch after publish threshold (is false)",publish_after).Is(False).\
+            When("Telemetry messages between remove and publish thresholds",get_telemetry).\
             Then("Format telemetry to string",format_telemetry).\
             To("Telemetry address",pub_telemetry)
-        
-        self.application.Scenario("Requeue telemetry").\
-            Given("Telemetry epoch after publish threshold (is true)",publish_after).Is(True).\
-            Then("Enqueue telemetry message",put_telemetry)
             
         self.application.Behavior("Special asset model")
         
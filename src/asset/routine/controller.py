@@ -4,7 +4,7 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   26 July 2013
+Modified:   18 October 2026
 
 Provides routines for controller manipulation.
 
@@ -18,6 +18,7 @@ ParseController  -- Parse asset controller
 Date          Author          Version     Description
 ----------    ------------    --------    -----------------------------
 2013-07-26    shenely         1.0         Initial revision
+2026-10-18                    1.1         Journal logging
 
 """
 
@@ -26,7 +27,6 @@ Date          Author          Version     Description
 # Import section #
 #
 #Built-in libraries
-import logging
 import types
 
 #External libraries
@@ -50,7 +50,7 @@ __all__ = ["ParseController"]
 ####################
 # Constant section #
 #
-__version__ = "1.0"#current version [major.minor]
+__version__ = "1.1"#current version [major.minor]
 #
 ####################
 
@@ -85,12 +85,10 @@ class ParseController(EventRoutine):
     def _occur(self,message):
         assert isinstance(message,types.StringTypes)
         
-        logging.info("{0}:  Parsing from {1}".\
-                     format(self.name,message))
+        self.journal.info("{0}:  Parsing from {1}",message)
         
         controller =  AssetController(self.segment,**decoder(message))
         
-        logging.info("{0}:  Parsed to {1}".\
-                     format(self.name,controller.name))
+        self.journal.info("{0}:  Parsed to {1}",controller.name)
                      
         return controller
\ No newline at end of file
@@ -4,7 +4,7 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   26 July 2013
+Modified:   18 October 2026
 
 Provides routines for model manipulation.
 
@@ -18,6 +18,9 @@ ParseModel  -- Parse asset model
 Date          Author          Version     Description
 ----------    ------------    --------    -----------------------------
 2013-07-26    shenely         1.0         Initial revision
+2026-10-18                    1.1         Skip models owned by other shards
+2026-10-18                    1.2         Journal logging
+2026-10-18                    1.3         Partitioned on one key
 
 """
 
@@ -26,7 +29,6 @@ Date          Author          Version     Description
 # Import section #
 #
 #Built-in libraries
-import logging
 import types
 
 #External libraries
@@ -50,7 +52,7 @@ __all__ = ["ParseModel"]
 ####################
 # Constant section #
 #
-__version__ = "1.0"#current version [major.minor]
+__version__ = "1.3"#current version [major.minor]
 #
 ####################
 
@@ -73,6 +75,12 @@ class ParseModel(EventRoutine):
     THEN the message SHALL be decoded as an state
         AND the state SHALL be sent downstream
     
+    Scenario 2:  Asset owned by another shard
+    WHEN a message is received from upstream
+        AND the behavior is built in every shard
+        AND the asset name is owned by another shard
+    THEN no model SHALL be sent downstream
+    
     """
     
     name = "Model.Parse"
@@ -85,12 +93,27 @@ class ParseModel(EventRoutine):
     def _occur(self,message):
         assert isinstance(message,types.StringTypes)
         
-        logging.info("{0}:  Parsing from {1}".\
-                     format(self.name,message))
+        self.journal.info("{0}:  Parsing from {1}",message)
+        
+        kwargs = decoder(message)
         
-        model =  AssetModel(self.segment,**decoder(message))
+        if not self.owns(kwargs["name"]):
+            self.journal.info("{0}:  {1} owned by another shard",
+                              kwargs["name"])
+            
+            return
         
-        logging.info("{0}:  Parsed to {1}".\
-                     format(self.name,model.name))
+        model =  AssetModel(self.segment,**kwargs)
+        
+        self.journal.info("{0}:  Parsed to {1}",model.name)
                      
-        return model
\ No newline at end of file
+        return model
+    
+    def owns(self,name):
+        """Asset is modeled by this shard (partitioned on one key only)"""
+        application = self.segment.application
+        
+        if application.partitioned(self.behavior):
+            return True#story already owned by this shard alone
+        else:
+            return application.owns(name)
\ No newline at end of file
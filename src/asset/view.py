@@ -4,7 +4,7 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   25 July 2013
+Modified:   18 October 2026
 
 Provides the asset objects.
 
@@ -18,6 +18,7 @@ AssetView   -- Asset view object
 Date          Author          Version     Description
 ----------    ------------    --------    -----------------------------
 2013-07-25    shenely         1.0         Initial revision
+2026-10-18                    1.1         Products served from last-value cache
 
 """
 
@@ -33,7 +34,7 @@ import zmq
 #Internal libraries
 from . import BaseAsset
 from message import INERTIAL_PRODUCT,GEOGRAPHIC_PRODUCT
-from core.routine import control,socket
+from core.routine import cache,control,socket
 from message.routine import product
 from epoch import routine as epoch
 #
@@ -53,7 +54,7 @@ __all__ = ["AssetModel",
 ####################
 # Constant section #
 #
-__version__ = "1.0"#current version [major.minor]
+__version__ = "1.1"#current version [major.minor]
 
 EPOCH_ADDRESS = "{asset!s}.{segment!s}.Epoch"
 TELEMETRY_ADDRESS = "{asset!s}.{segment!s}.Telemetry"
@@ -78,9 +79,23 @@ class AssetView(BaseAsset):
         parse_product = product.ParseProduct()
         product_split = control.SplitControl(self.application.processor)
         
+        product_cache = cache.LastValueCache()
+        
+        put_product = cache.CachePut()
+        put_product.cache = product_cache
+        put_product.asset = self.name
+        
+        get_product = cache.CacheGet()
+        get_product.cache = product_cache
+        
         self.application.Scenario("Receive product").\
             From("Subscribe source",sub_product).\
             When("Parse product",parse_product).\
+            Then("Cache newest product",put_product)
+        
+        self.application.Scenario("Serve product").\
+            From("Epoch split",self.segment.epoch_split).\
+            When("Newest products in cache",get_product).\
             To("Split product",product_split)
         
         if INERTIAL_PRODUCT in products:
@@ -4,7 +4,7 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   26 July 2013
+Modified:   18 October 2026
 
 Purpose:    
 """
@@ -17,9 +17,9 @@ Purpose:
 import functools
 import types
 import json
+import sys
 
 #External libraries
-from numpy import matrix
 from bson import json_util
 from bson.objectid import ObjectId
 
@@ -34,6 +34,8 @@ from bson.objectid import ObjectId
 __all__= ["coroutine",
           "ObjectDict",
           "BaseObject",
+          "SlotObject",
+          "freeze",
           "encoder",
           "decoder"]
 #
@@ -43,7 +45,7 @@ __all__= ["coroutine",
 ####################
 # Constant section #
 #
-__version__ = "1.0"#current version [major.minor]
+__version__ = "1.5"#current version [major.minor]
 #
 ####################
 
@@ -78,6 +80,156 @@ class BaseObject(ObjectDict):
         assert isinstance(_id,ObjectId) or _id is None
         
         self._id = _id if _id is not None else ObjectId()
+
+class SlotObject(object):
+    """Compact object (attributes in slots, identifier on demand)
+    
+    Converted to a dictionary at the encoder and database boundaries.
+    """
+    
+    __slots__ = ("_object_id",)
+    
+    fields = dict()#public slots by class
+    
+    def __init__(self,_id=None):
+        assert isinstance(_id,ObjectId) or _id is None
+        
+        self._object_id = _id
+    
+    @property
+    def _id(self):
+        if self._object_id is None:
+            self._object_id = ObjectId()
+        
+        return self._object_id
+    
+    def keys(self):
+        cls = type(self)
+        
+        if cls not in self.fields:
+            self.fields[cls] = ["_id"] + \
+                               [slot for base in reversed(cls.__mro__)
+                                for slot in base.__dict__.get("__slots__",())
+                                if not slot.startswith("_")]
+        
+        return self.fields[cls]
+    
+    def __getitem__(self,key):
+        try:
+            return getattr(self,key)
+        except AttributeError:
+            raise KeyError(key)
+    
+    def todict(self):
+        """Dictionary of the slots (nested objects converted as well)"""
+        return dict([(key,plain(getattr(self,key))) for key in self.keys()])
+
+def plain(value):
+    """Value with slot objects converted to dictionaries (at any depth)"""
+    if isinstance(value,SlotObject):
+        return value.todict()
+    elif isinstance(value,(types.ListType,types.TupleType)):
+        return [plain(item) for item in value]
+    elif isinstance(value,types.DictType):
+        return dict([(key,plain(item)) for key,item in value.iteritems()])
+    else:
+        return value
+    
+    def __repr__(self):
+        return "{0}({1})".\
+               format(type(self).__name__,
+                      ",".join(["{0}={1!r}".format(key,getattr(self,key))
+                                for key in self.keys()[1:]]))
+
+def immutable(self,*args,**kwargs):
+    raise TypeError("{0} is frozen".format(type(self).__name__))
+
+frozen = dict()#frozen subclass by class
+
+def readonly(value):
+    """Read-only view of an array (the owner's array stays writable)"""
+    numpy = sys.modules.get("numpy")#no array exists until numpy is loaded
+    
+    if numpy is not None and isinstance(value,numpy.ndarray):
+        value = value.view()
+        value.setflags(write=False)
+    
+    return value
+
+def attributes(obj):
+    """Attributes of an object (dictionary items or slots)"""
+    if isinstance(obj,dict):
+        return dict(obj)
+    else:
+        slots = set([slot for base in type(obj).__mro__
+                     for slot in base.__dict__.get("__slots__",())
+                     if slot not in ("__dict__","__weakref__")])
+        
+        result = dict([(slot,getattr(obj,slot)) for slot in slots
+                       if hasattr(obj,slot)])
+        result.update(getattr(obj,"__dict__",{}))
+        
+        return result
+
+def refreeze(cls,values):
+    """Rebuild a frozen object from its class and attributes (see pickle)"""
+    obj = cls.__new__(cls)#constructors differ, so only the state is set
+    
+    if isinstance(obj,dict):
+        dict.update(obj,values)
+    else:
+        for name,value in values.items():
+            setattr(obj,name,value)
+    
+    return freeze(obj)
+
+def pickled(self):
+    """Pickled as its original class (frozen again when loaded)"""
+    return refreeze,(type(self).__bases__[0],attributes(self))
+
+def freeze(obj):
+    """Make a message immutable in place (so it can be shared, not copied)
+    
+    The class of the object is swapped for a frozen subclass that rejects
+    assignment.  Only the message itself is frozen:  arrays are replaced
+    with read-only views and nested objects are left as they are, since
+    the producer may still be updating them.  A frozen object is pickled
+    (and copied) as its original class, then frozen again.
+    """
+    cls = type(obj)
+    
+    if isinstance(obj,(ObjectDict,SlotObject)) and \
+       not getattr(cls,"__frozen__",False):
+        if cls not in frozen:
+            attrs = dict(__slots__=(),#same layout (required for the swap)
+                         __module__=cls.__module__,
+                         __qualname__=getattr(cls,"__qualname__",
+                                              cls.__name__),
+                         __frozen__=True,
+                         __setattr__=immutable,
+                         __delattr__=immutable,
+                         __reduce__=pickled)
+            
+            if issubclass(cls,dict):
+                for name in ("__setitem__","__delitem__","clear","pop",
+                             "popitem","setdefault","update"):
+                    attrs[name] = immutable
+            
+            frozen[cls] = type(cls.__name__,(cls,),attrs)
+        
+        if isinstance(obj,ObjectDict):
+            for key,value in obj.items():
+                dict.__setitem__(obj,key,readonly(value))
+        else:
+            obj._id#assigned before the swap
+            
+            for key in obj.keys()[1:]:
+                if hasattr(obj,key):
+                    setattr(obj,key,readonly(getattr(obj,key)))
+        
+        object.__setattr__(obj,"__class__",frozen[cls])#bypasses ObjectDict
+    
+    return obj
         
 def object_hook(dct):
     dct = json_util.object_hook(dct)
@@ -86,13 +238,19 @@ def object_hook(dct):
         dct = ObjectDict(dct)
         
         if hasattr(dct,"$matrix"):
+            from numpy import matrix#only loaded once a matrix is received
+            
             dct = matrix(getattr(dct,"$matrix")).T
     
     return dct
 
 def default(obj):
-    if isinstance(obj,matrix):
+    numpy = sys.modules.get("numpy")#no matrix exists until numpy is loaded
+    
+    if numpy is not None and isinstance(obj,numpy.matrix):
         obj = { "$matrix": obj.T.tolist() }
+    elif isinstance(obj,SlotObject):
+        obj = obj.todict()
     else:
         obj = json_util.default(obj)
         
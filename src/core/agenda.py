@@ -4,12 +4,15 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   16 July 2013
+Modified:   18 October 2026
 
 Provides a agenda service.
 
 Classes:
 Scheduler -- Scheduler
+RunQueue  -- Priority lanes with earliest-deadline-first ordering
+VirtualCallback -- Periodic source on the virtual-time calendar
+AsyncProcessor -- Scheduler with blocking routines on worker threads
 """
 
 """Change log:
@@ -20,6 +23,23 @@ Date          Author          Version     Description
 2013-06-29    shenely         1.1         Refactored to agenda
 2013-06-29    shenely         1.2         Generalized to processor
 2013-07-16    shenely         1.3         Fixed pipe issue
+2026-10-18                    1.4         Batched dispatch mode
+2026-10-18                    1.5         Fused pipeline dispatch
+2026-10-18                    1.6         Reset for forked shards
+2026-10-18                    1.7         Priority lanes and deadlines
+2026-10-18                    1.8         Lock-free run queue
+2026-10-18                    1.9         Backpressure on handlers
+2026-10-18                    1.10        Asynchronous processor
+2026-10-18                    1.11        Entries stamped for metrics
+2026-10-18                    1.12        Time-sliced, fair run loop
+2026-10-18                    1.13        Virtual-time calendar
+2026-10-18                    1.14        Sources removable
+2026-10-18                    1.15        Undated work skips the heap
+2026-10-18                    1.16        Deferred scheduling
+2026-10-18                    1.17        Batched results charged per origin
+2026-10-18                    1.18        Plain FIFO for undated work of one behavior; dated runs skip the heap
+2026-10-18                    1.19        Loop variables no longer shadow itertools.count
+2026-10-18                    1.20        Virtual time waits for local subscribers
 
 """
 
@@ -28,9 +48,13 @@ Date          Author          Version     Description
 # Import section #
 #
 #Built-in libraries
-from datetime import timedelta
-from Queue import Queue
+from datetime import datetime,timedelta
+from collections import Counter,deque
+from heapq import heappush,heappop
+from itertools import count
+from multiprocessing.pool import ThreadPool
 import logging
+import time
 
 #External libraries
 from zmq.eventloop import ioloop
@@ -44,9 +68,15 @@ from zmq.eventloop import ioloop
 # Export section #
 #
 __all__ = ["Processor",
+           "AsyncProcessor",
+           "RunQueue",
+           "VirtualCallback",
            "PERIODIC",
            "DELAYED",
-           "HANDLER"]
+           "HANDLER",
+           "CRITICAL",
+           "NORMAL",
+           "BULK"]
 #
 ##################
 
@@ -54,21 +84,345 @@ __all__ = ["Processor",
 ####################
 # Constant section #
 #
-__version__ = "1.3"#current version [major.minor]
+__version__ = "1.20"#current version [major.minor]
 
 TIMEOUT = timedelta(0,0,0,100)#time between running
 
+BATCH_SIZE = 1#messages per dispatch (batching disabled)
+
+HIGH_WATER = 1000#queued messages per source before polling stops
+LOW_WATER = 100#queued messages per source before polling resumes
+
+WORKER_COUNT = 4#threads for blocking routines
+
+TIME_SLICE = 0.01#seconds of work before yielding to the IOLoop
+MESSAGE_SLICE = 1000#messages dispatched before yielding to the IOLoop
+QUANTUM = 16#entries per behavior before its lane moves on
+
 PERIODIC = 0#Periodic scenario
 DELAYED  = 1#Delayed scenario
 HANDLER  = 2#Triggered scenario
+
+CRITICAL = 0#Epoch-critical work (clock fan-out, commands)
+NORMAL   = 1#Regular work
+BULK     = 2#Catch-up work (bulk formatting)
+
+NO_DEADLINE = float("-inf")#unparsed messages have not been dated yet
+UNIX_EPOCH = datetime(1970,1,1)#origin of deadlines
 #
 ####################
 
 
+def seconds(epoch):
+    """Simulation epoch (in seconds)"""
+    if isinstance(epoch,datetime):
+        if epoch.tzinfo is not None:
+            epoch = epoch.replace(tzinfo=None) - epoch.utcoffset()
+        
+        return (epoch - UNIX_EPOCH).total_seconds()
+    else:
+        return NO_DEADLINE
+
+def deadline(message):
+    """Simulation epoch of a message (in seconds)"""
+    return seconds(getattr(message,"epoch",None))
+
+class RunQueue(object):
+    """Story:  Run queue
+    
+    IN ORDER TO keep epoch-critical work ahead of a backlog
+    AS A generic segment
+    I WANT TO order scheduled work by priority class and deadline
+    
+    """
+    
+    """Specification:  Run queue
+    
+    GIVEN a lane for each priority class
+        AND an inbox for work from other threads
+    
+    Scenario 1:  Work scheduled
+    WHEN work is scheduled for a target routine
+    THEN the work SHALL be added to the lane of the target priority
+        AND the work SHALL be ordered by the epoch of its message
+        AND work with the same epoch SHALL be kept in order of arrival
+    
+    Scenario 2:  Work dispatched
+    WHEN work is requested
+    THEN the earliest work in the highest priority non-empty lane
+        SHALL be removed
+    
+    Scenario 3:  Work injected
+    WHEN work is injected from another thread
+    THEN the work SHALL be added to the inbox
+        AND the work SHALL be scheduled before the next request
+    
+    Scenario 4:  Work counted
+    WHEN work is scheduled or removed
+    THEN the queue depth of the originating source SHALL be updated
+    
+    Scenario 5:  Several behaviors busy
+    WHEN work for several behaviors is in the same lane
+    THEN each behavior SHALL have work removed in turn
+        AND each turn SHALL be at most a quantum of work
+    
+    Scenario 6:  Only undated work for one behavior
+    WHEN all scheduled work is undated and for the same behavior and lane
+    THEN the work SHALL be removed in order of arrival
+        AND the work SHALL NOT be ordered or given turns
+    
+    """
+    
+    #Entry layout:  [deadline,order,message,fpipe,tpipe,origin,stamp]
+    #(one list per hop; the heaps never compare past the unique order)
+    
+    def __init__(self,quantum=QUANTUM):
+        assert quantum > 0
+        
+        object.__init__(self)
+        
+        self.quantum = quantum
+        
+        #while all work is undated and for one behavior in one lane, it is
+        #kept in a plain FIFO (no ordering or turns to pay for)
+        self.fifo = deque()
+        self.owner = None#lane and behavior of the work in the FIFO
+        
+        #otherwise, per lane, the pending work of each behavior (undated,
+        #dated in order of arrival, dated out of order) and the turn order
+        self.lanes = [dict() for priority in (CRITICAL,NORMAL,BULK)]
+        self.turns = [deque() for priority in (CRITICAL,NORMAL,BULK)]
+        self.credit = [quantum for priority in (CRITICAL,NORMAL,BULK)]
+        
+        self.order = count()
+        self.size = 0
+        self.depth = Counter()#queued work by originating source
+        
+        self.inbox = deque()#appends are atomic, so no lock is needed
+        
+    def __iter__(self):
+        self.drain()
+        
+        for entry in self.fifo:
+            yield entry[2],entry[3],entry[4]
+        
+        for lane in self.lanes:
+            entries = [entry for pending in lane.itervalues()
+                       for work in pending for entry in work]
+            
+            for entry in sorted(entries,key=lambda entry:entry[:2]):
+                yield entry[2],entry[3],entry[4]
+    
+    def pending(self,priority,behavior):
+        """Pending work of a behavior (added to the turns if new)"""
+        lane = self.lanes[priority]
+        
+        pending = lane.get(behavior)
+        if pending is None:
+            pending = lane[behavior] = (deque(),deque(),list())
+            
+            self.turns[priority].append(behavior)
+        
+        return pending
+    
+    def put(self,message,fpipe,tpipe,origin=None,stamp=None):
+        """Schedule work (IOLoop thread only)"""
+        if origin is not None:
+            self.depth[origin] += 1
+        
+        epoch = getattr(message,"epoch",None)
+        
+        if not isinstance(epoch,datetime):
+            if self.size == len(self.fifo):
+                owner = (tpipe.priority,tpipe.behavior)
+                
+                if self.size == 0:
+                    self.owner = owner
+                
+                if owner == self.owner:
+                    self.fifo.append([NO_DEADLINE,0,
+                                      message,fpipe,tpipe,origin,stamp])
+                    
+                    self.size += 1
+                    
+                    return
+            
+            if self.fifo:self.spill()
+            
+            self.pending(tpipe.priority,tpipe.behavior)[0].\
+                append([NO_DEADLINE,0,message,fpipe,tpipe,origin,stamp])
+        else:
+            if self.fifo:self.spill()
+            
+            entry = [(epoch - UNIX_EPOCH).total_seconds() \
+                     if epoch.tzinfo is None else seconds(epoch),
+                     next(self.order),message,fpipe,tpipe,origin,stamp]
+            
+            pending = self.lanes[tpipe.priority].get(tpipe.behavior)
+            if pending is None:
+                pending = self.pending(tpipe.priority,tpipe.behavior)
+            
+            _,ordered,heap = pending
+            
+            #epochs mostly arrive in order, so most work skips the heap
+            if not ordered or ordered[-1][0] <= entry[0]:
+                ordered.append(entry)
+            else:
+                heappush(heap,entry)
+        
+        self.size += 1
+    
+    def spill(self):
+        """Move the FIFO to its behavior (once other work is scheduled)"""
+        self.pending(*self.owner)[0].extend(self.fifo)
+        self.fifo.clear()
+    
+    def get(self):
+        """Remove the next entry (IOLoop thread only)"""
+        if self.inbox:self.drain()
+        
+        if self.fifo:
+            entry = self.fifo.popleft()
+        else:
+            entry = self.next()
+            
+            if entry is None:return None
+        
+        self.size -= 1
+        
+        if entry[5] is not None:
+            self.depth[entry[5]] -= 1
+        
+        return entry
+    
+    def next(self):
+        """Remove the next entry of the lanes (earliest deadline first)"""
+        for priority,turns in enumerate(self.turns):
+            if turns:
+                lane = self.lanes[priority]
+                undated,ordered,heap = lane[turns[0]]
+                
+                if undated:
+                    entry = undated.popleft()
+                elif not heap or (ordered and ordered[0] < heap[0]):
+                    entry = ordered.popleft()
+                else:
+                    entry = heappop(heap)
+                
+                if not (undated or ordered or heap):
+                    del lane[turns.popleft()]
+                    
+                    self.credit[priority] = self.quantum
+                elif len(turns) == 1:
+                    pass#no other behavior is waiting for a turn
+                elif self.credit[priority] > 1:
+                    self.credit[priority] -= 1
+                else:
+                    turns.rotate(-1)#next behavior's turn
+                    
+                    self.credit[priority] = self.quantum
+                
+                return entry
+    
+    def peek(self):
+        """Next entry to be removed (without removing it)"""
+        if self.inbox:self.drain()
+        
+        if self.fifo:return self.fifo[0]
+        
+        for priority,turns in enumerate(self.turns):
+            if turns:
+                undated,ordered,heap = self.lanes[priority][turns[0]]
+                
+                if undated:
+                    return undated[0]
+                elif not heap or (ordered and ordered[0] < heap[0]):
+                    return ordered[0]
+                else:
+                    return heap[0]
+    
+    def inject(self,message,fpipe,tpipe,origin=None):
+        """Schedule work (any thread)"""
+        self.inbox.append((message,fpipe,tpipe,origin))
+    
+    def drain(self):
+        """Schedule work injected from other threads"""
+        while len(self.inbox) > 0:
+            self.put(*self.inbox.popleft())
+    
+    def empty(self):
+        if len(self.inbox) > 0:self.drain()
+        
+        return self.size == 0
+    
+    def qsize(self):
+        return self.size + len(self.inbox)
+
+class VirtualCallback(object):
+    """Story:  Virtual-time source
+    
+    IN ORDER TO run a simulation as fast as the processor allows
+    AS A generic segment
+    I WANT TO fire periodic sources in order of simulation epoch
+    
+    """
+    
+    """Specification:  Virtual-time source
+    
+    GIVEN a periodic source with its next simulation epoch
+        AND a processor in virtual-time mode
+    
+    Scenario 1:  Source started
+    WHEN the source is started
+    THEN the source SHALL be entered on the calendar at its next epoch
+    
+    Scenario 2:  Previous tick drained
+    WHEN the work of the previous tick has drained
+        AND no published message is in flight to a subscriber in this
+            process
+    THEN the source with the earliest next epoch SHALL be fired
+        AND sources with the same epoch SHALL be fired in order of entry
+        AND the source SHALL be re-entered at its new next epoch
+    
+    Scenario 3:  Source stopped
+    WHEN the source is stopped
+    THEN the source SHALL no longer be fired
+    
+    Scenario 4:  Subscriber in another process
+    WHEN a message is published to a subscriber in another process
+    THEN the next source SHALL NOT wait for its work (virtual time is
+        only deterministic within one process)
+    
+    """
+    
+    def __init__(self,callback,routine,processor):
+        assert callable(callback)
+        assert hasattr(routine,"next")#epoch of the next tick
+        
+        object.__init__(self)
+        
+        self.callback = callback
+        self.routine = routine
+        self.processor = processor
+        
+        self.active = False
+    
+    def start(self):
+        if not self.active:
+            self.active = True
+            
+            self.processor.enter(self)
+    
+    def stop(self):
+        self.active = False
+    
+    def is_running(self):
+        return self.active
+
 class Processor(object):
     self = None
     
-    queue = Queue()
+    queue = RunQueue()
     
     started = False
     running = False
@@ -76,11 +430,68 @@ class Processor(object):
     main = None
     loop = ioloop.IOLoop.instance()
     
+    batch = BATCH_SIZE
+    batches = Counter()#dispatched batches by size
+    
+    timeslice = TIME_SLICE
+    messages = MESSAGE_SLICE
+    
+    virtual = False#fire periodic sources from the calendar
+    horizon = None#epoch at which a virtual-time run stops
+    calendar = list()#periodic sources by next epoch
+    fired = list()#sources fired since the queue last drained
+    ticks = count()
+    inflight = 0#published messages not yet received (virtual time)
+    subscriptions = dict()#address by local subscriber
+    
+    high = HIGH_WATER
+    low = LOW_WATER
+    
+    origin = None#source of the work being dispatched
+    deferred = list()#work to schedule after the work being dispatched
+    sources = dict()#scenario by source
+    timers = dict()#periodic or delayed callback by source
+    handlers = dict()#handle registration by source
+    throttled = set()#sources no longer polled
+    
     def __new__(cls):
-        if cls.self is None:
-            cls.self = object.__new__(cls)
+        #one processor per process, whichever backend is created first
+        if Processor.self is None:
+            Processor.self = object.__new__(cls)
             
-        return cls.self
+        return Processor.self
+    
+    @classmethod
+    def reset(cls):
+        """Discard state inherited from a parent process (after fork)"""
+        Processor.self = None
+        
+        cls.queue = RunQueue()
+        
+        cls.started = False
+        cls.running = False
+        
+        cls.main = None
+        
+        #install a fresh loop, so IOLoop.instance() is not the parent's
+        ioloop.IOLoop.clear_instance()
+        cls.loop = ioloop.IOLoop()
+        cls.loop.install()
+        
+        cls.batches = Counter()
+        
+        cls.origin = None
+        cls.deferred = list()
+        cls.sources = dict()
+        cls.timers = dict()
+        cls.handlers = dict()
+        cls.throttled = set()
+        
+        cls.calendar = list()
+        cls.fired = list()
+        cls.ticks = count()
+        cls.inflight = 0
+        cls.subscriptions = dict()
                 
     def start(self):
         if not self.started:
@@ -107,57 +518,436 @@ class Processor(object):
             self.main = self.loop.add_timeout(TIMEOUT,self.run)
 
     def agenda(self):
-        self.stop()
-
-        for i in range(self.queue.qsize()):
-            message,pipeline = self.queue.get()
-
+        for message,fpipe,tpipe in self.queue:
             logging.debug("{0}:  {1}".\
-                     format(pipeline.name,str(message)))
-
-            self.queue.put((message,pipeline))
-        else:
-            self.start()
+                     format(tpipe.name,str(message)))
 
-    def periodic(self,routine,timeout):
+    def periodic(self,routine,timeout,scenario=None):
+        self.sources[routine] = scenario
+        
         def callback():
+            self.origin = routine
             self.schedule(None,None,routine)
-            
-        return ioloop.PeriodicCallback(callback,timeout,self.loop)
+        
+        if self.virtual:
+            self.timers[routine] = VirtualCallback(callback,routine,self)
+        else:
+            self.timers[routine] = ioloop.PeriodicCallback(callback,
+                                                           timeout,
+                                                           self.loop)
+        
+        return self.timers[routine]
 
-    def delayed(self,routine,timeout):
+    def delayed(self,routine,timeout,scenario=None):
+        self.sources[routine] = scenario
+        
         def callback():
+            self.origin = routine
             self.schedule((None,None),routine)
-            
-        return ioloop.DelayedCallback(callback,timeout,self.loop)
+        
+        self.timers[routine] = ioloop.DelayedCallback(callback,
+                                                      timeout,
+                                                      self.loop)
+        
+        return self.timers[routine]
 
-    def handler(self,fpipe,handle,event=ioloop.POLLIN):
+    def handler(self,fpipe,handle,event=ioloop.POLLIN,scenario=None):
+        self.sources[fpipe] = scenario
+        
         def callback(socket,events):
+            self.origin = fpipe
+            
             message,tpipe = fpipe.routine.send((None,None))
             self.schedule(message,fpipe,tpipe)
+        
+        self.handlers[fpipe] = handle,callback,event
             
         self.loop.add_handler(handle,callback,event)
     
+    def remove(self,routine):
+        """Stop a source (queued work from it still runs)"""
+        timer = self.timers.pop(routine,None)
+        if timer is not None:
+            timer.stop()
+        
+        if routine in self.handlers:
+            handle,callback,event = self.handlers.pop(routine)
+            
+            if routine in self.throttled:
+                self.throttled.discard(routine)
+            else:
+                self.loop.remove_handler(handle)
+        
+        self.sources.pop(routine,None)
+    
+    def throttle(self,origin):
+        """Stop polling a source (its socket high-water mark takes over)"""
+        if origin in self.handlers and origin not in self.throttled:
+            handle,callback,event = self.handlers[origin]
+            
+            self.loop.remove_handler(handle)
+            self.throttled.add(origin)
+            
+            logging.warn("Processor:  Throttled {0} at {1:d} messages".\
+                         format(origin.name,self.queue.depth[origin]))
+    
+    def release(self,origin):
+        """Resume polling a source"""
+        if origin in self.throttled:
+            handle,callback,event = self.handlers[origin]
+            
+            self.loop.add_handler(handle,callback,event)
+            self.throttled.discard(origin)
+            
+            logging.info("Processor:  Released {0} at {1:d} messages".\
+                         format(origin.name,self.queue.depth[origin]))
+    
+    def depth(self):
+        """Queue depth by scenario"""
+        depth = Counter()
+        
+        for origin,queued in self.queue.depth.iteritems():
+            scenario = self.sources.get(origin)
+            
+            if scenario is not None:
+                depth[scenario.name] += queued
+            elif origin is not None:
+                depth[origin.name] += queued
+        
+        return depth
+    
     def schedule(self,message,fpipe,tpipe):
         if tpipe is not None:
-            self.queue.put((message,fpipe,tpipe))
+            self.queue.put(message,fpipe,tpipe,self.origin)
+            
+            if self.origin is not None and \
+               self.queue.depth[self.origin] > self.high:
+                self.throttle(self.origin)
+        
+        if len(self.deferred) > 0:
+            deferred = list(self.deferred)
+            del self.deferred[:]
+            
+            for entry in deferred:
+                self.schedule(*entry)
+            
+        if self.started and not self.running:self.resume()
+    
+    def defer(self,message,fpipe,tpipe):
+        """Schedule after the result of the work being dispatched
+        
+        A routine that returns one message and defers the rest keeps them
+        in order, whether its result is run inline or scheduled.
+        """
+        self.deferred.append((message,fpipe,tpipe))
+    
+    def inject(self,message,fpipe,tpipe):
+        """Schedule from a thread other than the IOLoop"""
+        if tpipe is not None:
+            self.queue.inject(message,fpipe,tpipe)
             
+            self.loop.add_callback(self.wake)
+    
+    def wake(self):
         if self.started and not self.running:self.resume()
     
+    def enter(self,source):
+        """Put a virtual-time source on the calendar"""
+        heappush(self.calendar,
+                 [seconds(source.routine.next),next(self.ticks),source])
+        
+        self.loop.add_callback(self.wake)
+    
+    def subscribe(self,routine,address):
+        """Note a local subscriber (so its messages are waited for)"""
+        self.subscriptions[routine] = address
+    
+    def sent(self,address):
+        """Note a message published to an address (virtual time only)"""
+        if self.virtual:
+            for routine,prefix in self.subscriptions.iteritems():
+                if routine in self.handlers and address.startswith(prefix):
+                    self.inflight += 1
+    
+    def received(self):
+        """Note a published message received by a local subscriber"""
+        if self.inflight > 0:
+            self.inflight -= 1
+    
+    def advance(self):
+        """Fire the next virtual-time source (once the queue has drained)"""
+        if self.inflight > 0:
+            return False#the subscriber's handler resumes the processor
+        
+        for source in self.fired:
+            if source.active:
+                heappush(self.calendar,
+                         [seconds(source.routine.next),
+                          next(self.ticks),source])
+        else:
+            del self.fired[:]
+        
+        while len(self.calendar) > 0:
+            epoch,_,source = heappop(self.calendar)
+            
+            if not source.active:continue
+            
+            if self.horizon is not None and \
+               epoch > seconds(self.horizon):
+                logging.info("Processor:  Reached horizon {0}".\
+                             format(self.horizon))
+                
+                source.stop()
+                
+                continue
+            
+            self.fired.append(source)
+            
+            source.callback()
+            
+            return True
+        else:
+            return False
+    
     def dispatch(self):
-        message,fpipe,tpipe = self.queue.get()
+        _,_,message,fpipe,tpipe,self.origin,_ = self.queue.get()
+        
+        if self.origin in self.throttled and \
+           self.queue.depth[self.origin] <= self.low:
+            self.release(self.origin)
+        
+        if tpipe.fused is not None:
+            return tpipe.fused(message,fpipe)
         
         temp = tpipe
         message,tpipe = tpipe.routine.send((message,fpipe))
         fpipe = temp
         
         return message,fpipe,tpipe
+    
+    def collect(self):
+        _,_,message,fpipe,tpipe,origin,_ = self.queue.get()
+        
+        batch = [(message,fpipe,origin)]
+        
+        #drain consecutive messages for the same target
+        while len(batch) < self.batch and \
+              not self.queue.empty() and \
+              self.queue.peek()[4] is tpipe:
+            _,_,message,fpipe,_,origin,_ = self.queue.get()
+            
+            batch.append((message,fpipe,origin))
+        
+        self.batches[len(batch)] += 1
+        
+        for origin in self.throttled.copy():
+            if self.queue.depth[origin] <= self.low:
+                self.release(origin)
+        
+        return batch,tpipe
+    
+    def dispatch_batch(self):
+        """Results of a batch (each with its origin and deferred work)"""
+        batch,tpipe = self.collect()
+        
+        results = list()
+        
+        if tpipe.fused is None and tpipe.batch is not None:
+            outputs = tpipe.batch.send([(message,fpipe)
+                                        for message,fpipe,_ in batch])
+            
+            for (message,opipe),(_,_,origin) in zip(outputs,batch):
+                results.append((origin,(message,tpipe,opipe),list()))
+            
+            #a batch hook runs as one unit, so its deferred work follows it
+            results[-1][2].extend(self.deferred)
+            del self.deferred[:]
+        else:
+            for message,fpipe,origin in batch:
+                self.origin = origin
+                
+                if tpipe.fused is not None:
+                    result = tpipe.fused(message,fpipe)
+                else:
+                    message,opipe = tpipe.routine.send((message,fpipe))
+                    result = (message,tpipe,opipe)
+                
+                results.append((origin,result,list(self.deferred)))
+                del self.deferred[:]
+        
+        return results
+    
+    def statistics(self):
+        batches = sum(self.batches.values())
+        total = sum(size * self.batches[size] for size in self.batches)
+        
+        return dict(batches=batches,
+                    messages=total,
+                    mean=float(total) / batches if batches > 0 else 0.0,
+                    maximum=max(self.batches) if batches > 0 else 0,
+                    sizes=dict(self.batches))
+    
+    def report(self):
+        statistics = self.statistics()
+        
+        logging.info("Processor:  {0:d} messages in {1:d} batches "\
+                     "(mean {2:.2f}, max {3:d}, limit {4:d})".\
+                     format(statistics["messages"],
+                            statistics["batches"],
+                            statistics["mean"],
+                            statistics["maximum"],
+                            self.batch))
+        
+        return statistics
         
     def run(self):
         if self.running:
-            while not self.queue.empty():
-                self.schedule(*self.dispatch())
+            budget = self.messages
+            expiry = time.time() + self.timeslice
+            
+            while not self.queue.empty() or \
+                  (self.virtual and self.advance()):
+                if self.batch > 1:
+                    results = self.dispatch_batch()
+                    
+                    #each result is charged to its own origin, in order
+                    for origin,result,deferred in results:
+                        self.origin = origin
+                        self.deferred.extend(deferred)
+                        
+                        self.schedule(*result)
+                    
+                    budget -= len(results)
+                else:
+                    self.schedule(*self.dispatch())
+                    
+                    budget -= 1
+                
+                if budget <= 0 or time.time() > expiry:
+                    #let handlers and timers run before the next slice
+                    self.main = None
+                    self.loop.add_callback(self.run)
+                    
+                    break
             else:
                 self.pause()
         else:
             self.resume()
+
+class AsyncProcessor(Processor):
+    """Story:  Asynchronous processor
+    
+    IN ORDER TO keep the event loop responsive during database access
+    AS A generic segment
+    I WANT TO run blocking routines concurrently with other work
+    
+    """
+    
+    """Specification:  Asynchronous processor
+    
+    GIVEN a pool of worker threads (default 4)
+    
+    Scenario 1:  Work for a blocking routine dispatched
+    WHEN work is dispatched to a routine declared as blocking
+        AND the routine is idle
+    THEN the routine SHALL be run on a worker thread
+        AND the result SHALL be scheduled on the event loop
+        
+    Scenario 2:  Blocking routine busy
+    WHEN work is dispatched to a routine declared as blocking
+        AND the routine is running on a worker thread
+    THEN the work SHALL wait until the routine has completed
+    
+    Scenario 3:  Work for any other routine dispatched
+    WHEN work is dispatched to a routine not declared as blocking
+    THEN the routine SHALL be run on the event loop
+    
+    """
+    
+    workers = WORKER_COUNT
+    pool = None
+    
+    busy = set()#blocking routines running on a worker
+    waiting = dict()#work waiting for a busy routine
+    
+    @classmethod
+    def reset(cls):
+        Processor.reset()
+        
+        cls.pool = None
+        
+        cls.busy = set()
+        cls.waiting = dict()
+                
+    def start(self):
+        if self.pool is None:
+            self.pool = ThreadPool(self.workers)
+            
+        Processor.start(self)
+        
+    def stop(self):
+        Processor.stop(self)
+        
+        if self.pool is not None:
+            self.pool.close()
+            
+            self.pool = None
+    
+    def dispatch(self):
+        entry = self.queue.peek()
+        
+        if entry is None or not entry[4].blocking:
+            return Processor.dispatch(self)
+        
+        _,_,message,fpipe,tpipe,self.origin,_ = self.queue.get()
+        
+        if tpipe in self.busy:
+            self.waiting.setdefault(tpipe,deque()).\
+                append((message,fpipe,self.origin))
+        else:
+            self.offload(message,fpipe,tpipe,self.origin)
+        
+        return None,None,None
+    
+    def dispatch_batch(self):
+        entry = self.queue.peek()
+        
+        if entry is not None and entry[4].blocking:
+            result = self.dispatch()
+            
+            return [(self.origin,result,list())]
+        
+        return Processor.dispatch_batch(self)
+    
+    def offload(self,message,fpipe,tpipe,origin):
+        """Run a blocking routine on a worker thread"""
+        self.busy.add(tpipe)
+        
+        def work():
+            try:
+                return tpipe.routine.send((message,fpipe))
+            except Exception:
+                logging.exception("{0}:  Failed on worker".\
+                                  format(tpipe.name))
+                
+                return None,None
+        
+        def done(result):
+            message,opipe = result
+            
+            self.loop.add_callback(self.complete,
+                                   message,tpipe,opipe,origin)
+        
+        self.pool.apply_async(work,callback=done)
+    
+    def complete(self,message,fpipe,tpipe,origin):
+        """Schedule the result of a blocking routine (event loop)"""
+        self.busy.discard(fpipe)
+        
+        self.origin = origin
+        self.schedule(message,fpipe,tpipe)
+        
+        if len(self.waiting.get(fpipe,())) > 0:
+            message,ipipe,origin = self.waiting[fpipe].popleft()
+            
+            self.offload(message,ipipe,fpipe,origin)
@@ -0,0 +1,186 @@
+#!/usr/bin/env python2.7
+
+"""Processor benchmark
+
+Author(s):  Sean Henely
+Language:   Python 2.x
+Modified:   18 October 2026
+
+Measures scheduler hops per second for the processor run queue.
+
+Classes:
+HopRoutine    -- Routine that forwards a message a fixed number of hops
+HopMessage    -- Dated message that counts down its hops
+FifoProcessor -- Processor dispatch from before the run queue
+
+Functions:
+before -- Hops per second with the previous FIFO processor
+after  -- Hops per second with the processor run queue
+"""
+
+"""Change log:
+
+Date          Author          Version     Description
+----------    ------------    --------    -----------------------------
+2026-10-18                    1.0         Initial revision
+2026-10-18                    1.1         Compared with the FIFO processor
+
+"""
+
+
+##################
+# Import section #
+#
+#Built-in libraries
+from Queue import Queue
+from datetime import datetime,timedelta
+import logging
+import time
+
+#External libraries
+
+#Internal libraries
+from . import agenda
+from .routine import BaseRoutine
+#
+##################
+
+
+##################
+# Export section #
+#
+__all__ = ["before",
+           "after"]
+#
+##################
+
+
+####################
+# Constant section #
+#
+__version__ = "1.1"#current version [major.minor]
+
+ROUTINE_COUNT = 10#routines in the ring
+MESSAGE_COUNT = 100#messages in flight
+HOP_COUNT = 1000#hops per message
+TRIAL_COUNT = 5#trials per case (best is reported)
+#
+####################
+
+
+class HopRoutine(BaseRoutine):
+    name = "Benchmark.Hop"
+    
+    def _process(self,message,ipipe):
+        message -= 1
+        
+        return message,self.target if message > 0 else None
+
+class HopMessage(object):
+    """Dated message (ordered by epoch in the run queue)"""
+    
+    __slots__ = ["epoch","hops"]
+    
+    def __init__(self,epoch,hops):
+        self.epoch = epoch
+        self.hops = hops
+    
+    def __sub__(self,other):
+        return HopMessage(self.epoch + timedelta(seconds=other),
+                          self.hops - other)
+    
+    def __gt__(self,other):
+        return self.hops > other
+
+class FifoProcessor(object):
+    """Processor dispatch from before the run queue (locked FIFO queue)"""
+    
+    started = False
+    running = False
+    
+    def __init__(self):
+        object.__init__(self)
+        
+        self.queue = Queue()
+    
+    def resume(self):
+        pass
+    
+    def schedule(self,message,fpipe,tpipe):
+        if tpipe is not None:
+            self.queue.put((message,fpipe,tpipe))
+            
+        if self.started and not self.running:self.resume()
+    
+    def dispatch(self):
+        message,fpipe,tpipe = self.queue.get()
+        
+        temp = tpipe
+        message,tpipe = tpipe.routine.send((message,fpipe))
+        fpipe = temp
+        
+        return message,fpipe,tpipe
+
+def ring(count=ROUTINE_COUNT):
+    routines = [HopRoutine() for i in range(count)]
+    
+    for source,target in zip(routines,routines[1:] + routines[:1]):
+        target.set_source(source)
+        source.set_target(target)
+    
+    return routines
+
+def hop(hops,dated):
+    return HopMessage(datetime(2000,1,1),hops) if dated else hops
+
+def before(routines=ROUTINE_COUNT,messages=MESSAGE_COUNT,hops=HOP_COUNT,
+           dated=False):
+    """Hops per second with the previous FIFO processor"""
+    processor = FifoProcessor()
+    head = ring(routines)[0]
+    
+    for i in range(messages):
+        processor.queue.put((hop(hops,dated),None,head))
+    
+    start = time.time()
+    while not processor.queue.empty():
+        processor.schedule(*processor.dispatch())
+    
+    return messages * hops / (time.time() - start)
+
+def after(routines=ROUTINE_COUNT,messages=MESSAGE_COUNT,hops=HOP_COUNT,
+          dated=False):
+    """Hops per second with the processor run queue"""
+    processor = agenda.Processor()
+    head = ring(routines)[0]
+    
+    for i in range(messages):
+        processor.queue.put(hop(hops,dated),None,head)
+    
+    start = time.time()
+    while not processor.queue.empty():
+        processor.schedule(*processor.dispatch())
+    
+    return messages * hops / (time.time() - start)
+
+def best(function,trials=TRIAL_COUNT,**kwargs):
+    """Best rate of several trials (the machine is rarely quiet)"""
+    return max(function(**kwargs) for i in range(trials))
+
+def main():
+    """Main Function"""
+    
+    logging.basicConfig(level=logging.INFO)
+    
+    for dated in (False,True):
+        rate_before = best(before,dated=dated)
+        rate_after = best(after,dated=dated)
+        
+        label = "dated" if dated else "undated"
+        
+        logging.info("Benchmark:  Before {0:,.0f} hops/s ({1})".\
+                     format(rate_before,label))
+        logging.info("Benchmark:  After  {0:,.0f} hops/s ({1}, {2:+.0%})".\
+                     format(rate_after,label,rate_after / rate_before - 1))
+
+if __name__ == '__main__':main()
@@ -1,17 +1,25 @@
+from copy import deepcopy
+import logging
 import types
-import pickle
+import zlib
 
+from zmq.eventloop import ioloop
 import zmq
 import pymongo
 
 from . import BaseObject
 from . import agenda
+from . import fusion
+from . import optimizer
+from . import persist
 from .routine import *
 
 __all__ = ["Application",
            "Behavior",
            "Scenario"]
 
+WATCH_PERIOD = 5000#time between polls of the stories collection [ms]
+
 class Application(object):
     self = dict()
     
@@ -37,17 +45,107 @@ class Application(object):
             self.database = self.connection[self.name]
             self.processor = agenda.Processor()
             
+            self.shard = 0
+            self.shards = 1
+            
+            self.metrics = None#routine metrics (see metrics.Metrics)
+            
+            self.versions = dict()#story version by identifier
+            self.watcher = None
+            
             self.stories = self.database.stories.find()
     
+    def owns(self,key):
+        """Key is assigned to this shard (see shard.ShardPool)"""
+        return self.shards == 1 or \
+               (zlib.crc32(str(key)) & 0xffffffff) % self.shards == self.shard
+    
+    def partitioned(self,behavior):
+        """Behavior is a story built by this shard alone (see owns)"""
+        return behavior in self.versions
+    
     def build(self):
         for story in self.stories:
-            self.behaviors.append(Behavior(**story))
+            if self.owns(story["_id"]):
+                self.versions[story["_id"]] = story.get("version")
+                self.behaviors.append(Behavior(**story))
+        
+        #resolve every routine class up front (one round-trip)
+        persist.resolve(self.database,
+                        [node["_id"] for behavior in self.behaviors
+                         for node in behavior.nodes])
     
         for behavior in self.behaviors:
             behavior.build(self)
             
     def start(self):
+        optimizer.optimize(self)
+        fusion.fuse(self)
+        
+        if self.metrics is not None:
+            self.metrics.enable()
+        
         self.processor.start()
+    
+    def watch(self,period=WATCH_PERIOD):
+        """Poll the stories collection for changes"""
+        if self.watcher is None:
+            self.watcher = ioloop.PeriodicCallback(self.reload,
+                                                   period,
+                                                   self.processor.loop)
+            self.watcher.start()
+    
+    def reload(self):
+        """Rebuild only the behaviors whose stories have changed"""
+        versions = dict([(story["_id"],story.get("version"))
+                         for story in self.database.stories.find({},
+                                                                 ["version"])
+                         if self.owns(story["_id"])])
+        behaviors = dict([(behavior._id,behavior)
+                          for behavior in self.behaviors])
+        
+        added = [_id for _id in versions if _id not in behaviors]
+        removed = [_id for _id in behaviors if _id not in versions]
+        changed = [_id for _id in versions if _id in behaviors and \
+                   versions[_id] != self.versions.get(_id)]
+        
+        if len(added) + len(removed) + len(changed) == 0:return
+        
+        stories = dict([(story["_id"],story)
+                        for story in self.database.stories.find(
+                            {"_id":{"$in":added + changed}})])
+        
+        persist.resolve(self.database,
+                        [node["_id"] for story in stories.values()
+                         for node in story.get("nodes",[])])
+        
+        for _id in removed:
+            behaviors[_id].teardown()
+            
+            self.behaviors.remove(behaviors[_id])
+            del self.versions[_id]
+        
+        for _id in changed:
+            behaviors[_id].rebuild(stories[_id])
+            
+            self.versions[_id] = versions[_id]
+        
+        for _id in added:
+            behavior = Behavior(**stories[_id])
+            behavior.build(self)
+            
+            self.behaviors.append(behavior)
+            self.versions[_id] = versions[_id]
+        
+        optimizer.optimize(self)
+        fusion.fuse(self)
+        
+        if self.metrics is not None and self.metrics.enabled:
+            self.metrics.discover()
+        
+        logging.info("Engine:  Reloaded {0:d} added, {1:d} changed, "\
+                     "{2:d} removed".\
+                     format(len(added),len(changed),len(removed)))
 
 class Behavior(BaseObject):
     def __init__(self,name,nodes=[],links=[],rules=[],*args,**kwargs):
@@ -70,16 +168,14 @@ class Behavior(BaseObject):
         
     def build(self,application):
         self.application = application
+        self.graph = deepcopy((self.nodes,self.links))#as built
+        
+        classes = persist.resolve(self.application.database,
+                                  [node["_id"] for node in self.nodes])
         
         for node in self.nodes:
             node = BaseObject(**node)
-            
-            query = {"_id":node._id}
-            node.routine = pickle.loads(BaseObject(**self.application \
-                                                         .connection \
-                                                         .database \
-                                                         .Objects.find_one(query))\
-                                                  .path)
+            node.routine = classes[node._id]
             
             self.routines.append(node)
         
@@ -104,16 +200,69 @@ class Behavior(BaseObject):
     
         for scenario in self.scenarios:
             scenario.build(self)
+    
+    def rebuild(self,story):
+        """Rewire only the scenarios that changed in a story"""
+        behavior = Behavior(**story)
+        
+        self.name = behavior.name
+        
+        if (behavior.nodes,behavior.links) != self.graph:
+            #routines changed, so every scenario is rewired
+            self.teardown()
+            
+            del self.routines[:]
+            del self.scenarios[:]
+            
+            self.nodes = behavior.nodes
+            self.links = behavior.links
+            self.rules = behavior.rules
+            
+            self.build(self.application)
+        else:
+            unchanged = zip(self.rules,self.scenarios)
+            scenarios = list()
+            
+            for rule in behavior.rules:
+                for pair in unchanged:
+                    if pair[0] == rule:
+                        unchanged.remove(pair)
+                        scenarios.append(pair[1])
+                        
+                        break
+                else:
+                    scenarios.append(Scenario(**rule))
+            
+            for rule,scenario in unchanged:
+                scenario.teardown()
+            
+            self.rules = behavior.rules
+            self.scenarios = scenarios
+            
+            for scenario in self.scenarios:
+                if scenario.behavior is None:
+                    scenario.build(self)
+    
+    def teardown(self):
+        for scenario in self.scenarios:
+            scenario.teardown()
 
 class Scenario(BaseObject):
-    def __init__(self,name,*args,**kwargs):
+    def __init__(self,name,priority=None,*args,**kwargs):
         self.behavior = None
         
         self.context = self
+        self.routines = []
+        self.clauses = []
+        
+        self.priority = priority
         
         BaseObject.__init__(self,*args,**kwargs)
         
         assert isinstance(name,types.StringTypes)
+        assert priority in (agenda.CRITICAL,
+                            agenda.NORMAL,
+                            agenda.BULK) or priority is None
         assert isinstance(getattr(kwargs,"from",[]),types.ListType)
         assert isinstance(getattr(kwargs,"when",[]),types.ListType)
         assert isinstance(getattr(kwargs,"given",{}),types.DictType)
@@ -146,23 +295,83 @@ class Scenario(BaseObject):
         for index in self["to"]:
             self.To(**self.behavior.routines[index])
     
+    def teardown(self):
+        """Unlink the routines and stop the sources of this scenario
+        
+        A source that another scenario still uses is handed over to that
+        scenario instead of being stopped, and a link between routines that
+        another scenario still uses is kept.
+        """
+        processor = self.behavior.application.processor
+        
+        for clause in reversed(self.clauses):
+            if clause.source is not None and \
+               not self.shared(clause.source,clause.routine):
+                clause.source.unset_target(clause.routine)
+                clause.routine.unset_source(clause.source)
+        
+        for routine in self.routines:
+            if processor.sources.get(routine) is self:
+                user = self.user(routine)
+                
+                if user is None:
+                    processor.remove(routine)
+                else:
+                    processor.sources[routine] = user
+            
+            routine.fused = None
+        
+        del self.clauses[:]
+        del self.routines[:]
+        
+        self.context = self
+    
+    def user(self,routine):
+        """Another scenario of the application using a routine (or None)"""
+        for behavior in self.behavior.application.behaviors:
+            for scenario in behavior.scenarios:
+                if scenario is not self and routine in scenario.routines:
+                    return scenario
+    
+    def shared(self,source,routine):
+        """Another scenario of the application uses both routines"""
+        for behavior in self.behavior.application.behaviors:
+            for scenario in behavior.scenarios:
+                if scenario is not self and \
+                   source in scenario.routines and \
+                   routine in scenario.routines:
+                    return True
+        
+        return False
+    
+    def include(self,routine):
+        self.routines.append(routine)
+        self.clauses.append(self.context)#the clause just added
+        
+        if self.priority is not None:
+            routine.priority = self.priority
+        
+        if routine.behavior is None:
+            routine.behavior = self.behavior._id
+    
     def From(self,description,routine):
         assert isinstance(self.context,Scenario)
         
         self.context = FromClause(description,routine)
+        self.include(routine)
 
         if routine.type is agenda.PERIODIC:
             self.behavior \
                 .application \
-                .processor.periodic(routine,routine.timeout).start()
+                .processor.periodic(routine,routine.timeout,self).start()
         elif routine.type is agenda.DELAYED:
             self.behavior \
                 .application \
-                .processor.delayed(routine,routine.timeout).start()
+                .processor.delayed(routine,routine.timeout,self).start()
         elif routine.type is agenda.HANDLER:
             self.behavior \
                 .application \
-                .processor.handler(routine,routine.handle,routine.event)
+                .processor.handler(routine,routine.handle,routine.event,self)
         
         return self
     
@@ -171,6 +380,7 @@ class Scenario(BaseObject):
                                         WhenClause))
         
         self.context = WhenClause(description,routine,self.context)
+        self.include(routine)
         
         return self
     
@@ -181,6 +391,7 @@ class Scenario(BaseObject):
                                         GivenClause))
         
         self.context = GivenClause(description,routine,self.context)
+        self.include(routine)
         
         return self
     
@@ -192,6 +403,7 @@ class Scenario(BaseObject):
                                         ThenClause))
         
         self.context = ThenClause(description,routine,self.context)
+        self.include(routine)
         
         return self
     
@@ -203,6 +415,7 @@ class Scenario(BaseObject):
                                         ToClause))
         
         self.context = ToClause(description,routine,self.context)
+        self.include(routine)
         
         return self
     
@@ -220,6 +433,8 @@ class Scenario(BaseObject):
         else:
             raise Exception
         
+        self.include(routine)
+        
         return self
     
     def Is(self,mode):
@@ -236,8 +451,11 @@ class BaseClause(object):
         
         self.description = description
         self.routine = routine
+        self.source = None
         
         if isinstance(context,BaseClause):
+            self.source = context.routine
+            
             self.routine.set_source(context.routine)
             context.routine.set_target(self.routine)
 
@@ -0,0 +1,164 @@
+#!/usr/bin/env python2.7
+
+"""Pipeline fusion
+
+Author(s):  Sean Henely
+Language:   Python 2.x
+Modified:   18 October 2026
+
+Provides a build-time pass that fuses straight-line pipelines.
+
+Functions:
+fuse      -- Fuse the scenarios of an application
+linear    -- Routine is a straight-line step
+successor -- Downstream routine run inline after a routine
+chain     -- Straight-line run starting at a routine
+"""
+
+"""Change log:
+
+Date          Author          Version     Description
+----------    ------------    --------    -----------------------------
+2026-10-18                    1.0         Initial revision
+2026-10-18                    1.1         Split first edge is inline
+
+"""
+
+
+##################
+# Import section #
+#
+#Built-in libraries
+import logging
+
+#External libraries
+
+#Internal libraries
+from .routine import *
+from .routine.control import SplitControl
+#
+##################
+
+
+##################
+# Export section #
+#
+__all__ = ["fuse",
+           "linear",
+           "successor",
+           "chain"]
+#
+##################
+
+
+####################
+# Constant section #
+#
+__version__ = "1.1"#current version [major.minor]
+#
+####################
+
+
+"""Story:  Pipeline fusion
+
+IN ORDER TO reduce the number of scheduler hops
+AS A generic segment
+I WANT TO run straight-line pipelines to completion inline
+
+"""
+
+"""Specification:  Pipeline fusion
+
+GIVEN an application with scenarios defined
+
+Scenario 1:  Straight-line step
+WHEN a routine IS an event, action or target routine
+    AND the routine IS NOT a branch point (condition, split or merge)
+    AND the routine IS NOT blocking
+    AND the downstream routine IS a straight-line step
+THEN both routines SHALL be part of the same fused pipeline
+    AND the fused pipeline SHALL run inline until a branch point is
+        reached or the pipeline ends
+    AND only the branch point SHALL be scheduled on the processor
+
+Scenario 2:  Split
+WHEN a routine IS a split
+    AND the first downstream routine IS a straight-line step
+THEN the split and its first downstream routine SHALL be part of the
+    same fused pipeline
+    AND the other downstream routines SHALL be scheduled by the split
+
+"""
+
+def linear(routine):
+    """Routine is a straight-line step (single target, no branching)"""
+    if isinstance(routine,SplitControl):return True#first edge is inline
+    
+    return isinstance(routine,(EventRoutine,
+                               ActionRoutine,
+                               TargetRoutine)) and \
+           not isinstance(routine,(SourceRoutine,
+                                   ConditionRoutine)) and \
+           not routine.blocking#blocking routines may leave the event loop
+
+def successor(routine):
+    """Downstream routine run inline after a routine"""
+    if isinstance(routine,SplitControl):
+        return routine.target[0] if len(routine.target) > 0 else None
+    
+    return routine.target
+
+def chain(routine):
+    """Straight-line run of routines starting at a routine"""
+    routines = [routine]
+    
+    while linear(successor(routines[-1])) and \
+          successor(routines[-1]) not in routines:#guard against cycles
+        routines.append(successor(routines[-1]))
+    
+    return routines
+
+def compose(routines):
+    """Fused callable for a straight-line run of routines"""
+    steps = zip(routines,routines[1:] + [None])
+    
+    def fused(message,ipipe):
+        for routine,successor in steps:
+            message,opipe = routine.routine.send((message,ipipe))
+            ipipe = routine
+            
+            if opipe is not successor:break#branch point or end of run
+        
+        return message,ipipe,opipe
+    
+    fused.__name__ = "+".join([routine.name for routine in routines])
+    
+    return fused
+
+def fuse(application):
+    """Fuse the scenarios of an application"""
+    routines = set()
+    
+    for behavior in application.behaviors:
+        for scenario in behavior.scenarios:
+            routines.update(scenario.routines)
+    
+    count = 0
+    for routine in routines:
+        routine.fused = None
+        
+        if linear(routine):
+            steps = chain(routine)
+            
+            if len(steps) > 1:
+                routine.fused = compose(steps)
+                
+                count += 1
+                
+                logging.debug("Fusion:  {0:d}-step pipeline {1}".\
+                              format(len(steps),routine.fused.__name__))
+    
+    logging.info("Fusion:  {0:d} pipelines fused".\
+                 format(count))
+    
+    return count
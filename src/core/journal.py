@@ -0,0 +1,171 @@
+#!/usr/bin/env python2.7
+
+"""Routine journal
+
+Author(s):  Sean Henely
+Language:   Python 2.x
+Modified:   18 October 2026
+
+Provides lazily formatted logging for routines.
+
+Classes:
+Journal -- Logging for a named routine
+"""
+
+"""Change log:
+
+Date          Author          Version     Description
+----------    ------------    --------    -----------------------------
+2026-10-18                    1.0         Initial revision
+2026-10-18                    1.1         Warnings sampled in production
+
+"""
+
+
+##################
+# Import section #
+#
+#Built-in libraries
+import logging
+import types
+
+#External libraries
+
+#Internal libraries
+from . import encoder
+#
+##################
+
+
+##################
+# Export section #
+#
+__all__ = ["Journal",
+           "DEVELOPMENT",
+           "PRODUCTION"]
+#
+##################
+
+
+####################
+# Constant section #
+#
+__version__ = "1.1"#current version [major.minor]
+
+DEVELOPMENT = 0#every enabled record is formatted and logged
+PRODUCTION  = 1#per-message records are sampled as structured events
+
+SAMPLE_RATE = 1000#per-message records between sampled events
+#
+####################
+
+
+class Journal(object):
+    """Story:  Routine journal
+    
+    IN ORDER TO keep string formatting off the hot path
+    AS A generic segment
+    I WANT TO only format log records that will be emitted
+    
+    """
+    
+    """Specification:  Routine journal
+    
+    GIVEN a routine name
+        AND a format string (with the name as the first field)
+        AND the arguments of the format string
+    
+    Scenario 1:  Level disabled
+    WHEN a record is logged at a disabled level
+    THEN the record SHALL NOT be formatted
+    
+    Scenario 2:  Level enabled
+    WHEN a record is logged at an enabled level
+        AND the journal is in development mode
+    THEN the record SHALL be formatted and logged
+    
+    Scenario 3:  Per-message record in production
+    WHEN an info record is logged
+        AND the journal is in production mode
+    THEN the record SHALL be counted
+        AND the first record, and one record in every sample, SHALL be
+            logged as a structured event with the count
+    
+    Scenario 4:  Debug record in production
+    WHEN a debug record is logged
+        AND the journal is in production mode
+    THEN the record SHALL be dropped
+    
+    Scenario 5:  Warning in production
+    WHEN a warning record is logged
+        AND the journal is in production mode
+    THEN the record SHALL be counted
+        AND the first record, and one record in every sample, SHALL be
+            logged as a structured event with the count
+    
+    Scenario 6:  Error in production
+    WHEN an error record is logged
+        AND the journal is in production mode
+    THEN the record SHALL be formatted and logged
+    
+    """
+    
+    self = dict()
+    
+    mode = DEVELOPMENT
+    rate = SAMPLE_RATE
+    
+    def __new__(cls,name):
+        if name not in cls.self:
+            cls.self[name] = object.__new__(cls)
+        
+        return cls.self[name]
+    
+    def __init__(self,name):
+        assert isinstance(name,types.StringTypes)
+        
+        object.__init__(self)
+        
+        if not hasattr(self,"name"):
+            self.name = name
+            
+            self.logger = logging.getLogger()
+            self.counts = dict()#records by format string
+    
+    def log(self,level,format,args):
+        if self.logger.isEnabledFor(level):
+            self.logger.log(level,format.format(self.name,*args))
+    
+    def sample(self,level,format,args):
+        count = self.counts.get(format,0) + 1
+        self.counts[format] = count
+        
+        if (count - 1) % self.rate == 0 and self.logger.isEnabledFor(level):
+            event = { "name": self.name,
+                      "event": format.split(":  ",1)[-1],
+                      "count": count,
+                      "args": [str(arg) for arg in args] }
+            
+            self.logger.log(level,encoder(event))
+    
+    def debug(self,format,*args):
+        if self.mode != PRODUCTION:
+            self.log(logging.DEBUG,format,args)
+    
+    def info(self,format,*args):
+        if self.mode == PRODUCTION:
+            self.sample(logging.INFO,format,args)
+        else:
+            self.log(logging.INFO,format,args)
+    
+    def warn(self,format,*args):
+        #per-message warnings (e.g. unsatisfied conditions) are sampled too
+        if self.mode == PRODUCTION:
+            self.sample(logging.WARNING,format,args)
+        else:
+            self.log(logging.WARNING,format,args)
+    
+    warning = warn
+    
+    def error(self,format,*args):
+        self.log(logging.ERROR,format,args)
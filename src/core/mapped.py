@@ -0,0 +1,242 @@
+#!/usr/bin/env python2.7
+
+"""Mapped queue
+
+Author(s):  Sean Henely
+Language:   Python 2.x
+Modified:   18 October 2026
+
+Provides a queue that survives a restart of the segment.
+
+Classes:
+MappedQueue -- Queue in a memory-mapped ring buffer file
+"""
+
+"""Change log:
+
+Date          Author          Version     Description
+----------    ------------    --------    -----------------------------
+2026-10-18                    1.0         Initial revision
+2026-10-18                    1.1         Corrupt records skipped
+2026-10-18                    1.2         Oversized messages rejected with ValueError
+
+"""
+
+
+##################
+# Import section #
+#
+#Built-in libraries
+from Queue import Queue
+import cPickle as pickle
+import logging
+import mmap
+import os
+import struct
+import types
+import zlib
+
+#External libraries
+
+#Internal libraries
+#
+##################
+
+
+##################
+# Export section #
+#
+__all__ = ["MappedQueue"]
+#
+##################
+
+
+####################
+# Constant section #
+#
+__version__ = "1.2"#current version [major.minor]
+
+MAGIC = "PGSQ"
+
+HEADER_FORMAT = "<4sIIQQ"#magic, record size, capacity, head, tail
+HEADER_SIZE = 64#header is padded to keep records aligned
+POINTER_OFFSET = struct.calcsize("<4sII")
+
+RECORD_FORMAT = "<Ii"#payload length, payload checksum
+RECORD_OFFSET = struct.calcsize(RECORD_FORMAT)
+
+RECORD_SIZE = 4096#bytes per record (including record header)
+RING_CAPACITY = 1024#records in the ring
+#
+####################
+
+
+class MappedQueue(Queue):
+    """Story:  Mapped queue
+    
+    IN ORDER TO resume without a warm-up period after a restart
+    AS A generic segment
+    I WANT TO keep queued messages in a memory-mapped file
+    
+    """
+    
+    """Specification:  Mapped queue
+    
+    GIVEN a file path
+        AND a capacity (default 1024 records)
+        AND a record size (default 4096 bytes)
+    
+    Scenario 1:  Message put
+    WHEN a message is put to the queue
+    THEN the message SHALL be written to the record at the tail
+        AND the tail SHALL only be advanced once the record is written
+    
+    Scenario 2:  Message got
+    WHEN a message is got from the queue
+    THEN the message SHALL be read from the record at the head
+        AND the head SHALL be advanced
+    
+    Scenario 3:  Queue reopened
+    WHEN the file already exists
+    THEN the messages between the head and the tail SHALL be recovered
+        AND the tail SHALL be moved back to the first torn record (if any)
+    
+    Scenario 4:  Corrupt record
+    WHEN a message is got from the queue
+        AND the record at the head fails its checksum
+    THEN the record SHALL be skipped (and logged)
+        AND the next intact record SHALL be read instead (if any)
+    
+    Scenario 5:  Queue full
+    WHEN the number of records equals the capacity
+    THEN the queue SHALL be full
+    
+    Scenario 6:  Message too large
+    WHEN a message is put to the queue
+        AND the pickled message does not fit in a record
+    THEN a ValueError SHALL be raised
+        AND the queue SHALL be left unchanged
+    
+    """
+    
+    def __init__(self,path,capacity=RING_CAPACITY,record=RECORD_SIZE):
+        assert isinstance(path,types.StringTypes)
+        assert isinstance(capacity,types.IntType)
+        assert capacity > 0
+        assert isinstance(record,types.IntType)
+        assert record > RECORD_OFFSET
+        
+        self.path = path
+        self.capacity = capacity
+        self.record = record
+        
+        Queue.__init__(self,capacity)
+    
+    def _init(self,maxsize):
+        size = HEADER_SIZE + self.capacity * self.record
+        
+        self.file = os.open(self.path,os.O_RDWR | os.O_CREAT,0644)
+        
+        created = os.fstat(self.file).st_size == 0
+        if created:
+            os.ftruncate(self.file,size)
+        
+        self.map = mmap.mmap(self.file,size)
+        
+        if created:
+            self.head = self.tail = 0
+            
+            struct.pack_into(HEADER_FORMAT,self.map,0,
+                             MAGIC,self.record,self.capacity,0,0)
+        else:
+            self._recover()
+    
+    def _recover(self):
+        magic,record,capacity,self.head,self.tail = \
+            struct.unpack_from(HEADER_FORMAT,self.map,0)
+        
+        assert magic == MAGIC
+        assert record == self.record
+        assert capacity == self.capacity
+        
+        for index in xrange(self.head,self.tail):
+            if self._read(index) is None:
+                logging.warn("Mapped:  Torn record in {0} at {1:d}".\
+                             format(self.path,index))
+                
+                self.tail = index
+                self._commit()
+                
+                break
+        
+        logging.info("Mapped:  Recovered {0:d} records from {1}".\
+                     format(self.tail - self.head,self.path))
+    
+    def _offset(self,index):
+        return HEADER_SIZE + (index % self.capacity) * self.record
+    
+    def _read(self,index):
+        """Payload of a record (None if torn)"""
+        offset = self._offset(index)
+        
+        length,checksum = struct.unpack_from(RECORD_FORMAT,self.map,offset)
+        if length > self.record - RECORD_OFFSET:return None
+        
+        payload = self.map[offset + RECORD_OFFSET:
+                           offset + RECORD_OFFSET + length]
+        
+        return payload if zlib.crc32(payload) == checksum else None
+    
+    def _commit(self):
+        struct.pack_into("<QQ",self.map,POINTER_OFFSET,self.head,self.tail)
+    
+    def _qsize(self,len=len):
+        return self.tail - self.head
+    
+    def _put(self,item):
+        payload = pickle.dumps(item,pickle.HIGHEST_PROTOCOL)
+        
+        if len(payload) > self.record - RECORD_OFFSET:
+            raise ValueError("Message of {0:d} bytes does not fit in a "\
+                             "{1:d}-byte record of {2}".\
+                             format(len(payload),self.record,self.path))
+        
+        offset = self._offset(self.tail)
+        
+        self.map[offset + RECORD_OFFSET:
+                 offset + RECORD_OFFSET + len(payload)] = payload
+        struct.pack_into(RECORD_FORMAT,self.map,offset,
+                         len(payload),zlib.crc32(payload))
+        
+        self.tail += 1
+        self._commit()#record is complete before the tail moves past it
+    
+    def _get(self):
+        item = None#every remaining record was corrupt
+        
+        while self.head < self.tail:
+            payload = self._read(self.head)
+            
+            self.head += 1
+            
+            if payload is not None:
+                item = pickle.loads(payload)
+                
+                break
+            else:
+                logging.error("Mapped:  Corrupt record in {0} at {1:d}".\
+                              format(self.path,self.head - 1))
+        
+        self._commit()
+        
+        return item
+    
+    def flush(self):
+        """Write the ring through to disk"""
+        self.map.flush()
+    
+    def close(self):
+        self.map.flush()
+        self.map.close()
+        
+        os.close(self.file)
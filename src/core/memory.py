@@ -0,0 +1,337 @@
+#!/usr/bin/env python2.7
+
+"""Memory channel
+
+Author(s):  Sean Henely
+Language:   Python 2.x
+Modified:   18 October 2026
+
+Provides a shared-memory channel between segments on the same host.
+
+Classes:
+MemoryChannel -- Broadcast ring buffer in shared memory
+
+Functions:
+alive -- Process of a wakeup is still running
+"""
+
+"""Change log:
+
+Date          Author          Version     Description
+----------    ------------    --------    -----------------------------
+2026-10-18                    1.0         Initial revision
+2026-10-18                    1.1         Private wakeups removed at exit
+2026-10-18                    1.2         Oversized messages rejected with ValueError
+
+"""
+
+
+##################
+# Import section #
+#
+#Built-in libraries
+import atexit
+import errno
+import fcntl
+import glob
+import itertools
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import time
+import types
+
+#External libraries
+
+#Internal libraries
+#
+##################
+
+
+##################
+# Export section #
+#
+__all__ = ["MemoryChannel"]
+#
+##################
+
+
+####################
+# Constant section #
+#
+__version__ = "1.2"#current version [major.minor]
+
+SHARED_DIRECTORY = "/dev/shm" if os.path.isdir("/dev/shm") \
+                   else tempfile.gettempdir()
+CHANNEL_PATH = "pygs.{0!s}.ring"
+WAKEUP_PATH = "{0!s}.{1:d}.{2:d}.fifo"#channel, process, subscriber
+
+MAGIC = "PGSM"
+
+HEADER_FORMAT = "<4sIIQ"#magic, record size, capacity, sequence
+HEADER_SIZE = 64#header is padded to keep records aligned
+SEQUENCE_OFFSET = struct.calcsize("<4sII")
+
+RECORD_FORMAT = "<QII"#sequence, address length, message length
+RECORD_OFFSET = struct.calcsize(RECORD_FORMAT)
+RECORD_WRITING = 2 ** 64 - 1#sequence of a record being written
+
+RECORD_SIZE = 4096#bytes per record (including record header)
+CHANNEL_CAPACITY = 4096#records in the ring
+
+RESCAN_PERIOD = 1.0#seconds between scans for new subscribers
+
+SHARED_MODE = 0600#ring and wakeups are private to the segment user
+#
+####################
+
+
+def alive(path):
+    """Process of a wakeup path is still running"""
+    pid = int(path.rsplit(".",3)[-3])
+    
+    try:
+        os.kill(pid,0)
+    except OSError as error:
+        return error.errno != errno.ESRCH
+    else:
+        return True
+
+class MemoryChannel(object):
+    """Story:  Memory channel
+    
+    IN ORDER TO exchange messages without a round trip through the broker
+    AS A generic segment
+    I WANT TO publish and subscribe through shared memory on the same host
+    
+    """
+    
+    """Specification:  Memory channel
+    
+    GIVEN a channel name
+        AND a capacity (default 4096 records)
+        AND a record size (default 4096 bytes)
+    
+    Scenario 1:  Message published
+    WHEN a message is published to an address
+    THEN the message SHALL be written to the next record of the ring
+        AND the sequence SHALL only be advanced once the record is written
+        AND every subscriber SHALL be woken
+    
+    Scenario 2:  Messages read
+    WHEN a subscriber reads from its cursor
+    THEN every record between the cursor and the sequence SHALL be
+        returned (in order of sequence)
+    
+    Scenario 3:  Subscriber lapped
+    WHEN a subscriber falls more than the capacity behind the sequence
+    THEN the overwritten records SHALL be counted as lost
+        AND the cursor SHALL skip to the oldest record still in the ring
+    
+    Scenario 4:  Subscriber gone
+    WHEN a subscriber detaches or its process exits
+    THEN its wakeup SHALL be removed
+    
+    Scenario 5:  Message too large
+    WHEN a message is published
+        AND its envelope and content do not fit in a record
+    THEN a ValueError SHALL be raised
+        AND the ring SHALL be left unchanged
+    
+    """
+    
+    self = dict()
+    
+    def __new__(cls,name,*args,**kwargs):
+        if name not in cls.self:
+            cls.self[name] = object.__new__(cls)
+        
+        return cls.self[name]
+    
+    def __init__(self,name,capacity=CHANNEL_CAPACITY,record=RECORD_SIZE):
+        assert isinstance(name,types.StringTypes)
+        assert isinstance(capacity,types.IntType)
+        assert capacity > 0
+        assert isinstance(record,types.IntType)
+        assert record > RECORD_OFFSET
+        
+        if hasattr(self,"name"):return#one mapping per process
+        
+        object.__init__(self)
+        
+        self.name = name
+        self.capacity = capacity
+        self.record = record
+        
+        self.path = os.path.join(SHARED_DIRECTORY,CHANNEL_PATH.format(name))
+        
+        size = HEADER_SIZE + capacity * record
+        
+        self.file = os.open(self.path,
+                            os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW,
+                            SHARED_MODE)
+        
+        fcntl.flock(self.file,fcntl.LOCK_EX)
+        try:
+            if os.fstat(self.file).st_size == 0:
+                os.ftruncate(self.file,size)
+                
+                self.map = mmap.mmap(self.file,size)
+                
+                struct.pack_into(HEADER_FORMAT,self.map,0,
+                                 MAGIC,record,capacity,0)
+            else:
+                self.map = mmap.mmap(self.file,size)
+                
+                magic,record,capacity,_ = \
+                    struct.unpack_from(HEADER_FORMAT,self.map,0)
+                
+                assert magic == MAGIC
+                assert record == self.record
+                assert capacity == self.capacity
+        finally:
+            fcntl.flock(self.file,fcntl.LOCK_UN)
+        
+        self.subscribers = itertools.count()
+        self.attached = dict()#wakeup paths by descriptor (this process)
+        self.wakeups = dict()#wakeup descriptors by path
+        self.scanned = 0.0
+        
+        atexit.register(self.close)
+    
+    @property
+    def sequence(self):
+        return struct.unpack_from("<Q",self.map,SEQUENCE_OFFSET)[0]
+    
+    def _offset(self,sequence):
+        return HEADER_SIZE + (sequence % self.capacity) * self.record
+    
+    def publish(self,address,message):
+        if len(address) + len(message) > self.record - RECORD_OFFSET:
+            raise ValueError("Message of {0:d} bytes does not fit in a "\
+                             "{1:d}-byte record of {2}".\
+                             format(len(address) + len(message),
+                                    self.record,self.name))
+        
+        fcntl.flock(self.file,fcntl.LOCK_EX)#publishers in other processes
+        try:
+            sequence = self.sequence
+            offset = self._offset(sequence)
+            
+            struct.pack_into("<Q",self.map,offset,RECORD_WRITING)
+            
+            start = offset + RECORD_OFFSET
+            self.map[start:start + len(address)] = address
+            start += len(address)
+            self.map[start:start + len(message)] = message
+            
+            struct.pack_into(RECORD_FORMAT,self.map,offset,
+                             sequence,len(address),len(message))
+            struct.pack_into("<Q",self.map,SEQUENCE_OFFSET,sequence + 1)
+        finally:
+            fcntl.flock(self.file,fcntl.LOCK_UN)
+        
+        self.wake()
+    
+    def read(self,cursor):
+        """Records after a cursor (with the new cursor and records lost)"""
+        sequence = self.sequence
+        
+        lost = 0
+        if sequence - cursor > self.capacity:
+            lost = sequence - self.capacity - cursor
+            cursor = sequence - self.capacity
+        
+        records = list()
+        while cursor < sequence:
+            offset = self._offset(cursor)
+            
+            stamp,length,size = struct.unpack_from(RECORD_FORMAT,
+                                                   self.map,offset)
+            
+            if stamp == cursor and \
+               length + size <= self.record - RECORD_OFFSET:
+                start = offset + RECORD_OFFSET
+                body = self.map[start:start + length + size]
+                
+                #unchanged after the copy, so not overwritten during it
+                if struct.unpack_from("<Q",self.map,offset)[0] == cursor:
+                    records.append((body[:length],body[length:]))
+                else:
+                    lost += 1
+            else:
+                lost += 1
+            
+            cursor += 1
+        
+        return records,cursor,lost
+    
+    def attach(self):
+        """Wakeup descriptor and cursor of a new subscriber"""
+        path = WAKEUP_PATH.format(self.path,os.getpid(),
+                                  next(self.subscribers))
+        
+        if os.path.exists(path):
+            os.unlink(path)
+        
+        os.mkfifo(path,SHARED_MODE)
+        
+        #held open for writing too, so the pipe never hangs up
+        wakeup = os.open(path,os.O_RDWR | os.O_NONBLOCK)
+        
+        self.attached[wakeup] = path
+        self.scanned = 0.0#publishers in this process wake it at once
+        
+        return wakeup,self.sequence
+    
+    def detach(self,wakeup):
+        path = self.attached.pop(wakeup)
+        
+        if os.path.exists(path):
+            os.unlink(path)
+        
+        os.close(wakeup)
+    
+    def close(self):
+        """Remove the wakeups of this process (at exit)"""
+        for wakeup in self.attached.keys():
+            self.detach(wakeup)
+    
+    def drain(self,wakeup):
+        """Clear the pending wakeups of a subscriber"""
+        try:
+            while len(os.read(wakeup,4096)) > 0:
+                pass
+        except OSError as error:
+            if error.errno != errno.EAGAIN:raise
+    
+    def wake(self):
+        if time.time() - self.scanned > RESCAN_PERIOD:
+            self.scan()
+        
+        for path,wakeup in self.wakeups.items():
+            try:
+                os.write(wakeup,"\0")
+            except OSError as error:
+                if error.errno != errno.EAGAIN:#already has a wakeup pending
+                    os.close(wakeup)
+                    
+                    del self.wakeups[path]
+    
+    def scan(self):
+        """Open the wakeups of any new subscribers"""
+        for path in glob.glob(self.path + ".*.fifo"):
+            if path not in self.wakeups:
+                try:
+                    self.wakeups[path] = os.open(path,
+                                                 os.O_WRONLY | os.O_NONBLOCK)
+                except OSError:
+                    if not alive(path):
+                        os.unlink(path)
+                        
+                        logging.info("Memory:  Removed stale wakeup {0}".\
+                                     format(path))
+        
+        self.scanned = time.time()
@@ -0,0 +1,329 @@
+#!/usr/bin/env python2.7
+
+"""Routine metrics
+
+Author(s):  Sean Henely
+Language:   Python 2.x
+Modified:   18 October 2026
+
+Provides per-routine latency and throughput instrumentation.
+
+Classes:
+Histogram      -- Logarithmic latency histogram
+RoutineMetrics -- Counters and histograms for a routine
+Metrics        -- Instrumentation of an application
+"""
+
+"""Change log:
+
+Date          Author          Version     Description
+----------    ------------    --------    -----------------------------
+2026-10-18                    1.0         Initial revision
+2026-10-18                    1.1         Routines instrumented on reload
+2026-10-18                    1.2         Queue depth by scenario in the report
+
+"""
+
+
+##################
+# Import section #
+#
+#Built-in libraries
+from datetime import datetime
+from math import log
+import logging
+import time
+import types
+
+#External libraries
+from zmq.eventloop import ioloop
+import zmq
+
+#Internal libraries
+from . import encoder
+from . import agenda
+#
+##################
+
+
+##################
+# Export section #
+#
+__all__ = ["Histogram",
+           "RoutineMetrics",
+           "Metrics"]
+#
+##################
+
+
+####################
+# Constant section #
+#
+__version__ = "1.2"#current version [major.minor]
+
+METRICS_ADDRESS = "System.Core.Metrics"#topic on the broker
+METRICS_BROKER = "tcp://localhost:5555"#broker input
+METRICS_PERIOD = 10000#publishing period [ms]
+
+FLOOR = 1e-6#smallest resolved duration [s]
+RESOLUTION = 4#buckets per doubling (about 19% wide)
+#
+####################
+
+
+class Histogram(object):
+    """Logarithmic histogram of durations (in seconds)"""
+    
+    def __init__(self):
+        object.__init__(self)
+        
+        self.clear()
+    
+    def clear(self):
+        self.buckets = dict()
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+    
+    def record(self,value):
+        index = int(RESOLUTION * log(value / FLOOR,2)) \
+                if value > FLOOR else 0
+        
+        self.buckets[index] = self.buckets.get(index,0) + 1
+        self.count += 1
+        self.total += value
+        self.maximum = max(self.maximum,value)
+    
+    def percentile(self,percent):
+        """Upper bound of the bucket holding a percentile"""
+        assert 0 <= percent <= 100
+        
+        if self.count == 0:return None
+        
+        rank = percent / 100.0 * self.count
+        for index in sorted(self.buckets):
+            rank -= self.buckets[index]
+            
+            if rank <= 0:break
+        
+        return min(FLOOR * 2 ** ((index + 1.0) / RESOLUTION),self.maximum)
+    
+    def report(self):
+        return { "count": self.count,
+                 "mean": self.total / self.count if self.count > 0 else None,
+                 "p50": self.percentile(50),
+                 "p99": self.percentile(99),
+                 "max": self.maximum }
+
+class RoutineMetrics(object):
+    """Counters and histograms for a routine"""
+    
+    def __init__(self,label):
+        assert isinstance(label,types.StringTypes)
+        
+        object.__init__(self)
+        
+        self.label = label
+        
+        self.process = Histogram()#time spent in _process
+        self.wait = Histogram()#time spent in the run queue
+        
+        self.clear()
+    
+    def clear(self):
+        self.received = 0
+        self.sent = 0
+        
+        self.process.clear()
+        self.wait.clear()
+    
+    def report(self):
+        return { "in": self.received,
+                 "out": self.sent,
+                 "process": self.process.report(),
+                 "wait": self.wait.report() }
+
+class Metrics(object):
+    """Story:  Routine metrics
+    
+    IN ORDER TO find the bottleneck in a scenario
+    AS A generic segment
+    I WANT TO measure the latency and throughput of each routine
+    
+    """
+    
+    """Specification:  Routine metrics
+    
+    GIVEN an application with scenarios built
+        AND a publishing period (default 10 seconds)
+    
+    Scenario 1:  Metrics disabled
+    WHEN metrics are not enabled
+    THEN the routines and processor SHALL run uninstrumented
+    
+    Scenario 2:  Metrics enabled
+    WHEN metrics are enabled
+    THEN messages in and out of each routine SHALL be counted
+        AND the time spent processing each message SHALL be recorded
+        AND the time each message waited in the run queue SHALL be
+            recorded
+    
+    Scenario 3:  Period elapsed
+    WHEN the publishing period has elapsed
+    THEN the metrics SHALL be published to the broker on the metrics
+        address
+        AND the queue depth of each scenario SHALL be published
+        AND the metrics SHALL be cleared
+    
+    """
+    
+    def __init__(self,application,period=METRICS_PERIOD):
+        assert isinstance(period,types.IntType)
+        assert period > 0
+        
+        object.__init__(self)
+        
+        self.application = application
+        self.processor = application.processor
+        self.period = period
+        
+        self.routines = dict()
+        self.timer = None
+        self.socket = None
+    
+    @property
+    def enabled(self):
+        return self.timer is not None
+    
+    def enable(self):
+        """Instrument the routines and run queue of the application"""
+        self.discover()
+        
+        queue = self.processor.queue
+        queue.put = self.stamped(queue)
+        queue.get = self.waited(queue)
+        
+        self.socket = self.application.context.socket(zmq.PUB)
+        self.socket.connect(METRICS_BROKER)
+        
+        self.timer = ioloop.PeriodicCallback(self.publish,
+                                             self.period,
+                                             self.processor.loop)
+        self.timer.start()
+        
+        logging.info("Metrics:  Enabled for {0:d} routines".\
+                     format(len(self.routines)))
+    
+    def disable(self):
+        """Restore the uninstrumented routines and run queue"""
+        for routine in self.routines:
+            del routine._process
+            
+            if routine._process_batch is not None:
+                del routine._process_batch
+        else:
+            self.routines.clear()
+        
+        queue = self.processor.queue
+        del queue.put
+        del queue.get
+        
+        self.timer.stop()
+        self.socket.close()
+        
+        self.timer = None
+        self.socket = None
+        
+        logging.info("Metrics:  Disabled")
+    
+    def discover(self):
+        """Instrument the routines not yet instrumented (after a reload)"""
+        count = 0
+        for behavior in self.application.behaviors:
+            for scenario in behavior.scenarios:
+                for index,routine in enumerate(scenario.routines):
+                    if routine not in self.routines:
+                        label = "{0}/{1}/{2:d}/{3}".\
+                                format(behavior.name,scenario.name,
+                                       index,routine.name)
+                        
+                        self.instrument(routine,RoutineMetrics(label))
+                        
+                        count += 1
+        
+        return count
+    
+    def instrument(self,routine,metrics):
+        """Wrap the processing hooks of a routine instance"""
+        self.routines[routine] = metrics
+        
+        process = routine._process
+        def _process(message,ipipe):
+            metrics.received += 1
+            
+            start = time.time()
+            message,opipe = process(message,ipipe)
+            metrics.process.record(time.time() - start)
+            
+            if opipe is not None:metrics.sent += 1
+            
+            return message,opipe
+        
+        routine._process = _process
+        
+        if routine._process_batch is not None:
+            process_batch = routine._process_batch
+            def _process_batch(batch):
+                metrics.received += len(batch)
+                
+                start = time.time()
+                results = process_batch(batch)
+                metrics.process.record(time.time() - start)
+                
+                metrics.sent += len([opipe for message,opipe in results
+                                     if opipe is not None])
+                
+                return results
+            
+            routine._process_batch = _process_batch
+    
+    def stamped(self,queue):
+        """Run queue put that stamps the time of scheduling"""
+        put = agenda.RunQueue.put
+        def stamped(message,fpipe,tpipe,origin=None,stamp=None):
+            put(queue,message,fpipe,tpipe,origin,time.time())
+        
+        return stamped
+    
+    def waited(self,queue):
+        """Run queue get that records the time spent waiting"""
+        get = agenda.RunQueue.get
+        def waited():
+            entry = get(queue)
+            if entry is None:return None#queue is empty
+            
+            metrics = self.routines.get(entry[4])
+            if metrics is not None and entry[6] is not None:
+                metrics.wait.record(time.time() - entry[6])
+            
+            return entry
+        
+        return waited
+    
+    def report(self):
+        return { "epoch": datetime.utcnow(),
+                 "routines": dict([(metrics.label,metrics.report())
+                                   for metrics in self.routines.values()
+                                   if metrics.received > 0]),
+                 "depth": dict(self.processor.depth()) }
+    
+    def publish(self):
+        report = self.report()
+        
+        self.socket.send_multipart((METRICS_ADDRESS,encoder(report)))
+        
+        for metrics in self.routines.values():
+            metrics.clear()
+        
+        logging.info("Metrics:  Published {0:d} routines".\
+                     format(len(report["routines"])))
@@ -0,0 +1,326 @@
+#!/usr/bin/env python2.7
+
+"""Graph optimizer
+
+Author(s):  Sean Henely
+Language:   Python 2.x
+Modified:   18 October 2026
+
+Provides a build-time pass that simplifies scenario graphs.
+
+Functions:
+optimize -- Optimize the scenarios of an application
+fold     -- Bypass conditions with a constant outcome
+merge    -- Share equivalent sources and pure steps
+prune    -- Remove pure routines whose output is unused
+"""
+
+"""Change log:
+
+Date          Author          Version     Description
+----------    ------------    --------    -----------------------------
+2026-10-18                    1.0         Initial revision
+2026-10-18                    1.1         Links recorded for teardown
+2026-10-18                    1.2         Merged pipelines shared with the dropped scenarios
+
+"""
+
+
+##################
+# Import section #
+#
+#Built-in libraries
+import logging
+
+#External libraries
+
+#Internal libraries
+from .routine import *
+from .routine.control import SplitControl
+#
+##################
+
+
+##################
+# Export section #
+#
+__all__ = ["optimize",
+           "fold",
+           "merge",
+           "prune"]
+#
+##################
+
+
+####################
+# Constant section #
+#
+__version__ = "1.2"#current version [major.minor]
+#
+####################
+
+
+"""Story:  Graph optimizer
+
+IN ORDER TO avoid scheduling work that cannot affect the output
+AS A generic segment
+I WANT TO simplify the scenario graph after it is built
+
+"""
+
+"""Specification:  Graph optimizer
+
+GIVEN an application with scenarios built
+
+Scenario 1:  Constant condition
+WHEN a condition routine always has the same outcome
+THEN its sources SHALL be linked to the target of that outcome
+    AND the condition SHALL be removed
+
+Scenario 2:  Equivalent sources
+WHEN two sources have the same signature (e.g. the same subscription)
+THEN the second source SHALL be stopped
+    AND the pure steps both sources share SHALL be run once
+    AND the first differing step SHALL be fanned out with a split
+    AND the kept routines SHALL be included in the scenarios of the
+        stopped ones (so tearing down either scenario leaves the other
+        with a source)
+
+Scenario 3:  Dead routine
+WHEN a pure routine has no target
+THEN the routine SHALL be removed from its sources
+
+Scenario 4:  Optimized
+WHEN the graph has been optimized
+THEN every link made SHALL be recorded in the scenarios of its routines
+    AND a report of the folded, merged and removed routines SHALL be
+        logged
+
+"""
+
+def targets(routine):
+    """Downstream routines of a routine"""
+    if isinstance(routine,ConditionRoutine):
+        return [target for target in routine.target.values()
+                if target is not None]
+    elif isinstance(routine.target,list):
+        return list(routine.target)
+    elif routine.target is not None:
+        return [routine.target]
+    else:
+        return []
+
+class Rewired(object):
+    """Link made by the optimizer (a clause as far as teardown goes)"""
+    
+    def __init__(self,source,routine):
+        object.__init__(self)
+        
+        self.source = source
+        self.routine = routine
+
+def record(application,source,target):
+    """Record a link in the scenarios of its routines (see Scenario.teardown)"""
+    rewired = Rewired(source,target)
+    
+    for behavior in application.behaviors:
+        for scenario in behavior.scenarios:
+            if source in scenario.routines or target in scenario.routines:
+                scenario.clauses.append(rewired)
+
+def link(application,source,target):
+    """Link a source to a target (and record it)"""
+    source.set_target(target)
+    target.set_source(source)
+    
+    record(application,source,target)
+
+def relink(application,source,old,new):
+    """Point a source at a new target in place of an old one"""
+    if isinstance(source,ConditionRoutine):
+        for mode in (False,True):
+            if source.target[mode] is old:
+                source.target[mode] = new
+    elif isinstance(source.target,list):
+        if new is None:
+            source.target.remove(old)
+        else:
+            source.target[source.target.index(old)] = new
+    elif source.target is old:
+        source.target = new
+    
+    old.unset_source(source)
+    
+    if new is not None:
+        new.set_source(source)
+        
+        record(application,source,new)
+
+def share(application,routine,other):
+    """Include a routine in the scenarios of another (that it replaces)"""
+    for behavior in application.behaviors:
+        for scenario in behavior.scenarios:
+            if other in scenario.routines and \
+               routine not in scenario.routines:
+                scenario.routines.append(routine)
+
+def discard(application,routine):
+    """Remove a routine from the scenarios of an application"""
+    for behavior in application.behaviors:
+        for scenario in behavior.scenarios:
+            while routine in scenario.routines:
+                scenario.routines.remove(routine)
+    
+    if routine in application.processor.sources:
+        application.processor.remove(routine)
+
+def fanout(application,routine):
+    """Split after a routine (the routine itself if it is a split)"""
+    if isinstance(routine,SplitControl):return routine
+    
+    split = SplitControl()
+    split.behavior = routine.behavior
+    
+    for behavior in application.behaviors:
+        for scenario in behavior.scenarios:
+            if routine in scenario.routines:
+                scenario.routines.append(split)
+    
+    if routine.target is not None:
+        successor = routine.target
+        
+        relink(application,routine,successor,split)
+        link(application,split,successor)
+    else:
+        link(application,routine,split)
+    
+    return split
+
+def routines(application):
+    """Routines of an application (in order of scenario)"""
+    result = list()
+    
+    for behavior in application.behaviors:
+        for scenario in behavior.scenarios:
+            for routine in scenario.routines:
+                if routine not in result:
+                    result.append(routine)
+    
+    return result
+
+def fold(application):
+    """Bypass conditions with a constant outcome"""
+    folded = list()
+    
+    for routine in routines(application):
+        if isinstance(routine,ConditionRoutine) and \
+           routine.constant is not None:
+            successor = routine.target[routine.constant]
+            
+            if successor is not None:
+                successor.unset_source(routine)
+            
+            for source in list(routine.source):
+                relink(application,source,routine,successor)
+            
+            discard(application,routine)
+            
+            folded.append(routine)
+    
+    return folded
+
+def merge(application):
+    """Share equivalent sources and pure steps"""
+    merged = list()
+    
+    kept = dict()#first source by signature
+    for routine in routines(application):
+        if not isinstance(routine,SourceRoutine) or \
+           len(routine.source) > 0:continue
+        
+        signature = routine.signature()
+        if signature is None:continue
+        
+        if signature not in kept:
+            kept[signature] = routine
+            
+            continue
+        
+        keep,other = kept[signature],routine
+        pairs = [(keep,other)]
+        
+        #follow both pipelines while their steps are interchangeable
+        #(and only fed by the pipeline, so nothing else loses them)
+        while not isinstance(keep,(ConditionRoutine,SplitControl)) and \
+              not isinstance(other,(ConditionRoutine,SplitControl)) and \
+              keep.target is not None and other.target is not None and \
+              len(other.target.source) == 1 and \
+              keep.target.signature() is not None and \
+              keep.target.signature() == other.target.signature():
+            keep,other = keep.target,other.target
+            
+            pairs.append((keep,other))
+        
+        if isinstance(keep,ConditionRoutine) or \
+           isinstance(other,ConditionRoutine):continue#outcomes may differ
+        
+        #the kept pipeline now feeds the scenarios of the dropped one
+        for routine,dropped in pairs:
+            share(application,routine,dropped)
+        
+        successors = targets(other)
+        for successor in successors:
+            relink(application,other,successor,None)
+        
+        if len(successors) == 1 and keep.target is None:
+            link(application,keep,successors[0])
+        elif len(successors) > 0:
+            split = fanout(application,keep)
+            
+            for successor in successors:
+                link(application,split,successor)
+        
+        for _,routine in pairs:
+            discard(application,routine)
+            
+            merged.append(routine)
+    
+    return merged
+
+def prune(application):
+    """Remove pure routines whose output is unused"""
+    removed = list()
+    
+    while True:
+        dead = [routine for routine in routines(application)
+                if routine.pure and len(targets(routine)) == 0]
+        
+        if len(dead) == 0:break
+        
+        for routine in dead:
+            for source in list(routine.source):
+                relink(application,source,routine,None)
+            
+            discard(application,routine)
+            
+            removed.append(routine)
+    
+    return removed
+
+def optimize(application):
+    """Optimize the scenarios of an application"""
+    report = dict(folded=fold(application),
+                  merged=merge(application),
+                  removed=prune(application))
+    
+    for action in ("folded","merged","removed"):
+        for routine in report[action]:
+            logging.info("Optimizer:  {0} {1}".\
+                         format(action.capitalize(),routine.name))
+    
+    logging.info("Optimizer:  {0:d} folded, {1:d} merged, {2:d} removed".\
+                 format(len(report["folded"]),
+                        len(report["merged"]),
+                        len(report["removed"])))
+    
+    return report
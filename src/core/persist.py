@@ -4,7 +4,7 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   08 August 2013
+Modified:   18 October 2026
 
 Purpose:    
 """
@@ -20,7 +20,6 @@ import pickle
 import pymongo
 
 #Internal libraries
-import engine
 #
 ##################
 
@@ -29,6 +28,7 @@ import engine
 # Export section #
 #
 __all__ = ["RoutinePersistance",
+           "resolve",
            "SOURCE_ROUTINE",
            "EVENT_ROUTINE",
            "CONDITION_ROUTINE",
@@ -43,7 +43,7 @@ __all__ = ["RoutinePersistance",
 ####################
 # Constant section #
 #
-__version__ = "1.0"#current version [major.minor]
+__version__ = "1.1"#current version [major.minor]
 
 SOURCE_OBJECT = "source"
 EVENT_OBJECT = "event"
@@ -56,6 +56,24 @@ SPECIAL_OBJECT = "special"
 ####################
 
 
+registry = dict()#routine classes by object identifier (process-wide)
+
+def resolve(database,ids):
+    """Routine classes by object identifier (one query for any not cached)"""
+    missing = list(set([_id for _id in ids if _id not in registry]))
+    
+    if len(missing) > 0:
+        for document in database.Objects.find({"_id":{"$in":missing}},
+                                              ["path"]):
+            registry[document["_id"]] = pickle.loads(document["path"])
+        
+        unknown = [_id for _id in missing if _id not in registry]
+        if len(unknown) > 0:
+            raise KeyError("Routines not in Objects:  {0}".\
+                           format(", ".join([str(_id) for _id in unknown])))
+    
+    return dict([(_id,registry[_id]) for _id in ids])
+
 class ObjectPersistance(object):
     routines = []
     
@@ -104,7 +122,11 @@ class ObjectPersistance(object):
             
         self.cls._id = document["_id"]
         
+        registry[self.cls._id] = self.cls
+        
 def main():
+    import engine#engine resolves routine classes through this module
+    
     database = engine.Application("PyGS").database
     collection = database.Objects
     
@@ -1,5 +1,6 @@
-import logging
 from .. import coroutine
+from .. import agenda
+from ..journal import Journal
 
 __all__ = ["BaseRoutine",
            "SourceRoutine",
@@ -10,48 +11,78 @@ __all__ = ["BaseRoutine",
 
 class BaseRoutine(object):
     name = "Core.Base"
+    priority = agenda.NORMAL
+    blocking = False#run on a worker thread (see agenda.AsyncProcessor)
+    behavior = None#owning behavior, for fair turns (see agenda.RunQueue)
+    pure = False#output depends only on input, no side effects (see optimizer)
+    
+    _process_batch = None#optional batch hook (see agenda.Processor.batch)
     
     def __init__(self):
         self.source = list()
         self.target = None
         
+        self.fused = None#inline pipeline (see fusion.fuse)
+        
+        self.journal = Journal(self.name)
+        
         self.routine = self._routine()
+        self.batch = self._batch() \
+                     if self._process_batch is not None else None
     
     @coroutine
     def _routine(self): 
         message,opipe = None,None
                
-        logging.debug("{0}:  Starting".\
-                      format(self.name))
+        self.journal.debug("{0}:  Starting")
         while True:
             try:
                 message,ipipe = yield message,opipe
             except GeneratorExit:
-                logging.warn("{0}:  Stopping".\
-                             format(self.name))
+                self.journal.warn("{0}:  Stopping")
                 
                 return
             else:
-                logging.debug("{0}:  Processing".\
-                             format(self.name))
+                self.journal.debug("{0}:  Processing")
                 
                 message,opipe = self._process(message,ipipe)
         
-                logging.debug("{0}:  Processed".\
-                             format(self.name))
+                self.journal.debug("{0}:  Processed")
+    
+    @coroutine
+    def _batch(self):
+        results = None
+        
+        self.journal.debug("{0}:  Starting batch")
+        while True:
+            try:
+                batch = yield results
+            except GeneratorExit:
+                self.journal.warn("{0}:  Stopping batch")
+                
+                return
+            else:
+                self.journal.debug("{0}:  Processing {1:d} messages",
+                                   len(batch))
+                
+                results = self._process_batch(batch)
+        
+                self.journal.debug("{0}:  Processed {1:d} messages",len(batch))
     
     def _process(self,message,ipipe):
         raise NotImplemented
     
+    def signature(self):
+        """Routines with equal signatures are interchangeable (or None)"""
+        return type(self) if self.pure else None
+    
     def set_source(self,source):
         assert isinstance(source,BaseRoutine)
         
         if len(self.source) == 0:
-            logging.debug("{0}:  Single source defined".\
-                          format(self.name))
+            self.journal.debug("{0}:  Single source defined")
         else:
-            logging.warn("{0}:  Multiple sources defined".\
-                         format(self.name))
+            self.journal.warn("{0}:  Multiple sources defined")
         
         self.source.append(source)
     
@@ -59,27 +90,35 @@ class BaseRoutine(object):
         assert isinstance(target,BaseRoutine)
         
         if self.target is None:
-            logging.debug("{0}:  Target defined".\
-                          format(self.name))
+            self.journal.debug("{0}:  Target defined")
         else:
-            logging.error("{0}:  Target redefined".\
-                          format(self.name))
+            self.journal.error("{0}:  Target redefined")
         
         self.target = target
+    
+    def unset_source(self,source):
+        if source in self.source:
+            self.journal.debug("{0}:  Source removed")
+            
+            self.source.remove(source)
+    
+    def unset_target(self,target):
+        if self.target is target:
+            self.journal.debug("{0}:  Target removed")
+            
+            self.target = None
 
 class SourceRoutine(BaseRoutine):
     name = "Core.Source"
     type = None
     
     def _process(self,message,ipipe):
-        logging.debug("{0}:  Receiving".\
-                     format(self.name))
+        self.journal.debug("{0}:  Receiving")
         
         message = self._receive()
         opipe = self.target
         
-        logging.debug("{0}:  Received".\
-                     format(self.name))
+        self.journal.debug("{0}:  Received")
         
         return message,opipe
     
@@ -90,14 +129,12 @@ class TargetRoutine(BaseRoutine):
     name = "Core.Target"
     
     def _process(self,message,ipipe):
-        logging.debug("{0}:  Sending".\
-                     format(self.name))
+        self.journal.debug("{0}:  Sending")
         
         self._send(message)
         opipe = self.target
         
-        logging.debug("{0}:  Sent".\
-                     format(self.name))
+        self.journal.debug("{0}:  Sent")
         
         return message,opipe
     
@@ -106,6 +143,7 @@ class TargetRoutine(BaseRoutine):
 
 class ConditionRoutine(BaseRoutine):
     name = "Core.Condition"
+    constant = None#outcome known before running (see optimizer)
     
     def __init__(self):
         BaseRoutine.__init__(self)
@@ -115,17 +153,14 @@ class ConditionRoutine(BaseRoutine):
         self.target[True] = None
     
     def _process(self,message,ipipe):
-        logging.debug("{0}:  Satisfying".\
-                      format(self.name))
+        self.journal.debug("{0}:  Satisfying")
             
         if self._satisfy(message):
-            logging.debug("{0}:  Satisfied".\
-                          format(self.name))
+            self.journal.debug("{0}:  Satisfied")
             
             opipe = self.target[True]
         else:
-            logging.warning("{0}:  Not satisfied".\
-                         format(self.name))
+            self.journal.warn("{0}:  Not satisfied")
             
             opipe = self.target[False]
             
@@ -138,31 +173,33 @@ class ConditionRoutine(BaseRoutine):
         assert isinstance(target,BaseRoutine)
         
         if self.mode not in self.target:
-            logging.debug("{0}:  {1} target defined".\
-                          format(self.name,self.mode))
+            self.journal.debug("{0}:  {1} target defined",self.mode)
         else:
-            logging.error("{0}:  {1} target redefined".\
-                          format(self.name,self.mode))
+            self.journal.error("{0}:  {1} target redefined",self.mode)
         
         self.target[self.mode] = target
+    
+    def unset_target(self,target):
+        for mode in (False,True):
+            if self.target[mode] is target:
+                self.journal.debug("{0}:  {1} target removed",mode)
+                
+                self.target[mode] = None
 
 class EventRoutine(BaseRoutine):
     name = "Core.Event"
     
     def _process(self,message,ipipe):
-        logging.debug("{0}:  Occurring".\
-                      format(self.name))
+        self.journal.debug("{0}:  Occurring")
         
         message = self._occur(message)
         
         if message is not None:
-            logging.debug("{0}:  Occurred".\
-                         format(self.name))
+            self.journal.debug("{0}:  Occurred")
             
             opipe = self.target
         else:
-            logging.warn("{0}:  False alarm".\
-                         format(self.name))
+            self.journal.warn("{0}:  False alarm")
             
             opipe = None
             
@@ -175,14 +212,12 @@ class ActionRoutine(BaseRoutine):
     name = "Core.Action"
     
     def _process(self,message,ipipe):
-        logging.debug("{0}:  Executing".\
-                      format(self.name))
+        self.journal.debug("{0}:  Executing")
         
         message = self._execute(message)
         opipe = self.target
         
-        logging.debug("{0}:  Executed".\
-                     format(self.name))
+        self.journal.debug("{0}:  Executed")
             
         return message,opipe
     
@@ -0,0 +1,246 @@
+#!/usr/bin/env python2.7
+
+"""Cache routines
+
+Author(s):  Sean Henely
+Language:   Python 2.x
+Modified:   18 October 2026
+
+Provides routines for last-value caches.
+
+Classes:
+LastValueCache -- Newest message by key
+CacheObject    -- Persisted cache
+CacheGet       -- Get from cache
+CachePut       -- Put to cache
+
+"""
+
+"""Change log:
+
+Date          Author          Version     Description
+----------    ------------    --------    -----------------------------
+2026-10-18                    1.0         Initial revision
+2026-10-18                    1.1         Dirty values kept in order
+
+"""
+
+
+##################
+# Import section #
+#
+#Built-in libraries
+from collections import OrderedDict
+import types
+
+#External libraries
+
+#Internal libraries
+from . import EventRoutine,ActionRoutine
+from .. import agenda
+from .. import persist
+#
+##################
+
+
+##################
+# Export section #
+#
+__all__ = ["LastValueCache",
+           "CacheObject",
+           "CacheGet",
+           "CachePut"]
+#
+##################
+
+
+####################
+# Constant section #
+#
+__version__ = "1.1"#current version [major.minor]
+#
+####################
+
+
+class LastValueCache(object):
+    """Newest message by key (with keys not yet served marked dirty)"""
+    
+    def __init__(self):
+        object.__init__(self)
+        
+        self.values = dict()
+        self.dirty = OrderedDict()#keys in order of first update
+        
+        self.collapsed = 0#updates replaced before being served
+    
+    def __len__(self):
+        return len(self.values)
+    
+    def empty(self):
+        return len(self.dirty) == 0
+    
+    def put(self,key,message):
+        if key in self.dirty:
+            self.collapsed += 1
+        else:
+            self.dirty[key] = None
+        
+        self.values[key] = message
+    
+    def get(self,key):
+        """Newest message for a key (whether or not it is dirty)"""
+        return self.values.get(key)
+    
+    def pop(self):
+        """Newest message for the oldest dirty key"""
+        key,_ = self.dirty.popitem(last=False)
+        
+        return key,self.values[key]
+
+
+cache_object = persist.ObjectPersistance()
+
+@cache_object.type(persist.GENERAL_OBJECT)
+class CacheObject(object):
+    name = "Cache.Object"
+    
+    def __init__(self):
+        object.__init__(self)
+        
+        self._cache = LastValueCache()
+    
+    @cache_object.property
+    def cache(self):
+        return self._cache
+    
+    @cache.setter
+    def cache(self,cache):
+        assert isinstance(cache,LastValueCache)
+        
+        self._cache = cache
+
+
+cache_get = persist.ObjectPersistance()
+
+@cache_get.type(persist.EVENT_OBJECT)
+class CacheGet(EventRoutine):
+    """Story:  Get from cache
+    
+    IN ORDER TO only process the current state
+    AS A generic segment
+    I WANT TO retrieve the newest messages from a cache
+    
+    """
+    
+    """Specification:  Get from cache
+    
+    GIVEN a cache
+        AND a downstream pipeline (default null)
+    
+    Scenario 1:  Messages requested
+    WHEN messages are requested from upstream
+    THEN the newest message of every dirty key SHALL be removed from the
+        dirty keys
+        AND the first message SHALL be sent downstream
+        AND the other messages SHALL be scheduled downstream after it
+            (in order of first update)
+    
+    Scenario 2:  Cache is clean
+    WHEN messages are requested from upstream
+        AND no key is dirty
+    THEN no message SHALL be sent downstream
+    
+    """
+    
+    name = "Cache.Get"
+    
+    def __init__(self):
+        EventRoutine.__init__(self)
+        
+        self.processor = agenda.Processor()
+    
+    @cache_get.property
+    def cache(self):
+        return self._cache
+    
+    @cache.setter
+    def cache(self,cache):
+        assert isinstance(cache,LastValueCache)
+        
+        self._cache = cache
+    
+    def _occur(self,message):
+        if not self._cache.empty():
+            key,message = self._cache.pop()
+            
+            while not self._cache.empty():
+                _,other = self._cache.pop()
+                
+                self.processor.defer(other,self,self.target)
+            
+            self.journal.info("{0}:  Got newest for {1}",key)
+            
+            return message
+        else:
+            self.journal.debug("{0}:  Cache is clean")
+
+
+cache_put = persist.ObjectPersistance()
+
+@cache_put.type(persist.ACTION_OBJECT)
+class CachePut(ActionRoutine):
+    """Story:  Put to cache
+    
+    IN ORDER TO skip states that were superseded before being processed
+    AS A generic segment
+    I WANT TO keep only the newest message for each asset and type
+    
+    """
+    
+    """Specification:  Put to cache
+    
+    GIVEN a cache
+        AND an asset name
+        AND a downstream pipeline (default null)
+    
+    Scenario 1:  Upstream message received
+    WHEN a message is received from upstream
+    THEN the message SHALL replace the cached message with the same asset
+        and type
+        AND the key SHALL be marked dirty
+        AND the message SHALL be sent downstream
+    
+    """
+    
+    name = "Cache.Put"
+    
+    _asset = None
+    
+    @cache_put.property
+    def cache(self):
+        return self._cache
+    
+    @cache.setter
+    def cache(self,cache):
+        assert isinstance(cache,LastValueCache)
+        
+        self._cache = cache
+    
+    @cache_put.property
+    def asset(self):
+        return self._asset
+    
+    @asset.setter
+    def asset(self,asset):
+        assert isinstance(asset,types.StringTypes)
+        
+        self._asset = asset
+    
+    def _execute(self,message):
+        key = (self._asset,getattr(message,"type",None))
+        
+        self._cache.put(key,message)
+        
+        self.journal.debug("{0}:  Put for {1}",key)
+        
+        return message
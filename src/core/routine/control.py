@@ -4,7 +4,7 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   09 August 2013
+Modified:   18 October 2026
 
 Provides routines for controlling the flow of data.
 
@@ -25,6 +25,13 @@ Date          Author          Version     Description
 2013-06-29    shenely                     Refactored for agenda
 2013-07-17    shenely                     Corrected merge log message
 2013-08-09    shenely         1.2         Adding persistance logic
+2026-10-18                    1.3         Split is epoch-critical
+2026-10-18                    1.4         Journal logging
+2026-10-18                    1.5         Unlinking for hot reload
+2026-10-18                    1.6         Constant outcome of allow and block
+2026-10-18                    1.7         Windowed join on a key
+2026-10-18                    1.8         Zero-copy split with inline first target
+2026-10-18                    1.9         Frozen split persisted
 
 
 """
@@ -33,13 +40,14 @@ Date          Author          Version     Description
 # Import section #
 #
 #Built-in libraries
-import logging
+from collections import deque
 import types
 
 #External libraries
 
 #Internal libraries
 from . import *
+from .. import freeze
 from .. import agenda
 from .. import persist
 #
@@ -60,7 +68,9 @@ __all__ = ["SplitControl",
 ####################
 # Constant section #
 #
-__version__ = "1.2"#current version [major.minor]
+__version__ = "1.9"#current version [major.minor]
+
+JOIN_DEPTH = 16#pending messages per source in a windowed join
 #
 ####################
 
@@ -84,42 +94,64 @@ class SplitControl(SourceRoutine,TargetRoutine):
         
     Scenario 1:  Upstream message received
     WHEN a message is received from the upstream source
-    THEN the message SHALL be sent to all listed downstream sinks
+    THEN the message SHALL be sent to the first downstream sink
+        AND the message SHALL be scheduled for all other downstream sinks
+    
+    Scenario 2:  Frozen split
+    WHEN a message is received from the upstream source
+        AND the split is frozen
+    THEN the message SHALL be frozen before it is sent (not copied)
     
     """
     
     name = "Control.Split"
+    priority = agenda.CRITICAL
     
-    def __init__(self):
+    def __init__(self,frozen=False):
         TargetRoutine.__init__(self)
         
         self.target = list()
+        self.frozen = frozen
         
         self.processor = agenda.Processor()
     
-    def _process(self,message,ipipe):        
-        for opipe in self.target:
-            self.processor.schedule(message,ipipe,opipe)
-        else:
-            logging.info("{0}:  {1:d}-way split".\
-                         format(self.name,len(self.target)))
+    @split_control.property
+    def frozen(self):
+        return self._frozen
+    
+    @frozen.setter
+    def frozen(self,frozen):
+        assert isinstance(frozen,types.BooleanType)
         
-            message = None
-            opipe = None
+        self._frozen = frozen
+    
+    def _process(self,message,ipipe):
+        if self.frozen:freeze(message)
         
-        return message,opipe
+        for opipe in self.target[1:]:
+            self.processor.schedule(message,self,opipe)
+        
+        self.journal.info("{0}:  {1:d}-way split",len(self.target))
+        
+        opipe = self.target[0] if len(self.target) > 0 else None
+        
+        return message,opipe#first target runs inline when fused
     
     def set_target(self,target):
         assert isinstance(target,BaseRoutine)
         
         if len(self.target) is None:
-            logging.info("{0}:  Single target defined".\
-                         format(self.name))
+            self.journal.info("{0}:  Single target defined")
         else:
-            logging.info("{0}:  Multiple targets defined".\
-                          format(self.name))
+            self.journal.info("{0}:  Multiple targets defined")
         
         self.target.append(target)
+    
+    def unset_target(self,target):
+        if target in self.target:
+            self.journal.info("{0}:  Target removed")
+            
+            self.target.remove(target)
 
 
 merge_control = persist.ObjectPersistance()
@@ -151,28 +183,58 @@ class MergeControl(SourceRoutine,TargetRoutine):
     THEN the stored messages SHALL be sent to the downstream sink
         AND the message count SHALL be reset to zero (0)
     
+    Scenario 3:  Keyed message received
+    WHEN a message is received from an upstream source
+        AND a join key (e.g. epoch) is defined
+    THEN the message SHALL be stored with the key of the message
+        AND the messages with that key SHALL be sent downstream (in order
+            of source) once every source has reported the key
+    
+    Scenario 4:  Source buffer full
+    WHEN more keys are pending for a source than the join depth
+    THEN the oldest pending key of that source SHALL be evicted
+    
+    Scenario 5:  Join window elapsed
+    WHEN a join window is defined
+        AND a pending key is older than the newest key by more than the
+            join window
+    THEN the pending key SHALL be evicted
+    
     """
     
     name = "Control.Merge"
     
-    def __init__(self):
+    def __init__(self,key=None,window=None,depth=JOIN_DEPTH):
+        assert isinstance(key,types.StringTypes) or key is None
+        assert isinstance(depth,types.IntType)
+        assert depth > 0
+        
         SourceRoutine.__init__(self)
         self.message = dict()
+        
+        self.key = key
+        self.window = window
+        self.depth = depth
+        
+        self.pending = dict()#messages by source, by key
+        self.buffer = dict()#pending keys by source (in order of arrival)
+        self.latest = None
+        self.evicted = 0
     
     def _process(self,message,ipipe):
+        if self.key is not None:
+            return self._join(message,ipipe)
+        
         if ipipe in self.source:
             if ipipe in self.message:
-                logging.warn("{0}:  Duplicate source".\
-                             format(self.name))
+                self.journal.warn("{0}:  Duplicate source")
 
             self.message[ipipe] = message
         else:
-            logging.error("{0}:  Undefined source".\
-                          format(self.name))
+            self.journal.error("{0}:  Undefined source")
             
         if len(self.message) == len(self.source):
-            logging.info("{0}:  {1:d}-way merge".\
-                         format(self.name,len(self.source)))
+            self.journal.info("{0}:  {1:d}-way merge",len(self.source))
             
             message = self.message.values()
             opipe = self.target
@@ -184,17 +246,83 @@ class MergeControl(SourceRoutine,TargetRoutine):
         
         return message,opipe
     
+    def _join(self,message,ipipe):
+        if ipipe not in self.source:
+            self.journal.error("{0}:  Undefined source")
+            
+            return None,None
+        
+        value = getattr(message,self.key)
+        
+        waiting = self.pending.setdefault(value,dict())
+        buffer = self.buffer.setdefault(ipipe,deque())
+        
+        if ipipe in waiting:
+            self.journal.warn("{0}:  Duplicate source at {1}",value)
+        else:
+            buffer.append(value)
+        
+        waiting[ipipe] = message
+        
+        if self.latest is None or value > self.latest:
+            self.latest = value
+        
+        if len(waiting) == len(self.source):
+            del self.pending[value]
+            
+            for source in waiting:
+                self.buffer[source].remove(value)
+            
+            self.journal.info("{0}:  {1:d}-way join at {2}",
+                              len(self.source),value)
+            
+            message = [waiting[source] for source in self.source]
+            opipe = self.target
+        else:
+            if len(buffer) > self.depth:
+                self.evict(buffer[0])
+            
+            message = None
+            opipe = None
+        
+        if self.window is not None:
+            for value in [value for value in self.pending
+                          if value < self.latest - self.window]:
+                self.evict(value)
+        
+        return message,opipe
+    
+    def evict(self,value):
+        """Drop an incomplete join"""
+        waiting = self.pending.pop(value)
+        
+        for source in waiting:
+            self.buffer[source].remove(value)
+        
+        self.evicted += 1
+        
+        self.journal.warn("{0}:  Evicted incomplete join at {1}",value)
+    
     def set_source(self,source):
         assert isinstance(source,BaseRoutine)
         
         if len(self.source) == 0:
-            logging.info("{0}:  Single source defined".\
-                         format(self.name))
+            self.journal.info("{0}:  Single source defined")
         else:
-            logging.info("{0}:  Multiple sources defined".\
-                         format(self.name))
+            self.journal.info("{0}:  Multiple sources defined")
         
         self.source.append(source)
+    
+    def unset_source(self,source):
+        SourceRoutine.unset_source(self,source)
+        
+        self.message.pop(source,None)#never completes without the source
+        
+        for value in self.buffer.pop(source,()):
+            self.pending[value].pop(source)
+            
+            if len(self.pending[value]) == 0:
+                del self.pending[value]
 
 
 allow_control = persist.ObjectPersistance()
@@ -220,10 +348,10 @@ class AllowControl(ConditionRoutine):
     """
     
     name = "Control.Allow"
+    constant = True
     
     def _satisfy(self,message):
-        logging.info("{0}:  Message allowed".\
-                     format(self.name))
+        self.journal.info("{0}:  Message allowed")
         
         return True
 
@@ -251,9 +379,9 @@ class BlockControl(ConditionRoutine):
     """
     
     name = "Control.Block"
+    constant = False
     
     def _satisfy(self,message):
-        logging.info("{0}:  Message blocked".\
-                     format(self.name))
+        self.journal.info("{0}:  Message blocked")
         
         return False
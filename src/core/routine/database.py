@@ -4,7 +4,7 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   09 August 2013
+Modified:   18 October 2026
 
 Provides routines for interacting with a database.
 
@@ -19,6 +19,10 @@ DatabaseSave  -- Save in database
 Date          Author          Version     Description
 ----------    ------------    --------    -----------------------------
 2013-08-08    shenely         1.0         Initial revision
+2026-10-18                    1.1         Declared as blocking
+2026-10-18                    1.2         Journal logging
+2026-10-18                    1.3         Saves slotted objects
+2026-10-18                    1.4         Saves with the processor's application
 
 """
 
@@ -28,7 +32,6 @@ Date          Author          Version     Description
 #
 #Built-in libraries
 from datetime import datetime
-import logging
 import types
 
 #External libraries
@@ -36,7 +39,7 @@ import pymongo
 
 #Internal libraries
 from . import EventRoutine,ActionRoutine
-from .. import BaseObject
+from .. import BaseObject,SlotObject
 from .. import persist
 from .. import engine
 #
@@ -55,7 +58,7 @@ __all__ = ["DatabaseFind",
 ####################
 # Constant section #
 #
-__version__ = "1.0"#current version [major.minor]
+__version__ = "1.4"#current version [major.minor]
 #
 ####################
 
@@ -83,6 +86,7 @@ class DatabaseFind(EventRoutine):
     """
     
     name = "Database.Find"
+    blocking = True
     
     def __init__(self):
         EventRoutine.__init__(self)
@@ -115,15 +119,13 @@ class DatabaseFind(EventRoutine):
         try:
             document = BaseObject(**self.cursor.next())
                           
-            logging.info("{0}:  Found {1} in database".\
-                         format(self.name,document._id))
+            self.journal.info("{0}:  Found {1} in database",document._id)
             
             return document
         except StopIteration:
             self.cursor.close()
             
-            logging.warn("{0}:  No more documents".\
-                         format(self.name))
+            self.journal.warn("{0}:  No more documents")
 
 
 database_save = persist.ObjectPersistance()
@@ -149,11 +151,12 @@ class DatabaseSave(ActionRoutine):
     """
     
     name = "Database.Save"
+    blocking = True
     
     def __init__(self):
         ActionRoutine.__init__(self)
         
-        self.database = engine.Applciation().database
+        self.database = engine.Application("PyGS").database
         
     @database_save.property
     def collection(self):
@@ -166,11 +169,13 @@ class DatabaseSave(ActionRoutine):
         self._collection = collection
     
     def _execute(self,document):
-        assert isinstance(document,types.DictType)
+        assert isinstance(document,(types.DictType,SlotObject))
+        
+        record = document.todict() \
+                 if isinstance(document,SlotObject) else document
         
-        self.database[self._collection].save(document)
+        self.database[self._collection].save(record)
                     
-        logging.info("{0}:  Saved {1} in database".\
-                     format(self.name,document._id))
+        self.journal.info("{0}:  Saved {1} in database",record["_id"])
         
         return document
\ No newline at end of file
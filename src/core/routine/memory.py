@@ -0,0 +1,234 @@
+#!/usr/bin/env python2.7
+
+"""Memory routines
+
+Author(s):  Sean Henely
+Language:   Python 2.x
+Modified:   18 October 2026
+
+Provides routines for shared-memory channels.
+
+Classes:
+MemorySubscribe -- Subscribe from channel
+MemoryPublish   -- Publish to channel
+
+"""
+
+"""Change log:
+
+Date          Author          Version     Description
+----------    ------------    --------    -----------------------------
+2026-10-18                    1.0         Initial revision
+2026-10-18                    1.1         Messages kept in order
+2026-10-18                    1.2         Oversized messages dropped and counted
+
+"""
+
+
+##################
+# Import section #
+#
+#Built-in libraries
+import types
+
+#External libraries
+from zmq.eventloop import ioloop
+
+#Internal libraries
+from . import SourceRoutine,TargetRoutine
+from .. import agenda
+from .. import persist
+from ..memory import MemoryChannel
+#
+##################
+
+
+##################
+# Export section #
+#
+__all__ = ["MemorySubscribe",
+           "MemoryPublish"]
+#
+##################
+
+
+####################
+# Constant section #
+#
+__version__ = "1.2"#current version [major.minor]
+#
+####################
+
+
+memory_subscribe = persist.ObjectPersistance()
+
+@memory_subscribe.type(persist.SOURCE_OBJECT)
+class MemorySubscribe(SourceRoutine):
+    """Story:  Subscribe from channel
+    
+    IN ORDER TO be synchronized with segments on the same host
+    AS A generic segment
+    I WANT TO receive messages through shared memory
+    
+    """
+    
+    """Specification:  Subscribe from channel
+    
+    GIVEN a channel
+        AND an address (prefix of the envelope)
+        AND a downstream pipeline (default null)
+    
+    Scenario 1:  Channel woken
+    WHEN the channel wakes the subscriber
+    THEN the first message with a matching envelope SHALL be sent
+        downstream
+        AND the other messages with a matching envelope SHALL be scheduled
+            downstream after it (in order)
+    
+    Scenario 2:  Messages lost
+    WHEN the subscriber was lapped by the publishers
+    THEN the number of lost messages SHALL be logged
+    
+    """
+    
+    name = "Memory.Subscribe"
+    type = agenda.HANDLER
+    event = ioloop.POLLIN
+    
+    def __init__(self):
+        SourceRoutine.__init__(self)
+        
+        self._address = ""
+        self._channel = None
+        
+        self.processor = agenda.Processor()
+    
+    @memory_subscribe.property
+    def channel(self):
+        return self._channel.name
+    
+    @channel.setter
+    def channel(self,channel):
+        assert isinstance(channel,types.StringTypes)
+        
+        if self._channel is not None:
+            self._channel.detach(self._wakeup)
+        
+        self._channel = MemoryChannel(channel)
+        self._wakeup,self._cursor = self._channel.attach()
+    
+    @property
+    def handle(self):
+        return self._wakeup
+    
+    @memory_subscribe.property
+    def address(self):
+        return self._address
+    
+    @address.setter
+    def address(self,address):
+        assert isinstance(address,types.StringTypes)
+        
+        self._address = address
+    
+    def signature(self):
+        return type(self),self._channel.name,self._address
+    
+    def _process(self,message,ipipe):
+        message = self._receive()
+        opipe = self.target if message is not None else None
+        
+        return message,opipe
+    
+    def _receive(self):
+        self._channel.drain(self._wakeup)
+        
+        records,self._cursor,lost = self._channel.read(self._cursor)
+        
+        if lost > 0:
+            self.journal.warn("{0}:  Lost {1:d} messages",lost)
+        
+        messages = [message for address,message in records
+                    if address.startswith(self._address)]
+        
+        if len(messages) > 0:
+            for message in messages[1:]:
+                self.processor.defer(message,self,self.target)
+            
+            self.journal.info("{0}:  From address {1}",self._address)
+            
+            return messages[0]
+
+
+memory_publish = persist.ObjectPersistance()
+
+@memory_publish.type(persist.TARGET_OBJECT)
+class MemoryPublish(TargetRoutine):
+    """Story:  Publish to channel
+    
+    IN ORDER TO synchronize segments on the same host
+    AS A generic segment
+    I WANT TO send messages through shared memory
+    
+    """
+    
+    """Specification:  Publish to channel
+    
+    GIVEN a channel
+        AND an address for the message envelope
+        AND a downstream pipeline (default null)
+    
+    Scenario 1:  Upstream message received
+    WHEN a message is received from upstream
+    THEN the message SHALL be published to the channel with the envelope
+        AND the message SHALL be sent downstream
+    
+    Scenario 2:  Message too large
+    WHEN a message is received from upstream
+        AND the message does not fit in a record of the channel
+    THEN the message SHALL be dropped (and logged)
+        AND the dropped count SHALL be incremented by one (1)
+    
+    """
+    
+    name = "Memory.Publish"
+    
+    def __init__(self):
+        TargetRoutine.__init__(self)
+        
+        self._address = ""
+        self._channel = None
+        
+        self.dropped = 0#messages too large for a record
+    
+    @memory_publish.property
+    def channel(self):
+        return self._channel.name
+    
+    @channel.setter
+    def channel(self,channel):
+        assert isinstance(channel,types.StringTypes)
+        
+        self._channel = MemoryChannel(channel)
+    
+    @memory_publish.property
+    def address(self):
+        return self._address
+    
+    @address.setter
+    def address(self,address):
+        assert isinstance(address,types.StringTypes)
+        
+        self._address = address
+    
+    def _send(self,message):
+        assert isinstance(message,types.StringTypes)
+        
+        try:
+            self._channel.publish(self._address,message)
+        except ValueError as error:
+            self.dropped += 1
+            
+            self.journal.error("{0}:  Dropped ({1!s})",error)
+        else:
+            self.journal.info("{0}:  To address {1}",self._address)
@@ -4,7 +4,7 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   10 Auguest 2013
+Modified:   18 October 2026
 
 Provides routines for message formatting.
 
@@ -19,6 +19,9 @@ MessageFormat -- Format message
 Date          Author          Version     Description
 ----------    ------------    --------    -----------------------------
 2013-08-10    shenely         1.0         Initial revision
+2026-10-18                    1.1         Journal logging
+2026-10-18                    1.2         Formats slotted objects
+2026-10-18                    1.3         Declared as pure
 
 """
 
@@ -27,13 +30,12 @@ Date          Author          Version     Description
 # Import section #
 #
 #Built-in libraries
-import logging
 import types
 
 #External libraries
 
 #Internal libraries
-from .. import encoder,decoder,BaseObject
+from .. import encoder,decoder,BaseObject,SlotObject
 from .. import persist
 from . import EventRoutine,ActionRoutine
 #
@@ -52,7 +54,7 @@ __all__ = ["MessageParse",
 ####################
 # Constant section #
 #
-__version__ = "1.0"#current version [major.minor]
+__version__ = "1.3"#current version [major.minor]
 #
 ####################
 
@@ -81,17 +83,16 @@ class MessageParse(EventRoutine):
     """
     
     name = "Message.Parse"
+    pure = True
     
     def _occur(self,string):
         assert isinstance(string,types.StringTypes)
         
-        logging.info("{0}:  Parsing from {1}".\
-                     format(self.name,string))
+        self.journal.info("{0}:  Parsing from {1}",string)
         
         message =  BaseObject(**decoder(string))
         
-        logging.info("{0}:  Parsed".\
-                     format(self.name))
+        self.journal.info("{0}:  Parsed")
                      
         return message
 
@@ -121,16 +122,15 @@ class MessageFormat(ActionRoutine):
     """
     
     name = "Message.Format"
+    pure = True
     
     def _execute(self,message):
-        assert isinstance(message,BaseObject)
+        assert isinstance(message,(BaseObject,SlotObject))
         
-        logging.info("{0}:  Formatting".\
-                     format(self.name))
+        self.journal.info("{0}:  Formatting")
         
         string = encoder(message)
         
-        logging.info("{0}:  Formatted to {1}".\
-                     format(self.name,string))
+        self.journal.info("{0}:  Formatted to {1}",string)
                      
         return string
\ No newline at end of file
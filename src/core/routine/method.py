@@ -4,7 +4,7 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   09 August 2013
+Modified:   18 October 2026
 
 Provides routines for working with properties and methods.
 
@@ -20,6 +20,7 @@ Date          Author          Version     Description
 ----------    ------------    --------    -----------------------------
 2013-06-29    shenely         1.0         Initial revision
 2013-08-09    shenely         1.1         Adding persistance logic
+2026-10-18                    1.2         Journal logging
 
 """
 
@@ -28,7 +29,6 @@ Date          Author          Version     Description
 # Import section #
 #
 #Built-in libraries
-import logging
 import types
 
 #External libraries
@@ -52,7 +52,7 @@ __all__ = ["PropertyTransfer",
 ####################
 # Constant section #
 #
-__version__ = "1.1"#current version [major.minor]
+__version__ = "1.2"#current version [major.minor]
 #
 ####################
 
@@ -112,13 +112,11 @@ class PropertyTransfer(ActionRoutine):
         self._target = getattr(self._target_cls,self._target_prop).fset
     
     def _execute(self,message):
-        logging.info("{0}:  Transferring proeprty".\
-                     format(self.name))
+        self.journal.info("{0}:  Transferring proeprty")
         
         self._target(self._target_obj,self._source(self._source_obj))
         
-        logging.info("{0}:  Transferred property".\
-                     format(self.name))
+        self.journal.info("{0}:  Transferred property")
                      
         return message
 
@@ -140,12 +138,10 @@ class MethodExecute(ActionRoutine):
         self._method = method
     
     def _execute(self,message):
-        logging.info("{0}:  Executing method".\
-                     format(self.name))
+        self.journal.info("{0}:  Executing method")
         
         message = self._method(message)
         
-        logging.info("{0}:  Executed method".\
-                     format(self.name))
+        self.journal.info("{0}:  Executed method")
                      
         return message
\ No newline at end of file
@@ -4,7 +4,7 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   10 August 2013
+Modified:   18 October 2026
 
 Provides routines for messages queues.
 
@@ -22,6 +22,11 @@ Date          Author          Version     Description
 2013-06-26    shenely         1.1         Modifying routine structure
 2013-08-09    shenely         1.2         Adding persistance logic
 2013-08-10    shenely         1.3         Removed epoch dependency
+2026-10-18                    1.4         Journal logging
+2026-10-18                    1.5         Memory-mapped queue type
+2026-10-18                    1.6         Overflow policies for put
+2026-10-18                    1.7         Mapped queue opened at first use
+2026-10-18                    1.8         Persisted maxsize; latest per key rejected for mapped queues
 
 """
 
@@ -30,8 +35,8 @@ Date          Author          Version     Description
 # Import section #
 #
 #Built-in libraries
-from Queue import Queue,PriorityQueue
-import logging
+from Queue import Queue,PriorityQueue,Empty
+import heapq
 import types
 
 #External libraries
@@ -39,6 +44,7 @@ import types
 #Internal libraries
 from . import EventRoutine,ActionRoutine
 from .. import persist
+from ..mapped import MappedQueue
 #
 ##################
 
@@ -56,7 +62,16 @@ __all__ = ["QueueObject",
 ####################
 # Constant section #
 #
-__version__ = "1.3"#current version [major.minor]
+__version__ = "1.8"#current version [major.minor]
+
+DROP_NEWEST = "newest"#incoming message is dropped
+DROP_OLDEST = "oldest"#head of the queue is dropped
+LATEST_PER_KEY = "latest"#queued message with the same key is replaced
+SAMPLE = "sample"#one in every N incoming messages replaces the head
+
+POLICIES = (DROP_NEWEST,DROP_OLDEST,LATEST_PER_KEY,SAMPLE)
+
+SAMPLE_RATE = 10
 #
 ####################
 
@@ -67,24 +82,84 @@ queue_object = persist.ObjectPersistance()
 class QueueObject(object):
     name = "Queue.Object"
     
+    _path = None
+    _type = None
+    _maxsize = 0#unbounded (mapped queues are bounded by their capacity)
+    _queue = None
+    
     @queue_object.property
     def type(self):
-        if isinstance(self._queue,Queue):
-            return "standard"
+        if isinstance(self._queue,MappedQueue):
+            return "mapped"
         elif isinstance(self._queue,PriorityQueue):
             return "priority"
+        elif isinstance(self._queue,Queue):
+            return "standard"
+        else:
+            return self._type#mapped queue not opened yet
     
     @type.setter
     def type(self,type):
         assert isinstance(type,types.StringTypes)
+        assert type in ("standard","priority","mapped")
+        
+        self._type = type
         
         if type == "standard":
-            self._queue = Queue()
+            self._queue = Queue(self._maxsize)
         elif type == "priority":
-            self._queue = PriorityQueue()
+            self._queue = PriorityQueue(self._maxsize)
+        elif type == "mapped":
+            self._queue = None#opened at first use (path may not be set yet)
+    
+    @queue_object.property
+    def maxsize(self):
+        return self._maxsize
+    
+    @maxsize.setter
+    def maxsize(self,maxsize):
+        assert isinstance(maxsize,types.IntType)
+        assert maxsize >= 0
+        
+        self._maxsize = maxsize
+        
+        if self._queue is not None:
+            self._bound(self._queue)
+    
+    def _bound(self,queue):
+        """Apply the maximum size to a queue (within a mapped capacity)"""
+        with queue.mutex:
+            if isinstance(queue,MappedQueue):
+                queue.maxsize = min(self._maxsize,queue.capacity) \
+                                if self._maxsize > 0 else queue.capacity
+            else:
+                queue.maxsize = self._maxsize
+        
+    @queue_object.property
+    def path(self):
+        return self._path
+    
+    @path.setter
+    def path(self,path):
+        assert isinstance(path,types.StringTypes)
+        
+        self._path = path
+        
+        if isinstance(self._queue,MappedQueue) and \
+           self._queue.path != path:
+            self._queue.close()
+            
+            self._queue = None#reopened at the new path
         
     @queue_object.property
     def queue(self):
+        if self._queue is None and self._type == "mapped":
+            assert self._path is not None#file of the ring buffer
+            
+            self._queue = MappedQueue(self._path)
+            
+            self._bound(self._queue)
+        
         return self._queue
     
     @queue.setter
@@ -138,13 +213,11 @@ class QueueGet(EventRoutine):
         if not self._queue.empty(): 
             message = self._queue.get()
                                 
-            logging.info("{0}:  Got from queue".\
-                         format(self.name))
+            self.journal.info("{0}:  Got from queue")
             
             return message
         else:
-            logging.warn("{0}:  Queue is empty".\
-                         format(self.name))
+            self.journal.warn("{0}:  Queue is empty")
 
 
 queue_put = persist.ObjectPersistance()
@@ -162,24 +235,63 @@ class QueuePut(ActionRoutine):
     """Specification:  Put to queue
     
     GIVEN a queue
+        AND an overflow policy (default drop newest)
+        AND a key attribute (for latest per key)
+        AND a sample rate (default 1 in 10)
         AND a downstream pipeline (default null)
-        AND a alternate (if full) pipeline (default null)
         
     Scenario 1:  Upstream message received
     WHEN a message is received from upstream
     THEN the message SHALL be added to the queue
         AND the message SHALL be sent downstream
         
-    Scenario 2:  Queue is full
+    Scenario 2:  Queue is full (drop newest)
+    WHEN a message is received from upstream
+        AND the queue is full
+    THEN the message SHALL be dropped
+        
+    Scenario 3:  Queue is full (drop oldest)
+    WHEN a message is received from upstream
+        AND the queue is full
+    THEN the message at the head of the queue SHALL be dropped
+        AND the message SHALL be added to the queue
+        
+    Scenario 4:  Queue is full (latest per key)
+    WHEN a message is received from upstream
+        AND the queue is full
+    THEN a queued message with the same key SHALL be replaced in place
+        AND the message SHALL be dropped if none has the same key
+        
+    Scenario 5:  Queue is full (sample)
     WHEN a message is received from upstream
         AND the queue is full
-    THEN the message SHALL be sent downstream (alternate route)
+    THEN one in every N messages SHALL replace the head of the queue
+        AND the other messages SHALL be dropped
+    
+    Scenario 6:  Message dropped
+    WHEN a message is dropped
+    THEN the dropped count of the policy SHALL be incremented by one (1)
+    
+    Scenario 7:  Latest per key on a mapped queue
+    WHEN the policy is latest per key
+        AND the queue is mapped
+    THEN a ValueError SHALL be raised (records cannot be replaced in place)
     
     """
     
     name = "Queue.Put"
+    
+    _policy = DROP_NEWEST
+    _key = None
+    _rate = SAMPLE_RATE
+    
+    def __init__(self):
+        ActionRoutine.__init__(self)
         
-    @queue_get.property
+        self.dropped = dict([(policy,0) for policy in POLICIES])
+        self.overflow = 0#messages received while full
+        
+    @queue_put.property
     def queue(self):
         return self._queue
     
@@ -187,16 +299,107 @@ class QueuePut(ActionRoutine):
     def queue(self,queue):
         assert isinstance(queue,Queue)
         
+        self._check(queue,self._policy)
+        
         self._queue = queue
+        
+    @queue_put.property
+    def policy(self):
+        return self._policy
+    
+    @policy.setter
+    def policy(self,policy):
+        assert isinstance(policy,types.StringTypes)
+        assert policy in POLICIES
+        
+        self._check(getattr(self,"_queue",None),policy)
+        
+        self._policy = POLICIES[POLICIES.index(policy)]#unicode from Mongo
+        
+    @queue_put.property
+    def key(self):
+        return self._key
+    
+    @key.setter
+    def key(self,key):
+        assert isinstance(key,types.StringTypes)
+        
+        self._key = key
+        
+    @queue_put.property
+    def rate(self):
+        return self._rate
+    
+    @rate.setter
+    def rate(self,rate):
+        assert isinstance(rate,types.IntType)
+        assert rate > 0
+        
+        self._rate = rate
+    
+    def _check(self,queue,policy):
+        """Reject a policy the queue cannot support"""
+        if policy == LATEST_PER_KEY and isinstance(queue,MappedQueue):
+            raise ValueError("{0}:  Latest per key is not supported by "\
+                             "mapped queues".format(self.name))
     
-    def _execute(self,message):        
+    def _execute(self,message):
         if not self._queue.full():
-            self._queue.put(message)
-                    
-            logging.info("{0}:  Put to queue".\
-                         format(self.name))
+            self._queue.put_nowait(message)
+            
+            self.journal.info("{0}:  Put to queue")
+            
+            return message
+        
+        self.overflow += 1
+        
+        if self._policy == DROP_OLDEST or \
+           (self._policy == SAMPLE and self.overflow % self._rate == 0):
+            self._evict()
+            
+            self._queue.put_nowait(message)
             
             return message
-        else:                    
-            logging.warn("{0}:  Queue is full".\
-                         format(self.name))
\ No newline at end of file
+        elif self._policy == LATEST_PER_KEY and self._replace(message):
+            return message
+        else:
+            self.dropped[self._policy] += 1
+            
+            self.journal.warn("{0}:  Queue is full")
+    
+    def _evict(self):
+        """Drop the head of the queue"""
+        try:
+            self._queue.get_nowait()
+        except Empty:
+            pass
+        else:
+            self.dropped[self._policy] += 1
+            
+            self.journal.info("{0}:  Dropped oldest")
+    
+    def _replace(self,message):
+        """Replace a queued message with the same key (in place)"""
+        assert self._key is not None
+        
+        key = getattr(message,self._key)
+        
+        with self._queue.mutex:
+            queued = self._queue.queue
+            
+            for index in xrange(len(queued)):
+                if getattr(queued[index],self._key,None) == key:
+                    queued[index] = message
+                    
+                    if isinstance(self._queue,PriorityQueue):
+                        heapq.heapify(queued)#replacement may reorder
+                    
+                    break
+            else:
+                return False
+        
+        self.dropped[self._policy] += 1
+        
+        self.journal.info("{0}:  Replaced latest for {1}",key)
+        
+        return True
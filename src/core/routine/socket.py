@@ -4,7 +4,7 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   10 August 2013
+Modified:   18 October 2026
 
 Provides routines for socket communication.
 
@@ -26,6 +26,11 @@ Date          Author          Version     Description
 2013-06-29    shenely         1.2         Address handled internally
 2013-08-09    shenely         1.3         Adding persistance logic
 2013-08-10    shenely         1.4         Adding request/response
+2026-10-18                    1.5         Journal logging
+2026-10-18                    1.6         Subscription signature
+2026-10-18                    1.7         Batched messages
+2026-10-18                    1.8         Batches kept in order
+2026-10-18                    1.9         Published messages counted in virtual time
 
 """
 
@@ -34,7 +39,6 @@ Date          Author          Version     Description
 # Import section #
 #
 #Built-in libraries
-import logging
 import types
 
 #External libraries
@@ -65,7 +69,7 @@ __all__ = ["SocketObject",
 ####################
 # Constant section #
 #
-__version__ = "1.4"#current version [major.minor]
+__version__ = "1.9"#current version [major.minor]
 #
 ####################
 
@@ -138,6 +142,13 @@ class SocketSubscribe(SourceRoutine):
         AND the message defines the content
     THEN the message SHALL be sent downstream
     
+    Scenario 2:  Batched message received
+    WHEN a message is received from the socket
+        AND the message defines an envelope
+        AND the message defines more than one content
+    THEN the first content SHALL be sent downstream
+        AND the other contents SHALL be scheduled downstream after it
+    
     """
     
     name = "Socket.Subscribe"
@@ -148,6 +159,8 @@ class SocketSubscribe(SourceRoutine):
         SourceRoutine.__init__(self)
         
         self._address = ""
+        
+        self.processor = agenda.Processor()
     
     @socket_subscribe.property
     def socket(self):
@@ -177,16 +190,26 @@ class SocketSubscribe(SourceRoutine):
         self._address = address
         
         self._socket.setsockopt(zmq.SUBSCRIBE,self._address)
+        
+        self.processor.subscribe(self,self._address)
+    
+    def signature(self):
+        return type(self),self._address#same subscription, same messages
     
     def _receive(self):
-        address,message = self._socket.recv_multipart()
+        frames = self._socket.recv_multipart()
+        address,message,others = frames[0],frames[1],frames[2:]
         
         assert isinstance(address,types.StringTypes)
         assert self.address in address
         assert isinstance(message,types.StringTypes)
+        
+        for other in others:
+            self.processor.defer(other,self,self.target)
+        
+        self.processor.received()
                 
-        logging.info("{0}:  From address {1}".\
-                     format(self.name,self._address))
+        self.journal.info("{0}:  From address {1}",self._address)
         
         return message
 
@@ -215,16 +238,31 @@ class SocketPublish(TargetRoutine):
     THEN the message SHALL be sent to the socket
         AND the message SHALL be sent downstream
     
+    Scenario 2:  Upstream message received (batched)
+    WHEN a message is received from upstream
+        AND a coalesce limit greater than one (1) is defined
+    THEN the message SHALL be held until the end of the event loop
+        iteration (or until the coalesce limit is reached)
+        AND the held messages SHALL be sent to the socket as one message
+            with one envelope
+        AND the message SHALL be sent downstream
+    
     """
     
     name = "Socket.Publish"
     type = agenda.HANDLER
     event = ioloop.POLLIN
     
+    _coalesce = 0#messages per frame (not batched)
+    
     def __init__(self):
         TargetRoutine.__init__(self)
         
         self._address = ""
+        
+        self.pending = list()
+        
+        self.processor = agenda.Processor()
     
     @socket_publish.property
     def socket(self):
@@ -250,14 +288,47 @@ class SocketPublish(TargetRoutine):
         assert isinstance(address,types.StringTypes)
         
         self._address = address
+        
+    @socket_publish.property
+    def coalesce(self):
+        return self._coalesce
+    
+    @coalesce.setter
+    def coalesce(self,coalesce):
+        assert isinstance(coalesce,types.IntType)
+        assert coalesce >= 0
+        
+        self._coalesce = coalesce
            
     def _send(self,message):
         assert isinstance(message,types.StringTypes)
         
-        self._socket.send_multipart((self._address,message))
+        if self._coalesce > 1:
+            self.pending.append(message)
+            
+            if len(self.pending) == 1:
+                self.processor.sent(self._address)#one frame per flush
+            
+            if len(self.pending) >= self._coalesce:
+                self.flush()
+            elif len(self.pending) == 1:
+                self.processor.loop.add_callback(self.flush)#end of tick
+        else:
+            self._socket.send_multipart((self._address,message))
+            
+            self.processor.sent(self._address)
                 
-        logging.info("{0}:  To address {1}".\
-                     format(self.name,self._address))
+            self.journal.info("{0}:  To address {1}",self._address)
+    
+    def flush(self):
+        """Send the held messages with one envelope"""
+        if len(self.pending) > 0:
+            self._socket.send_multipart([self._address] + self.pending)
+            
+            self.journal.info("{0}:  {1:d} messages to address {2}",
+                              len(self.pending),self._address)
+            
+            self.pending = list()
 
 
 socket_request = persist.ObjectPersistance()
@@ -324,8 +395,7 @@ class SocketRequest(SourceRoutine):
         
         self._address = address
                 
-        logging.info("{0}:  From address {1}".\
-                     format(self.name,self._address))
+        self.journal.info("{0}:  From address {1}",self._address)
         
         return message
 
@@ -391,5 +461,4 @@ class SocketRespond(TargetRoutine):
         
         self._socket.send_multipart((self._address,message))
                 
-        logging.info("{0}:  To address {1}".\
-                     format(self.name,self._address))
+        self.journal.info("{0}:  To address {1}",self._address)
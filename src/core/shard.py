@@ -0,0 +1,141 @@
+#!/usr/bin/env python2.7
+
+"""Shard service
+
+Author(s):  Sean Henely
+Language:   Python 2.x
+Modified:   18 October 2026
+
+Provides a pool of worker processes, each running its own processor.
+
+Classes:
+ShardPool -- Pool of sharded applications
+"""
+
+"""Change log:
+
+Date          Author          Version     Description
+----------    ------------    --------    -----------------------------
+2026-10-18                    1.0         Initial revision
+2026-10-18                    1.1         Partitioned on one key
+
+"""
+
+
+##################
+# Import section #
+#
+#Built-in libraries
+from multiprocessing import Process,cpu_count
+import logging
+import types
+
+#External libraries
+
+#Internal libraries
+from . import agenda
+from . import engine
+#
+##################
+
+
+##################
+# Export section #
+#
+__all__ = ["ShardPool"]
+#
+##################
+
+
+####################
+# Constant section #
+#
+__version__ = "1.1"#current version [major.minor]
+
+SHARD_COUNT = cpu_count()#one shard per core
+#
+####################
+
+
+class ShardPool(object):
+    """Story:  Sharded processor
+    
+    IN ORDER TO model more assets than a single core can process
+    AS A generic segment
+    I WANT TO spread behaviors and assets across worker processes
+    
+    """
+    
+    """Specification:  Sharded processor
+    
+    GIVEN an application name
+        AND a number of shards (default one per core)
+        AND a setup function for segments (default null)
+    
+    Scenario 1:  Pool started
+    WHEN the pool is started
+    THEN a worker process SHALL be started for each shard
+        AND each worker SHALL run its own application and processor
+        AND each worker SHALL only build the stories it owns
+        AND each asset SHALL be modeled by exactly one worker
+    
+    Scenario 2:  Epoch received
+    WHEN an epoch is published to the broker
+    THEN every shard SHALL receive the epoch from its own subscription
+        AND results SHALL be published back through the broker
+    
+    """
+    
+    def __init__(self,name,count=SHARD_COUNT,setup=None):
+        assert isinstance(name,types.StringTypes)
+        assert isinstance(count,types.IntType)
+        assert count > 0
+        assert callable(setup) or setup is None
+        
+        object.__init__(self)
+        
+        self.name = name
+        self.count = count
+        self.setup = setup
+        
+        self.workers = list()
+    
+    def __call__(self,index):
+        #sockets, event loop and database connection are not fork-safe
+        agenda.Processor.reset()
+        engine.Application.self.clear()
+        
+        application = engine.Application(self.name)
+        application.shard = index
+        application.shards = self.count
+        
+        logging.info("Shard:  Starting {0:d} of {1:d}".\
+                     format(index + 1,self.count))
+        
+        if self.setup is not None:
+            self.setup(application)
+        
+        application.build()
+        application.start()
+    
+    def start(self):
+        for index in range(self.count):
+            worker = Process(target=self,
+                             args=(index,),
+                             name="{0}.Shard{1:d}".format(self.name,index))
+            worker.daemon = True
+            worker.start()
+            
+            self.workers.append(worker)
+    
+    def join(self):
+        for worker in self.workers:
+            worker.join()
+    
+    def stop(self):
+        for worker in self.workers:
+            worker.terminate()
+        else:
+            self.join()
+            
+            del self.workers[:]
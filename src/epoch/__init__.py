@@ -4,20 +4,24 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   03 July 2013
+Modified:   18 October 2026
 
-Provides the epoch state object.
+Provides the epoch state and queue objects.
 
 Classes:
 EpochState  -- Epoch state
+EpochQueue  -- Epoch-ordered queue
 
 """
 
 """Change log:
-                                        
+
 Date          Author          Version     Description
 ----------    ------------    --------    -----------------------------
 2013-07-03    shenely         1.0         Initial revision
+2026-10-18                    1.1         Slotted state
+2026-10-18                    1.2         Trusted constructors
+2026-10-18                    1.3         Epoch-ordered queue
 
 """
 
@@ -27,11 +31,14 @@ Date          Author          Version     Description
 #
 #Built-in libraries
 from datetime import datetime
+import heapq
+import itertools
+import types
 
 #External libraries
 
 #Internal libraries
-from core import BaseObject
+from core import SlotObject
 #
 ##################
 
@@ -39,7 +46,8 @@ from core import BaseObject
 ##################
 # Export section #
 #
-__all__ = ["EpochState"]
+__all__ = ["EpochState",
+           "EpochQueue"]
 #
 ##################
 
@@ -47,15 +55,110 @@ __all__ = ["EpochState"]
 ####################
 # Constant section #
 #
-__version__ = "1.0"#current version [major.minor]
+__version__ = "1.3"#current version [major.minor]
 #
 ####################
 
 
-class EpochState(BaseObject):
+class EpochState(SlotObject):
+    __slots__ = ("epoch",)
+    
     def __init__(self,epoch,*args,**kwargs):
-        BaseObject.__init__(self,*args,**kwargs)
+        SlotObject.__init__(self,*args,**kwargs)
         
         assert isinstance(epoch,datetime)
         
-        self.epoch = epoch
\ No newline at end of file
+        self.epoch = epoch
+    
+    @classmethod
+    def trusted(cls,epoch):
+        """Construct without validation (for internally computed values)"""
+        self = cls.__new__(cls)
+        
+        self._object_id = None
+        self.epoch = epoch
+        
+        return self
+
+class EpochQueue(object):
+    """Story:  Epoch-ordered queue
+    
+    IN ORDER TO buffer states and telemetry until they are due
+    AS A generic segment
+    I WANT TO keep messages in order of epoch
+    
+    """
+    
+    """Specification:  Epoch-ordered queue
+    
+    GIVEN a maximum size (default unbounded)
+    
+    Scenario 1:  Message put
+    WHEN a message with an epoch is put to the queue
+    THEN the message SHALL be kept in order of epoch (then of arrival)
+    
+    Scenario 2:  Head requested
+    WHEN the head of the queue is peeked
+    THEN the earliest message SHALL be returned without removing it
+    
+    Scenario 3:  Messages due
+    WHEN the messages up to an epoch are popped
+    THEN every message at or before the epoch SHALL be removed from the
+        queue and returned in order of epoch
+    
+    Scenario 4:  Messages expired
+    WHEN the messages up to an epoch are expired
+    THEN every message at or before the epoch SHALL be removed
+        AND the number of messages removed SHALL be returned
+    
+    """
+    
+    def __init__(self,maxsize=0):
+        assert isinstance(maxsize,types.IntType)
+        
+        object.__init__(self)
+        
+        self.maxsize = maxsize
+        
+        self.heap = list()
+        self.order = itertools.count()#ties broken by arrival
+    
+    def __len__(self):
+        return len(self.heap)
+    
+    def empty(self):
+        return len(self.heap) == 0
+    
+    def full(self):
+        return 0 < self.maxsize <= len(self.heap)
+    
+    def put(self,message):
+        assert isinstance(message,EpochState)
+        
+        heapq.heappush(self.heap,(message.epoch,next(self.order),message))
+    
+    def peek(self):
+        return self.heap[0][2] if len(self.heap) > 0 else None
+    
+    def get(self):
+        return heapq.heappop(self.heap)[2]
+    
+    def pop_until(self,epoch):
+        """Remove and return the messages at or before an epoch"""
+        messages = list()
+        
+        while len(self.heap) > 0 and self.heap[0][0] <= epoch:
+            messages.append(heapq.heappop(self.heap)[2])
+        
+        return messages
+    
+    def expire(self,epoch):
+        """Remove the messages at or before an epoch (number removed)"""
+        count = len(self.heap)
+        
+        if count > 0 and self.heap[0][0] <= epoch:
+            self.heap = [entry for entry in self.heap if entry[0] > epoch]
+            
+            heapq.heapify(self.heap)
+        
+        return count - len(self.heap)
@@ -4,7 +4,7 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   09 September 2013
+Modified:   18 October 2026
 
 Provides routines for order tasks.
 
@@ -24,6 +24,9 @@ Date          Author          Version     Description
 2013-06-29    shenely         1.2         Addresses handled by sockets
 2013-07-11    shenely                     Added assert statements
 2013-09-09    shenely         1.3         Adding persistance logic
+2026-10-18                    1.4         Epochs are epoch-critical
+2026-10-18                    1.5         Journal logging
+2026-10-18                    1.6         Declared as pure
 
 """
 
@@ -32,7 +35,6 @@ Date          Author          Version     Description
 # Import section #
 #
 #Built-in libraries
-import logging
 import types
 
 #External libraries
@@ -41,6 +43,7 @@ import types
 from core import encoder,decoder
 from core.routine import EventRoutine,ActionRoutine
 from core import persist
+from core import agenda
 from .. import EpochState
 #
 ##################
@@ -58,7 +61,7 @@ __all__ = ["EpochParse",
 ####################
 # Constant section #
 #
-__version__ = "1.3"#current version [major.minor]
+__version__ = "1.6"#current version [major.minor]
 #
 ####################
 
@@ -87,17 +90,17 @@ class EpochParse(EventRoutine):
     """
     
     name = "Epoch.Parse"
+    priority = agenda.CRITICAL
+    pure = True
     
     def _occur(self,message):
         assert isinstance(message,types.StringTypes)
         
-        logging.info("{0}:  Parsing from {1}".\
-                     format(self.name,message))
+        self.journal.info("{0}:  Parsing from {1}",message)
         
         epoch =  EpochState(**decoder(message))
         
-        logging.info("{0}:  Parsed to {1}".\
-                     format(self.name,epoch.epoch))
+        self.journal.info("{0}:  Parsed to {1}",epoch.epoch)
                      
         return epoch
 
@@ -127,16 +130,16 @@ class EpochFormat(ActionRoutine):
     """
     
     name = "Epoch.Format"
+    priority = agenda.CRITICAL
+    pure = True
     
     def _execute(self,epoch):
         assert isinstance(epoch,EpochState)
         
-        logging.info("{0}:  Formatting from {1}".\
-                     format(self.name,epoch.epoch))
+        self.journal.info("{0}:  Formatting from {1}",epoch.epoch)
         
         message = encoder(epoch)
         
-        logging.info("{0}:  Formatted to {1}".\
-                     format(self.name,message))
+        self.journal.info("{0}:  Formatted to {1}",message)
                      
         return message
\ No newline at end of file
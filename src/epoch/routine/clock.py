@@ -4,7 +4,7 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   09 September 2013
+Modified:   18 October 2026
 
 Provides routines for driving the simulation clock.
 
@@ -23,6 +23,10 @@ Date          Author          Version     Description
 2013-07-25    shenely                     Adjusted timeout
 2013-07-28    shenely                     Upped the timeout (againt)
 2013-09-09    shenely         1.3         Adding persistance logic
+2026-10-18                    1.4         Next epoch for virtual time
+2026-10-18                    1.5         Journal logging
+2026-10-18                    1.6         Trusted construction in inner loop
+2026-10-18                    1.7         Float scales in virtual time
 
 """
 
@@ -32,7 +36,6 @@ Date          Author          Version     Description
 #
 #Built-in libraries
 from datetime import datetime,timedelta
-import logging
 import types
 
 #External libraries
@@ -59,7 +62,7 @@ __all__ = ["ContinuousClock",
 ####################
 # Constant section #
 #
-__version__ = "1.3"#current version [major.minor]
+__version__ = "1.7"#current version [major.minor]
 
 J2000 = datetime(2000,1,1,12,tzinfo=utc)#Julian epoch (2000-01-01T12:00:00Z)
 
@@ -103,6 +106,14 @@ class ContinuousClock(SourceRoutine):
     THEN the clock scale rate SHALL be modified to the upstream value
         AND the simulation time SHALL be requested
     
+    Scenario 3:  Simulation time requested in virtual time
+    WHEN the clock value is requested from upstream
+        AND the processor is in virtual-time mode
+    THEN the elapsed time SHALL be the clock timeout
+        AND the simulation time SHALL be increased by the scaled
+            elapsed time
+        AND the simulation time SHALL be sent downstream
+    
     """
     
     name = "Clock.Continuous"
@@ -112,8 +123,12 @@ class ContinuousClock(SourceRoutine):
     def __init__(self,scale=CLOCK_SCALE):
         SourceRoutine.__init__(self)
         
+        self._scale = scale
+        
         self.now = datetime.utcnow()
         
+        self.processor = agenda.Processor()
+        
     @continuous_clock.property
     def epoch(self):
         return self._epoch
@@ -134,19 +149,24 @@ class ContinuousClock(SourceRoutine):
         
         self._scale = scale
     
+    @property
+    def next(self):
+        return self._epoch + timedelta(milliseconds=self.timeout * self._scale)
+    
     def _receive(self):
-        logging.info("{0}:  Ticking from {1}".\
-                     format(self.name,self._epoch))
+        self.journal.info("{0}:  Ticking from {1}",self._epoch)
         
         self.past = self.now
-        self.now = datetime.utcnow()
-            
-        self._epoch += self._scale * (self.now - self.past)#increase simulation time
+        self.now = self.past + timedelta(milliseconds=self.timeout) \
+                   if self.processor.virtual else datetime.utcnow()
+        
+        #scaled in seconds (timedelta only multiplies by integers)
+        self._epoch += timedelta(seconds=self._scale * \
+                                 (self.now - self.past).total_seconds())
         
-        logging.info("{0}:  Ticked to {1}".\
-                     format(self.name,self._epoch))
+        self.journal.info("{0}:  Ticked to {1}",self._epoch)
         
-        return EpochState(self._epoch)
+        return EpochState.trusted(self._epoch)
 
 discrete_clock = persist.ObjectPersistance()
 
@@ -177,6 +197,11 @@ class DiscreteClock(SourceRoutine):
     THEN the clock step size SHALL be modified to the upstream value
         AND the simulation time SHALL be requested
     
+    Scenario 3:  Next tick requested
+    WHEN the epoch of the next tick is requested (for virtual time)
+    THEN the simulation time increased by the clock step size SHALL be
+        returned
+    
     """
     
     name = "Clock.Discrete"
@@ -202,14 +227,16 @@ class DiscreteClock(SourceRoutine):
         assert isinstance(step,timedelta)
         
         self._step = step
+    
+    @property
+    def next(self):
+        return self._epoch + self._step
         
     def _receive(self):
-        logging.info("{0}:  Ticking from {1}".\
-                     format(self.name,self._epoch))
+        self.journal.info("{0}:  Ticking from {1}",self._epoch)
         
         self._epoch += self._step#increase simulation time
         
-        logging.info("{0}:  Ticked to {1}".\
-                     format(self.name,self._epoch))
+        self.journal.info("{0}:  Ticked to {1}",self._epoch)
         
-        return EpochState(self._epoch)
+        return EpochState.trusted(self._epoch)
@@ -4,7 +4,7 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   09 September 2013
+Modified:   18 October 2026
 
 Provides routines for order tasks.
 
@@ -22,6 +22,7 @@ Date          Author          Version     Description
 2013-06-26    shenely         1.1         Modifying routine structure
 2013-06-29    shenely         1.2         Adding methods
 2013-09-09    shenely         1.3         Adding persistence logic
+2026-10-18                    1.4         Journal logging
 
 """
 
@@ -31,7 +32,6 @@ Date          Author          Version     Description
 #
 #Built-in libraries
 from datetime import timedelta
-import logging
 import types
 
 #External libraries
@@ -56,7 +56,7 @@ __all__ = ["BeforeEpoch",
 ####################
 # Constant section #
 #
-__version__ = "1.3"#current version [major.minor]
+__version__ = "1.4"#current version [major.minor]
 #
 ####################
 
@@ -119,8 +119,7 @@ class BeforeEpoch(ConditionRoutine):
     def _satisfy(self,message):
         before = self._reference.epoch - message.epoch
         
-        logging.info("{0}:  Before by {1}".\
-                     format(self.name,before))
+        self.journal.info("{0}:  Before by {1}",before)
             
         return before > self._margin
         
@@ -182,7 +181,6 @@ class AfterEpoch(ConditionRoutine):
     def _satisfy(self,message):
         after = message.epoch - self._reference.epoch
         
-        logging.info("{0}:  After by {1}".\
-                     format(self.name,after))
+        self.journal.info("{0}:  After by {1}",after)
         
         return after > self._margin
\ No newline at end of file
@@ -4,12 +4,12 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   09 August 2013
+Modified:   18 October 2026
 
-Provides routines for prioritizing messages queues.
+Provides routines for epoch-ordered message queues.
 
 Classes:
-PriorityGet  -- Get from queue
+PriorityGet  -- Get due messages from queue
 PriorityPut  -- Put to queue
 
 """
@@ -21,6 +21,9 @@ Date          Author          Version     Description
 2013-05-02    shenely         1.0         Initial revision
 2013-06-26    shenely         1.1         Modifying routine structure
 2013-08-09    shenely         1.2         Adding persistance logic
+2026-10-18                    1.3         Journal logging
+2026-10-18                    1.4         Epoch queue with due and expired messages
+2026-10-18                    1.5         Due messages kept in order
 
 """
 
@@ -29,18 +32,15 @@ Date          Author          Version     Description
 # Import section #
 #
 #Built-in libraries
-from datetime import datetime
-from Queue import PriorityQueue
-import logging
-import types
+from datetime import timedelta
 
 #External libraries
-from bson.tz_util import utc
 
 #Internal libraries
 from core.routine import EventRoutine,ActionRoutine
-from .. import EpochState
+from core import agenda
 from core import persist
+from .. import EpochState,EpochQueue
 #
 ##################
 
@@ -57,44 +57,60 @@ __all__ = ["PriorityGet",
 ####################
 # Constant section #
 #
-__version__ = "1.2"#current version [major.minor]
-
-J2000 = datetime(2000,1,1,12,tzinfo=utc)#Julian epoch (2000-01-01T12:00:00Z)
+__version__ = "1.5"#current version [major.minor]
 #
 ####################
 
 
-priority_get = persist.RoutinePersistance()
+priority_get = persist.ObjectPersistance()
 
-@priority_get.type(persist.EVENT_ROUTINE)
+@priority_get.type(persist.EVENT_OBJECT)
 class PriorityGet(EventRoutine):
     """Story:  Get from Queue
     
-    IN ORDER TO process important messages first
+    IN ORDER TO process messages when they are due
     AS A generic segment
-    I WANT TO retrieve the highest priority message from a queue
+    I WANT TO retrieve every due message from an epoch-ordered queue
     
     """
     
     """Specification:  Get from queue
     
-    GIVEN a priority queue
+    GIVEN an epoch queue
+        AND a lower margin (default zero)
+        AND an upper margin (default zero)
         AND a downstream pipeline (default null)
-        AND a alternate (if empty) pipeline (default null)
         
-    Scenario 1:  Message requested
-    WHEN a message is requested from upstream
-    THEN highest priority message SHALL be removed from the queue
-        AND the message SHALL be sent downstream
+    Scenario 1:  Expired messages
+    WHEN an epoch is received from upstream
+    THEN the messages at or before the epoch plus the lower margin SHALL
+        be removed from the queue
+        
+    Scenario 2:  Due messages
+    WHEN an epoch is received from upstream
+    THEN the messages at or before the epoch plus the upper margin SHALL
+        be removed from the queue
+        AND the first message SHALL be sent downstream
+        AND the other messages SHALL be scheduled downstream after it
+            (in order)
         
-    Scenario 2:  Queue is empty
-    WHEN a message is requested from upstream
-        AND the queue is empty
-    THEN a blank message SHALL be sent downstream (alternate route)
+    Scenario 3:  No message due
+    WHEN an epoch is received from upstream
+        AND no message is due
+    THEN no message SHALL be sent downstream
+        AND the queue SHALL NOT be changed (no requeue)
     
     """
     
     name = "Priority.Get"
+    
+    _lower = timedelta(0)
+    _upper = timedelta(0)
+    
+    def __init__(self):
+        EventRoutine.__init__(self)
+        
+        self.processor = agenda.Processor()
         
     @priority_get.property
     def queue(self):
@@ -102,48 +118,71 @@ class PriorityGet(EventRoutine):
     
     @queue.setter
     def queue(self,queue):
-        assert isinstance(queue,PriorityQueue)
+        assert isinstance(queue,EpochQueue)
         
         self._queue = queue
+        
+    @priority_get.property
+    def lower(self):
+        return self._lower
+    
+    @lower.setter
+    def lower(self,lower):
+        assert isinstance(lower,timedelta)
+        
+        self._lower = lower
+        
+    @priority_get.property
+    def upper(self):
+        return self._upper
+    
+    @upper.setter
+    def upper(self,upper):
+        assert isinstance(upper,timedelta)
+        
+        self._upper = upper
     
     def _occur(self,message):
-        if not self._queue.empty(): 
-            priority,message = self._queue.get()
+        assert isinstance(message,EpochState)
+        
+        count = self._queue.expire(message.epoch + self._lower)
+        
+        if count > 0:
+            self.journal.warn("{0}:  Expired {1:d} messages",count)
+        
+        messages = self._queue.pop_until(message.epoch + self._upper)
+        
+        if len(messages) > 0:
+            for other in messages[1:]:
+                self.processor.defer(other,self,self.target)
             
-            assert isinstance(priority,(types.IntType,types.FloatType))
-                    
-            logging.info("{0}:  Got with priority {1}".\
-                         format(self.name,priority))
+            self.journal.info("{0}:  Got {1:d} due messages",len(messages))
             
-            return message
-        else:
-            logging.warn("{0}:  Queue is empty".\
-                         format(self.name))
+            return messages[0]
 
 
-priority_put = persist.RoutinePersistance()
+priority_put = persist.ObjectPersistance()
 
-@priority_put.type(persist.ACTION_ROUTINE)
+@priority_put.type(persist.ACTION_OBJECT)
 class PriorityPut(ActionRoutine):
     """Story:  Put to queue
     
-    IN ORDER TO process important messages first
+    IN ORDER TO process messages when they are due
     AS A generic segment
-    I WANT TO prioritize messages in a queue
+    I WANT TO order messages in a queue by epoch
     
     """
     
     """Specification:  Put to queue
     
-    GIVEN a priority queue
+    GIVEN an epoch queue
         AND a downstream pipeline (default null)
         AND a alternate (if full) pipeline (default null)
         
     Scenario 1:  Upstream message received
     WHEN a message is received from upstream
         AND the message defines an epoch
-    THEN lower (earlier) epochs SHALL be given higher priority
-        AND the message (with priority) SHALL be added to the queue
+    THEN the message SHALL be added to the queue in order of epoch
         AND the message SHALL be sent downstream
         
     Scenario 2:  Queue is full
@@ -161,22 +200,18 @@ class PriorityPut(ActionRoutine):
     
     @queue.setter
     def queue(self,queue):
-        assert isinstance(queue,PriorityQueue)
+        assert isinstance(queue,EpochQueue)
         
         self._queue = queue
     
     def _execute(self,message):
-        assert isinstance(message,EpochState)#TODO:  Create EpochState (also, rename)
-        
-        priority = (message.epoch - J2000).total_seconds()        
+        assert isinstance(message,EpochState)
         
         if not self._queue.full():
-            self._queue.put((priority,message))
-                    
-            logging.info("{0}:  Put with priority {1}".\
-                         format(self.name,priority))
+            self._queue.put(message)
+            
+            self.journal.info("{0}:  Put at {1}",message.epoch)
             
             return message
-        else:                    
-            logging.warn("{0}:  Queue is full".\
-                         format(self.name))
\ No newline at end of file
+        else:
+            self.journal.warn("{0}:  Queue is full")
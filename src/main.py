@@ -1,27 +1,71 @@
+import argparse
+import importlib
 import logging
+import time
 
-from core import broker
-from core import engine
-from core import persist
-from core import service
-from core import web
+#segment modules, dependencies first (core.persist and core.service import
+#core.engine), so each import is timed on its own
+MODULES = ("core.engine",
+           "core.persist",
+           "core.broker",
+           "core.service",
+           "web")
+
+def timed(profile,phase,function,*args):
+    start = time.time()
+    result = function(*args)
+    profile[phase] = profile.get(phase,0.0) + time.time() - start
+    
+    return result
+
+def load(profile):
+    """Import the segment modules (timed apart from their main calls)"""
+    return [timed(profile,name,importlib.import_module,name)
+            for name in MODULES]
+
+def report(profile):
+    for name in MODULES:
+        logging.info("Startup:  Imported {0} in {1:.3f} s".\
+                     format(name,profile[name]))
+    
+    logging.info("Startup:  Imports took {0:.3f} s".\
+                 format(sum(profile[name] for name in MODULES)))
+    logging.info("Startup:  Persistence registration took {0:.3f} s".\
+                 format(profile.get("persist",0.0)))
+    logging.info("Startup:  Graph build took {0:.3f} s".\
+                 format(profile.get("build",0.0)))
 
 def main():
+    parser = argparse.ArgumentParser(description="PyGS segment")
+    parser.add_argument("--profile-startup",action="store_true",
+                        help="report time spent on imports, persistence "
+                             "registration and graph build")
+    args = parser.parse_args()
+    
     logging.basicConfig(level=logging.DEBUG)
     
+    profile = dict()
+    
+    engine,persist,broker,service,web = load(profile)
+    
     broker.main()
-    persist.main()
+    timed(profile,"persist",persist.main)
     
     application = engine.Application("PyGS")
-        
+    
     #clock = ClockSegment(application)
     #space = SpaceSegment(application)
     #ground = GroundSegment(application)
-    web.WebService()
+    web.main()
     
     service.CoreService()
     
-    application.start()
+    timed(profile,"build",application.build)
     
+    if args.profile_startup:
+        report(profile)
+    
+    application.start()
+
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
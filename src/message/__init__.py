@@ -4,7 +4,7 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   26 July 2013
+Modified:   18 October 2026
 
 Provides the message objects.
 
@@ -24,6 +24,7 @@ Date          Author          Version     Description
 2013-07-18    shenely         1.1         Builds data from message type
 2013-07-24    shenely         1.2         Exports constants
 2013-07-26    shenely         1.3         Moved type check out of base
+2026-10-18                    1.4         Slotted messages
 
 """
 
@@ -64,7 +65,7 @@ __all__ = ["TelemetryMessage",
 ####################
 # Constant section #
 #
-__version__ = "1.3"#current version [major.minor]
+__version__ = "1.4"#current version [major.minor]
 
 ORBIT_TELEMETRY = 10
 INERTIAL_PRODUCT = 20
@@ -74,6 +75,8 @@ GEOGRAPHIC_PRODUCT = 21
 
 
 class BaseMessage(EpochState):
+    __slots__ = ("data","type")
+    
     def __init__(self,epoch,data,type,*args,**kwargs):
         EpochState.__init__(self,epoch,*args,**kwargs)
         
@@ -83,17 +86,23 @@ class BaseMessage(EpochState):
         self.type = type
 
 class TelemetryMessage(BaseMessage):
+    __slots__ = ()
+    
     def __init__(self,epoch,data,type,*args,**kwargs):
         BaseMessage.__init__(self,epoch,data,type,*args,**kwargs)
         
         if type == ORBIT_TELEMETRY:
             self.data = InertialState(**self.data)
 
-class CommandMessage(BaseMessage):pass
+class CommandMessage(BaseMessage):
+    __slots__ = ()
 
-class AcknowledgeMessage(BaseMessage):pass
+class AcknowledgeMessage(BaseMessage):
+    __slots__ = ()
 
 class ProductMessage(BaseMessage):
+    __slots__ = ()
+    
     def __init__(self,epoch,data,type,*args,**kwargs):
         BaseMessage.__init__(self,epoch,data,type,*args,**kwargs)
         
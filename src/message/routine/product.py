@@ -4,7 +4,7 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   24 July 2013
+Modified:   18 October 2026
 
 Provides routines for product manipulation.
 
@@ -21,6 +21,9 @@ Date          Author          Version     Description
 ----------    ------------    --------    -----------------------------
 2013-07-17    shenely         1.0         Initial revision
 2013-07-24    shenely         1.1         Was failing on no event
+2026-10-18                    1.2         Formatting is bulk work
+2026-10-18                    1.3         Journal logging
+2026-10-18                    1.4         Declared as pure
 
 """
 
@@ -29,7 +32,6 @@ Date          Author          Version     Description
 # Import section #
 #
 #Built-in libraries
-import logging
 import types
 
 #External libraries
@@ -37,6 +39,7 @@ import types
 #Internal libraries
 from core import encoder,decoder
 from core.routine import EventRoutine,ActionRoutine
+from core import agenda
 from .. import *
 from epoch import EpochState
 #
@@ -56,7 +59,7 @@ __all__ = ["ParseProduct",
 ####################
 # Constant section #
 #
-__version__ = "1.1"#current version [major.minor]
+__version__ = "1.4"#current version [major.minor]
 #
 ####################
 
@@ -82,17 +85,16 @@ class ParseProduct(EventRoutine):
     """
     
     name = "Product.Parse"
+    pure = True
     
     def _occur(self,message):
         assert isinstance(message,types.StringTypes)
         
-        logging.info("{0}:  Parsing from {1}".\
-                     format(self.name,message))
+        self.journal.info("{0}:  Parsing from {1}",message)
         
         telemetry =  ProductMessage(**decoder(message))
         
-        logging.info("{0}:  Parsed to {1}".\
-                     format(self.name,telemetry.epoch))
+        self.journal.info("{0}:  Parsed to {1}",telemetry.epoch)
                      
         return telemetry
 
@@ -118,17 +120,17 @@ class FormatProduct(ActionRoutine):
     """
     
     name = "Product.Format"
+    priority = agenda.BULK
+    pure = True
     
     def _execute(self,product):
         assert isinstance(product,ProductMessage)
         
-        logging.info("{0}:  Formatting from {1}".\
-                     format(self.name,product.epoch))
+        self.journal.info("{0}:  Formatting from {1}",product.epoch)
         
         message = encoder(product)
         
-        logging.info("{0}:  Formatted to {1}".\
-                     format(self.name,message))
+        self.journal.info("{0}:  Formatted to {1}",message)
                      
         return message
 
@@ -167,8 +169,7 @@ class GenerateProduct(ActionRoutine):
         
         product = ProductMessage(epoch,message,self.type)
         
-        logging.info("{0}:  Formatted at {1}".\
-                     format(self.name,product.epoch))
+        self.journal.info("{0}:  Formatted at {1}",product.epoch)
                      
         return product
 
@@ -192,6 +193,7 @@ class ExtractInertial(EventRoutine):
     """
     
     name = "State.Extract"
+    pure = True
     
     def _occur(self,message):
         assert isinstance(message,ProductMessage)
@@ -221,6 +223,7 @@ class ExtractGeographic(EventRoutine):
     """
     
     name = "State.Extract"
+    pure = True
     
     def _occur(self,message):
         assert isinstance(message,ProductMessage)
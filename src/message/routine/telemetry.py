@@ -4,7 +4,7 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   24 July 2013
+Modified:   18 October 2026
 
 Provides routines for telemetry manipulation.
 
@@ -24,6 +24,9 @@ Date          Author          Version     Description
 2013-07-17    shenely         1.1         Added ExtractState
 2013-07-19    shenely         1.2         Mirrored changes in product
 2013-07-24    shenely         1.3         Was failing on no event
+2026-10-18                    1.4         Formatting is bulk work
+2026-10-18                    1.5         Journal logging
+2026-10-18                    1.6         Declared as pure
 
 """
 
@@ -32,7 +35,6 @@ Date          Author          Version     Description
 # Import section #
 #
 #Built-in libraries
-import logging
 import types
 
 #External libraries
@@ -40,6 +42,7 @@ import types
 #Internal libraries
 from core import encoder,decoder
 from core.routine import EventRoutine,ActionRoutine
+from core import agenda
 from .. import TelemetryMessage
 from epoch import EpochState
 from .. import ORBIT_TELEMETRY
@@ -61,7 +64,7 @@ __all__ = ["ParseTelemetry",
 ####################
 # Constant section #
 #
-__version__ = "1.3"#current version [major.minor]
+__version__ = "1.6"#current version [major.minor]
 #
 ####################
 
@@ -87,17 +90,16 @@ class ParseTelemetry(EventRoutine):
     """
     
     name = "Telemetry.Parse"
+    pure = True
     
     def _occur(self,message):
         assert isinstance(message,types.StringTypes)
         
-        logging.info("{0}:  Parsing from {1}".\
-                     format(self.name,message))
+        self.journal.info("{0}:  Parsing from {1}",message)
         
         telemetry =  TelemetryMessage(**decoder(message))
         
-        logging.info("{0}:  Parsed to {1}".\
-                     format(self.name,telemetry.epoch))
+        self.journal.info("{0}:  Parsed to {1}",telemetry.epoch)
                      
         return telemetry
 
@@ -123,17 +125,17 @@ class FormatTelemetry(ActionRoutine):
     """
     
     name = "Telemetry.Format"
+    priority = agenda.BULK
+    pure = True
     
     def _execute(self,telemetry):
         assert isinstance(telemetry,TelemetryMessage)
         
-        logging.info("{0}:  Formatting from {1}".\
-                     format(self.name,telemetry.epoch))
+        self.journal.info("{0}:  Formatting from {1}",telemetry.epoch)
         
         message = encoder(telemetry)
         
-        logging.info("{0}:  Formatted to {1}".\
-                     format(self.name,message))
+        self.journal.info("{0}:  Formatted to {1}",message)
                      
         return message
 
@@ -172,8 +174,7 @@ class GenerateTelemetry(ActionRoutine):
         
         telemetry = TelemetryMessage(epoch,message,self.type)
         
-        logging.info("{0}:  Formatted at {1}".\
-                     format(self.name,telemetry.epoch))
+        self.journal.info("{0}:  Formatted at {1}",telemetry.epoch)
                      
         return telemetry
 
@@ -197,6 +198,7 @@ class ExtractState(EventRoutine):
     """
     
     name = "State.Extract"
+    pure = True
     
     def _occur(self,message):
         assert isinstance(message,TelemetryMessage)
@@ -4,7 +4,7 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   26 July 2013
+Modified:   18 October 2026
 
 Provides the state objects.
 
@@ -22,6 +22,8 @@ Date          Author          Version     Description
 ----------    ------------    --------    -----------------------------
 2013-07-03    shenely         1.0         Initial revision
 2013-07-26    shenely         1.1         Float conversion for numbers
+2026-10-18                    1.2         Slotted states
+2026-10-18                    1.3         Trusted constructors
 
 """
 
@@ -58,7 +60,7 @@ __all__ = ["KeplerianState",
 ####################
 # Constant section #
 #
-__version__ = "1.1"#current version [major.minor]
+__version__ = "1.3"#current version [major.minor]
 
 DEG_TO_RAD = pi / 180
 RAD_TO_DEG = 180 / pi
@@ -72,6 +74,8 @@ EPOCH_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
 
 
 class KeplerianState(EpochState):
+    __slots__ = ("a","theta","e","omega","i","OMEGA")
+    
     def __init__(self,epoch,a,theta,e,omega,i,OMEGA,*args,**kwargs):
         EpochState.__init__(self,epoch,*args,**kwargs)
         
@@ -102,6 +106,20 @@ class KeplerianState(EpochState):
         self.i = float(i)
         self.OMEGA = float(OMEGA)
     
+    @classmethod
+    def trusted(cls,epoch,a,theta,e,omega,i,OMEGA):
+        """Construct without validation (elements already normalized)"""
+        self = super(KeplerianState,cls).trusted(epoch)
+        
+        self.a = a
+        self.theta = theta
+        self.e = e
+        self.omega = omega
+        self.i = i
+        self.OMEGA = OMEGA
+        
+        return self
+    
     @property
     def epsilon(self):
         """Keplerian Specific Energy (read-only)"""
@@ -164,6 +182,8 @@ class KeplerianState(EpochState):
         return self.theta + self.omega
 
 class InertialState(EpochState):
+    __slots__ = ("position","velocity")
+    
     def __init__(self,epoch,position,velocity,*args,**kwargs):
         EpochState.__init__(self,epoch,*args,**kwargs)
         
@@ -180,6 +200,16 @@ class InertialState(EpochState):
         self.position = position
         self.velocity = velocity
     
+    @classmethod
+    def trusted(cls,epoch,position,velocity):
+        """Construct without validation (vectors already checked)"""
+        self = super(InertialState,cls).trusted(epoch)
+        
+        self.position = position
+        self.velocity = velocity
+        
+        return self
+    
     @property
     def x(self):
         """Inertial X (read-only)"""
@@ -246,6 +276,8 @@ class InertialState(EpochState):
         return cross(self.position,self.h) / EARTH_GRAVITATION - self.position / self.R
 
 class GeographicState(EpochState):
+    __slots__ = ("arc","long","lat")
+    
     def __init__(self, epoch,arc,long,lat,*args,**kwargs):   
         EpochState.__init__(self,epoch,*args,**kwargs)
         
@@ -263,6 +295,8 @@ class GeographicState(EpochState):
         self.lat = lat
 
 class HorizontalState(EpochState):
+    __slots__ = ("R","az","el")
+    
     def __init__(self,epoch,R,az,el,*args,**kwargs):
         EpochState.__init__(self,epoch,*args,**kwargs)
         
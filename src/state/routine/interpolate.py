@@ -5,7 +5,7 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   18 July 2013
+Modified:   18 October 2026
 
 Provides routines for state interpolation.
 
@@ -19,6 +19,8 @@ Date          Author          Version     Description
 ----------    ------------    --------    -----------------------------
 2013-07-11    shenely         1.0         Initial revision
 2013-07-18    shenely                     Fixed some naming issues
+2026-10-18                    1.1         Journal logging
+2026-10-18                    1.2         Trusted construction in inner loop
 
 """
 
@@ -27,7 +29,6 @@ Date          Author          Version     Description
 # Import section #
 #
 #Built-in libraries
-import logging
 
 #External libraries
 
@@ -50,7 +51,7 @@ __all__ = ["HermiteInterpolate"]
 ####################
 # Constant section #
 #
-__version__ = "1.0"#current version [major.minor]
+__version__ = "1.2"#current version [major.minor]
 
 HERMITE_SPLINE_00 = lambda t: 2 * t ** 3 - 3 * t ** 2 + 1 
 HERMITE_SPLINE_10 = lambda t: t ** 3 - 2 * t ** 2 + t
@@ -149,8 +150,7 @@ class HermiteInterpolate(InterpolateEvent):
         assert isinstance(message,EpochState)
         
         if (self.prev is not None) and (self.next is not None):
-            logging.info("{0}:  Interpolating from {1}".\
-                         format(self.name,self.prev.epoch))
+            self.journal.info("{0}:  Interpolating from {1}",self.prev.epoch)
             
             x = message.epoch
             t = (x - self.x0).total_seconds() / self.dx
@@ -163,15 +163,13 @@ class HermiteInterpolate(InterpolateEvent):
             p = h00 * self.p0 + h10 * self.m0 + h01 * self.p1 + h11 * self.m1
             m = (1 - t) * self.m0 + t * self.m1#FIXME:  doesn't use spline
             
-            self.curr = InertialState(x,p,m / self.dx)
+            self.curr = InertialState.trusted(x,p,m / self.dx)
             
-            logging.info("{0}:  Interpolated to {1}".\
-                         format(self.name,self.curr.epoch))
+            self.journal.info("{0}:  Interpolated to {1}",self.curr.epoch)
             
             return self.curr
         else:
-            logging.info("{0}:  Not ready for interpolation".\
-                         format(self.name))
+            self.journal.info("{0}:  Not ready for interpolation")
     
     def set_state(self,state):
         assert isinstance(state,InertialState)
@@ -4,7 +4,7 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   16 July 2013
+Modified:   18 October 2026
 
 Provides routines for orbit events.
 
@@ -26,6 +26,8 @@ Date          Author          Version     Description
 2013-07-15    shenely         1.1         Changed to events
 2013-07-16    shenely         1.2         Correctly outputting 
                                               EpochStates
+2026-10-18                    1.3         Journal logging
+2026-10-18                    1.4         Trusted construction in inner loop
 
 
 """
@@ -36,7 +38,6 @@ Date          Author          Version     Description
 #
 #Built-in libraries
 from datetime import timedelta
-import logging
 
 #External libraries
 from numpy import poly1d,where
@@ -65,7 +66,7 @@ __all__ = ["OrbitPerigee",
 ####################
 # Constant section #
 #
-__version__ = "1.2"#current version [major.minor]
+__version__ = "1.4"#current version [major.minor]
 
 #Earth parameters
 EARTH_GRAVITATION = 398600.4
@@ -155,10 +156,9 @@ class OrbitPerigee(OrbitEvent):
                 
                 x = x0 + timedelta(seconds = t * dx)
                 
-                epoch = EpochState(x)
+                epoch = EpochState.trusted(x)
             
-                logging.info("{0}:  Achieved at {1}".\
-                             format(self.name,epoch.epoch))
+                self.journal.info("{0}:  Achieved at {1}",epoch.epoch)
             
                 return epoch
 
@@ -221,10 +221,9 @@ class OrbitApogee(OrbitEvent):
                 
                 x = x0 + timedelta(seconds = t * dx)
                 
-                epoch = EpochState(x)
+                epoch = EpochState.trusted(x)
             
-                logging.info("{0}:  Achieved at {1}".\
-                             format(self.name,epoch.epoch))
+                self.journal.info("{0}:  Achieved at {1}",epoch.epoch)
             
                 return epoch
 
@@ -287,10 +286,9 @@ class OrbitAscendingNode(OrbitEvent):
                 
                 x = x0 + timedelta(seconds = t * dx)
                 
-                epoch = EpochState(x)
+                epoch = EpochState.trusted(x)
             
-                logging.info("{0}:  Achieved at {1}".\
-                             format(self.name,epoch.epoch))
+                self.journal.info("{0}:  Achieved at {1}",epoch.epoch)
             
                 return epoch
 
@@ -353,10 +351,9 @@ class OrbitDescendingNode(OrbitEvent):
                 
                 x = x0 + timedelta(seconds = t * dx)
                 
-                epoch = EpochState(x)
+                epoch = EpochState.trusted(x)
             
-                logging.info("{0}:  Achieved at {1}".\
-                             format(self.name,epoch.epoch))
+                self.journal.info("{0}:  Achieved at {1}",epoch.epoch)
             
                 return epoch
 
@@ -422,10 +419,9 @@ class OrbitNorthernPole(OrbitEvent):
                 
                 x = x0 + timedelta(seconds = t * dx)
                 
-                epoch = EpochState(x)
+                epoch = EpochState.trusted(x)
             
-                logging.info("{0}:  Achieved at {1}".\
-                             format(self.name,epoch.epoch))
+                self.journal.info("{0}:  Achieved at {1}",epoch.epoch)
             
                 return epoch
 
@@ -491,9 +487,8 @@ class OrbitSouthernPole(OrbitEvent):
                 
                 x = x0 + timedelta(seconds = t * dx)
                 
-                epoch = EpochState(x)
+                epoch = EpochState.trusted(x)
             
-                logging.info("{0}:  Achieved at {1}".\
-                             format(self.name,epoch.epoch))
+                self.journal.info("{0}:  Achieved at {1}",epoch.epoch)
             
                 return epoch
\ No newline at end of file
@@ -5,7 +5,7 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   29 June 2013
+Modified:   18 October 2026
 
 Provides routines for state propagation.
 
@@ -19,6 +19,8 @@ EphemerisPropagate -- Ephemeris propagation
 Date          Author          Version     Description
 ----------    ------------    --------    -----------------------------
 2013-06-29    shenely         1.0         Initial revision
+2026-10-18                    1.2         Journal logging
+2026-10-18                    1.3         Trusted construction in inner loop
 
 """
 
@@ -54,7 +56,7 @@ __all__ = ["kepler",
 ####################
 # Constant section #
 #
-__version__ = "1.1"#current version [major.minor]
+__version__ = "1.3"#current version [major.minor]
 
 CLOCK_STEP = timedelta(seconds=60)#Clock step (default to 60 seconds)
 
@@ -108,25 +110,24 @@ class KeplerPropagate(PropagateAction):
         self.step = step
                       
     def _execute(self,message):
-        logging.info("{0}:  Propagating from {1}".\
-                     format(self.name,self.state.epoch))
+        self.journal.info("{0}:  Propagating from {1}",self.state.epoch)
 
         e = self.state.e
         M = (self.state.M +\
              self.state.n * self.step.total_seconds()) % (2 * pi)
         E = newton(KEPLER_EQUATION,M,KEPLER_DERIVATIVE,(M,e),ANOMALY_ERROR)
                 
-        self.state = KeplerianState(self.state.epoch + self.step,
-                                    self.state.a,
-                                    2 * atan2(sqrt(1 + e) * sin(E / 2),
-                                           sqrt(1 - e) * cos(E / 2)),
-                                    self.state.e,
-                                    self.state.omega,
-                                    self.state.i,
-                                    self.state.OMEGA)
-
-        logging.info("{0}:  Propagated to {1}".\
-                     format(self.name,self.state.epoch))
+        self.state = KeplerianState.\
+                     trusted(self.state.epoch + self.step,
+                             self.state.a,
+                             2 * atan2(sqrt(1 + e) * sin(E / 2),
+                                       sqrt(1 - e) * cos(E / 2)) % (2 * pi),
+                             self.state.e,
+                             self.state.omega,
+                             self.state.i,
+                             self.state.OMEGA)
+
+        self.journal.info("{0}:  Propagated to {1}",self.state.epoch)
         
         return self.state
 
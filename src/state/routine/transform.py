@@ -5,7 +5,7 @@
 
 Author(s):  Sean Henely
 Language:   Python 2.x
-Modified:   28 July 2013
+Modified:   18 October 2026
 
 Provides routines for state transformation.
 
@@ -24,6 +24,8 @@ Date          Author          Version     Description
 ----------    ------------    --------    -----------------------------
 2013-07-08    shenely         1.0         Initial revision
 2013-07-28    shenely         1.1         Added time to geographic
+2026-10-18                    1.2         Journal logging
+2026-10-18                    1.3         Trusted construction in inner loop
 
 """
 
@@ -35,7 +37,6 @@ Date          Author          Version     Description
 from math import *
 from datetime import datetime
 import functools
-import logging
 import types
 
 #External libraries
@@ -66,7 +67,7 @@ __all__ = ["identityTransfrom",
 ####################
 # Constant section #
 #
-__version__ = "1.1"#current version [major.minor]
+__version__ = "1.3"#current version [major.minor]
 
 DEG_TO_RAD = pi / 180#Degrees to radians
 RAD_TO_DEG = 180 / pi#Radians to degrees
@@ -141,13 +142,11 @@ class IdentityTransform(TransformAction):
     name = "Transform.Identity"
     
     def _execute(self,message):
-        logging.info("{0}:  Transforming from self".\
-                     format(self.name))
+        self.journal.info("{0}:  Transforming from self")
         
         #
         
-        logging.info("{0}:  Transformed to self".\
-                     format(self.name))
+        self.journal.info("{0}:  Transformed to self")
                      
         return message
 
@@ -182,8 +181,7 @@ class InertialToKeplerianTransform(TransformAction):
     def _execute(self,message):
         assert isinstance(message,InertialState)
 
-        logging.info("{0}:  Transforming from inertial".\
-                     format(self.name))
+        self.journal.info("{0}:  Transforming from inertial")
         
         t = message.epoch
 
@@ -210,10 +208,10 @@ class InertialToKeplerianTransform(TransformAction):
         if _e_[:,2] < 0:omega = 2 * pi - omega
         if _N_[:,1] < 0:OMEGA = 2 * pi - OMEGA
 
-        message = KeplerianState(t,a,theta,e,omega,i,OMEGA)
+        message = KeplerianState.trusted(t,float(a),float(theta),float(e),
+                                         float(omega),float(i),float(OMEGA))
         
-        logging.info("{0}:  Transformed to Keplerian".\
-                     format(self.name))
+        self.journal.info("{0}:  Transformed to Keplerian")
         
         return message
 
@@ -250,8 +248,7 @@ class KeplerianToInertialTransform(TransformAction):
     def _execute(self,message):
         assert isinstance(message,KeplerianState)
         
-        logging.info("{0}:  Transforming from Keplerian".\
-                     format(self.name))
+        self.journal.info("{0}:  Transforming from Keplerian")
 
         #rotation matrices
         R_OMEGA = ROTATION_Z_AXIS(message.OMEGA)
@@ -272,10 +269,9 @@ class KeplerianToInertialTransform(TransformAction):
         r = Q * r
         v = Q * v
 
-        message = InertialState(t,r,v)
+        message = InertialState.trusted(t,r,v)
         
-        logging.info("{0}:  Transformed to inertial".\
-                     format(self.name))
+        self.journal.info("{0}:  Transformed to inertial")
         
         return message
 
@@ -308,8 +304,7 @@ class InertialToGeographicTransform(TransformAction):
     def _execute(self,message):
         assert isinstance(message,InertialState)
 
-        logging.info("{0}:  Transforming from inertial".\
-                     format(self.name))
+        self.journal.info("{0}:  Transforming from inertial")
         
         t = message.epoch
         arc = acosd(EARTH_RADIUS / message.R)
@@ -319,8 +314,7 @@ class InertialToGeographicTransform(TransformAction):
 
         message = GeographicState(t,arc,long,lat)
         
-        logging.info("{0}:  Transformed to geographic".\
-                     format(self.name))
+        self.journal.info("{0}:  Transformed to geographic")
         
         return message
 
@@ -361,8 +355,7 @@ class GeographicToHorizontalTransform(TransformAction):
     def _execute(self,message):
         assert isinstance(message,GeographicState)
 
-        logging.info("{0}:  Transforming from geographic".\
-                     format(self.name))
+        self.journal.info("{0}:  Transforming from geographic")
         
         t = message.epoch
         az = atan2(sind(message.long - self.state.long),
@@ -379,7 +372,6 @@ class GeographicToHorizontalTransform(TransformAction):
 
         message = HorizontalState(t,r,az,el)
         
-        logging.info("{0}:  Transformed to horizontal".\
-                     format(self.name))
+        self.journal.info("{0}:  Transformed to horizontal")
 
         return message
\ No newline at end of file
@@ -0,0 +1,203 @@
+#!/usr/bin/env python2.7
+
+"""Processor tests
+
+Author(s):  Sean Henely
+Language:   Python 2.x
+Modified:   18 October 2026
+
+Run from src with:  python -m unittest discover -s test -t .
+"""
+
+
+##################
+# Import section #
+#
+#Built-in libraries
+from datetime import datetime
+import unittest
+
+#External libraries
+
+#Internal libraries
+from core import agenda
+from core.routine import SourceRoutine,ActionRoutine,EventRoutine
+#
+##################
+
+
+class Record(ActionRoutine):
+    name = "Test.Record"
+    
+    def __init__(self,seen):
+        ActionRoutine.__init__(self)
+        
+        self.seen = seen
+    
+    def _execute(self,message):
+        self.seen.append(message)
+        
+        return message
+
+class Expand(EventRoutine):
+    """Sends the first part of a message and defers the rest"""
+    name = "Test.Expand"
+    
+    def __init__(self):
+        EventRoutine.__init__(self)
+        
+        self.processor = agenda.Processor()
+    
+    def _occur(self,message):
+        for part in message[1:]:
+            self.processor.defer(part,self,self.target)
+        
+        return message[0]
+
+class Origin(SourceRoutine):
+    name = "Test.Origin"
+
+def link(source,target):
+    source.set_target(target)
+    target.set_source(source)
+
+class Target(object):
+    """Target pipe (as seen by the run queue)"""
+    
+    def __init__(self,behavior,priority=agenda.NORMAL):
+        object.__init__(self)
+        
+        self.behavior = behavior
+        self.priority = priority
+
+class Dated(object):
+    __slots__ = ["epoch","name"]
+    
+    def __init__(self,epoch,name):
+        self.epoch = epoch
+        self.name = name
+
+class RunQueueTest(unittest.TestCase):
+    def setUp(self):
+        self.queue = agenda.RunQueue(quantum=2)
+    
+    def names(self):
+        names = list()
+        
+        while not self.queue.empty():
+            message = self.queue.get()[2]
+            
+            names.append(getattr(message,"name",message))
+        
+        return names
+    
+    def test_undated_fifo(self):
+        target = Target("a")
+        
+        for name in ("a1","a2","a3"):
+            self.queue.put(name,None,target)
+        
+        self.assertEqual(len(self.queue.fifo),3)
+        self.assertEqual(self.names(),["a1","a2","a3"])
+    
+    def test_dated_order(self):
+        target = Target("a")
+        
+        self.queue.put(Dated(datetime(2000,1,2),"d2"),None,target)
+        self.queue.put(Dated(datetime(2000,1,3),"d3"),None,target)
+        self.queue.put(Dated(datetime(2000,1,1),"d1"),None,target)
+        self.queue.put(Dated(datetime(2000,1,2),"d2b"),None,target)
+        
+        self.assertEqual(self.names(),["d1","d2","d2b","d3"])
+    
+    def test_spill(self):
+        target = Target("a")
+        
+        self.queue.put("u1",None,target)
+        self.queue.put(Dated(datetime(2000,1,1),"d1"),None,target)
+        self.queue.put("u2",None,target)
+        
+        self.assertEqual(len(self.queue.fifo),0)
+        self.assertEqual(self.names(),["u1","u2","d1"])
+    
+    def test_priority(self):
+        self.queue.put("bulk",None,Target("a",agenda.BULK))
+        self.queue.put("critical",None,Target("b",agenda.CRITICAL))
+        
+        self.assertEqual(self.names(),["critical","bulk"])
+    
+    def test_turns(self):
+        first,second = Target("a"),Target("b")
+        
+        for i in range(1,4):
+            self.queue.put("a{0}".format(i),None,first)
+        for i in range(1,4):
+            self.queue.put("b{0}".format(i),None,second)
+        
+        self.assertEqual(self.names(),["a1","a2","b1","b2","a3","b3"])
+    
+    def test_depth(self):
+        origin = Origin()
+        
+        self.queue.put("a1",None,Target("a"),origin)
+        self.queue.put("a2",None,Target("a"))
+        
+        self.assertEqual(self.queue.depth[origin],1)
+        
+        self.queue.get()
+        
+        self.assertEqual(self.queue.depth[origin],0)
+
+class BatchTest(unittest.TestCase):
+    def setUp(self):
+        agenda.Processor.reset()
+        
+        self.processor = agenda.Processor()
+        self.processor.batch = 4
+        self.processor.running = True
+        
+        self.seen = list()
+        
+        self.expand = Expand()
+        self.record = Record(self.seen)
+        link(self.expand,self.record)
+    
+    def tearDown(self):
+        agenda.Processor.reset()
+    
+    def drain(self):
+        while not self.processor.queue.empty():
+            for origin,result,deferred in self.processor.dispatch_batch():
+                self.processor.origin = origin
+                self.processor.deferred.extend(deferred)
+                
+                self.processor.schedule(*result)
+    
+    def test_deferred_order(self):
+        queue = self.processor.queue
+        queue.put(("a1","a2","a3"),None,self.expand)
+        queue.put(("b1","b2"),None,self.expand)
+        
+        self.drain()
+        
+        self.assertEqual(self.seen,["a1","a2","a3","b1","b2"])
+    
+    def test_origin_per_entry(self):
+        first,second = Origin(),Origin()
+        
+        queue = self.processor.queue
+        queue.put(("a",),None,self.expand,first)
+        queue.put(("b",),None,self.expand,second)
+        
+        results = self.processor.dispatch_batch()
+        
+        self.assertEqual([origin for origin,_,_ in results],[first,second])
+        
+        for origin,result,deferred in results:
+            self.processor.origin = origin
+            self.processor.schedule(*result)
+        
+        self.assertEqual(queue.depth[first],1)
+        self.assertEqual(queue.depth[second],1)
+
+if __name__ == '__main__':unittest.main()
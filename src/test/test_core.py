@@ -0,0 +1,88 @@
+#!/usr/bin/env python2.7
+
+"""Core object tests
+
+Author(s):  Sean Henely
+Language:   Python 2.x
+Modified:   18 October 2026
+
+Run from src with:  python -m unittest discover -s test -t .
+"""
+
+
+##################
+# Import section #
+#
+#Built-in libraries
+import copy
+import pickle
+import unittest
+
+#External libraries
+
+#Internal libraries
+from core import ObjectDict,BaseObject,SlotObject,freeze
+from core.routine.control import SplitControl,split_control
+#
+##################
+
+
+class Point(SlotObject):
+    __slots__ = ("x","y")
+    
+    def __init__(self,x,y,*args,**kwargs):
+        SlotObject.__init__(self,*args,**kwargs)
+        
+        self.x = x
+        self.y = y
+
+class FreezeTest(unittest.TestCase):
+    def check(self,original,thawed):
+        self.assertIs(type(thawed).__bases__[0],type(original).__bases__[0])
+        self.assertTrue(type(thawed).__frozen__)
+        self.assertRaises(TypeError,setattr,thawed,"x",3)
+    
+    def test_class(self):
+        point = freeze(Point(1,2))
+        
+        self.assertEqual(type(point).__module__,Point.__module__)
+        self.assertEqual(type(point).__name__,Point.__name__)
+        self.assertEqual(type(point).__qualname__,Point.__name__)
+    
+    def test_pickle_slots(self):
+        point = freeze(Point(1,2))
+        
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            loaded = pickle.loads(pickle.dumps(point,protocol))
+            
+            self.check(point,loaded)
+            self.assertEqual((loaded.x,loaded.y,loaded._id),
+                             (1,2,point._id))
+    
+    def test_pickle_dict(self):
+        message = freeze(BaseObject(x=1))
+        
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            loaded = pickle.loads(pickle.dumps(message,protocol))
+            
+            self.check(message,loaded)
+            self.assertEqual(loaded,message)
+    
+    def test_copy(self):
+        for message in (freeze(Point(1,2)),freeze(ObjectDict(x=1))):
+            for duplicate in (copy.copy(message),copy.deepcopy(message)):
+                self.check(message,duplicate)
+                self.assertEqual(duplicate["x"],1)
+
+class SplitTest(unittest.TestCase):
+    def test_frozen_persisted(self):
+        self.assertIn("frozen",[prop.func_name
+                                for prop in split_control.properties])
+        
+        split = SplitControl()
+        split.frozen = True
+        
+        self.assertTrue(split.frozen)
+        self.assertRaises(AssertionError,setattr,split,"frozen",1)
+
+if __name__ == '__main__':unittest.main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python2.7
+
+"""Database routine tests
+
+Author(s):  Sean Henely
+Language:   Python 2.x
+Modified:   18 October 2026
+
+Run from src with:  python -m unittest discover -s test -t .
+"""
+
+
+##################
+# Import section #
+#
+#Built-in libraries
+from datetime import datetime
+import unittest
+
+#External libraries
+from bson import BSON
+
+#Internal libraries
+from core.routine.database import DatabaseSave
+from message import ProductMessage,GEOGRAPHIC_PRODUCT
+#
+##################
+
+
+class Collection(object):
+    """Collection that encodes saved records as the driver would"""
+    
+    def __init__(self):
+        object.__init__(self)
+        
+        self.records = list()
+    
+    def save(self,record):
+        self.records.append(BSON.encode(record).decode())
+
+class SaveTest(unittest.TestCase):
+    def test_nested_message(self):
+        epoch = datetime(2000,1,1)
+        
+        message = ProductMessage(epoch,
+                                 dict(epoch=epoch,arc=1.0,
+                                      long=2.0,lat=3.0),
+                                 GEOGRAPHIC_PRODUCT)
+        
+        save = DatabaseSave()
+        save.database = dict(products=Collection())
+        save.collection = "products"
+        
+        self.assertIs(save._execute(message),message)
+        
+        record, = save.database["products"].records
+        
+        self.assertEqual(record["_id"],message._id)
+        self.assertEqual(record["data"]["_id"],message.data._id)
+        self.assertEqual((record["data"]["long"],record["data"]["lat"]),
+                         (2.0,3.0))
+
+if __name__ == '__main__':unittest.main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python2.7
+
+"""Engine tests
+
+Author(s):  Sean Henely
+Language:   Python 2.x
+Modified:   18 October 2026
+
+Run from src with:  python -m unittest discover -s test -t .
+"""
+
+
+##################
+# Import section #
+#
+#Built-in libraries
+import unittest
+
+#External libraries
+
+#Internal libraries
+from core import agenda,engine
+from core.routine import SourceRoutine,ActionRoutine
+#
+##################
+
+
+class Tick(SourceRoutine):
+    name = "Test.Tick"
+    type = agenda.PERIODIC
+    timeout = 1000
+    
+    def _receive(self):
+        return "tick"
+
+class Record(ActionRoutine):
+    name = "Test.Record"
+    
+    def _execute(self,message):
+        return message
+
+class Application(object):
+    def __init__(self):
+        object.__init__(self)
+        
+        self.processor = agenda.Processor()
+        self.behaviors = list()
+
+def behavior(application,name):
+    result = engine.Behavior(name)
+    result.application = application
+    
+    application.behaviors.append(result)
+    
+    return result
+
+def scenario(behavior,name,source,routine):
+    result = engine.Scenario(name)
+    result.behavior = behavior
+    result.From("source",source).Then("action",routine)
+    
+    behavior.scenarios.append(result)
+    
+    return result
+
+class TeardownTest(unittest.TestCase):
+    def setUp(self):
+        agenda.Processor.reset()
+        
+        self.application = Application()
+        self.processor = self.application.processor
+    
+    def tearDown(self):
+        agenda.Processor.reset()
+    
+    def test_shared_source(self):
+        """A source stays registered while another scenario uses it"""
+        tick = Tick()
+        
+        first = scenario(behavior(self.application,"First"),
+                         "One",tick,Record())
+        
+        #shared without being registered again (as a merged source is)
+        second = engine.Scenario("Two")
+        second.behavior = behavior(self.application,"Second")
+        second.routines.append(tick)
+        second.behavior.scenarios.append(second)
+        
+        first.teardown()
+        
+        self.assertIs(self.processor.sources.get(tick),second)
+        self.assertIn(tick,self.processor.timers)
+        
+        second.teardown()
+        
+        self.assertNotIn(tick,self.processor.sources)
+        self.assertNotIn(tick,self.processor.timers)
+    
+    def test_own_source(self):
+        tick = Tick()
+        
+        first = scenario(behavior(self.application,"First"),
+                         "One",tick,Record())
+        
+        first.teardown()
+        
+        self.assertNotIn(tick,self.processor.sources)
+        self.assertNotIn(tick,self.processor.timers)
+
+if __name__ == '__main__':unittest.main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python2.7
+
+"""Mapped queue tests
+
+Author(s):  Sean Henely
+Language:   Python 2.x
+Modified:   18 October 2026
+
+Run from src with:  python -m unittest discover -s test -t .
+"""
+
+
+##################
+# Import section #
+#
+#Built-in libraries
+import os
+import shutil
+import tempfile
+import unittest
+
+#External libraries
+
+#Internal libraries
+from core.mapped import MappedQueue
+#
+##################
+
+
+RECORD_SIZE = 64#bytes per record (small, so a long message overflows it)
+
+class MappedTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory,"queue")
+        
+        self.queue = MappedQueue(self.path,capacity=4,record=RECORD_SIZE)
+    
+    def tearDown(self):
+        self.queue.close()
+        
+        shutil.rmtree(self.directory)
+    
+    def test_too_large(self):
+        self.assertRaises(ValueError,self.queue.put,"x" * RECORD_SIZE)
+        self.assertEqual(self.queue.qsize(),0)
+        
+        self.queue.put("small")
+        
+        self.assertEqual(self.queue.get(),"small")
+    
+    def test_reopened(self):
+        self.queue.put("first")
+        self.queue.put("second")
+        self.queue.close()
+        
+        self.queue = MappedQueue(self.path,capacity=4,record=RECORD_SIZE)
+        
+        self.assertEqual([self.queue.get(),self.queue.get()],
+                         ["first","second"])
+
+if __name__ == '__main__':unittest.main()
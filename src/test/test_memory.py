@@ -0,0 +1,65 @@
+#!/usr/bin/env python2.7
+
+"""Memory channel tests
+
+Author(s):  Sean Henely
+Language:   Python 2.x
+Modified:   18 October 2026
+
+Run from src with:  python -m unittest discover -s test -t .
+"""
+
+
+##################
+# Import section #
+#
+#Built-in libraries
+import os
+import unittest
+
+#External libraries
+
+#Internal libraries
+from core.memory import MemoryChannel
+from core.routine.memory import MemoryPublish
+#
+##################
+
+
+RECORD_SIZE = 64#bytes per record (small, so a long message overflows it)
+
+class PublishTest(unittest.TestCase):
+    def setUp(self):
+        self.name = "test.{0:d}".format(os.getpid())
+        self.channel = MemoryChannel(self.name,capacity=4,record=RECORD_SIZE)
+    
+    def tearDown(self):
+        self.channel.close()
+        
+        os.unlink(self.channel.path)
+        
+        del MemoryChannel.self[self.name]
+    
+    def test_too_large(self):
+        self.assertRaises(ValueError,self.channel.publish,
+                          "Test","x" * RECORD_SIZE)
+        self.assertEqual(self.channel.sequence,0)
+        
+        self.channel.publish("Test","small")
+        
+        records,cursor,lost = self.channel.read(0)
+        
+        self.assertEqual((records,cursor,lost),([("Test","small")],1,0))
+    
+    def test_dropped(self):
+        publish = MemoryPublish()
+        publish.channel = self.name
+        publish.address = "Test"
+        
+        publish._send("x" * RECORD_SIZE)
+        publish._send("small")
+        
+        self.assertEqual(publish.dropped,1)
+        self.assertEqual(self.channel.sequence,1)
+
+if __name__ == '__main__':unittest.main()
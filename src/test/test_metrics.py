@@ -0,0 +1,65 @@
+#!/usr/bin/env python2.7
+
+"""Metrics tests
+
+Author(s):  Sean Henely
+Language:   Python 2.x
+Modified:   18 October 2026
+
+Run from src with:  python -m unittest discover -s test -t .
+"""
+
+
+##################
+# Import section #
+#
+#Built-in libraries
+import unittest
+
+#External libraries
+
+#Internal libraries
+from core import agenda,metrics
+from core.routine import SourceRoutine
+#
+##################
+
+
+class Origin(SourceRoutine):
+    name = "Test.Origin"
+
+class Scenario(object):
+    name = "Test.Scenario"
+
+class Application(object):
+    def __init__(self,processor):
+        object.__init__(self)
+        
+        self.processor = processor
+
+class ReportTest(unittest.TestCase):
+    def setUp(self):
+        agenda.Processor.reset()
+        
+        self.processor = agenda.Processor()
+        self.metrics = metrics.Metrics(Application(self.processor))
+    
+    def tearDown(self):
+        agenda.Processor.reset()
+    
+    def test_depth(self):
+        first,second = Origin(),Origin()
+        
+        self.processor.sources[first] = Scenario()
+        self.processor.sources[second] = None
+        
+        queue = self.processor.queue
+        queue.put("a",None,first,first)
+        queue.put("b",None,first,first)
+        queue.put("c",None,second,second)
+        
+        depth = self.metrics.report()["depth"]
+        
+        self.assertEqual(depth,{"Test.Scenario":2,"Test.Origin":1})
+
+if __name__ == '__main__':unittest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python2.7
+
+"""Graph optimizer tests
+
+Author(s):  Sean Henely
+Language:   Python 2.x
+Modified:   18 October 2026
+
+Run from src with:  python -m unittest discover -s test -t .
+"""
+
+
+##################
+# Import section #
+#
+#Built-in libraries
+import unittest
+
+#External libraries
+
+#Internal libraries
+from core import agenda,engine,optimizer
+from core.routine import SourceRoutine,EventRoutine,ActionRoutine
+#
+##################
+
+
+class Tick(SourceRoutine):
+    name = "Test.Tick"
+    type = agenda.PERIODIC
+    timeout = 1000
+    
+    def signature(self):
+        return type(self)#every tick is the same
+    
+    def _receive(self):
+        return "tick"
+
+class Parse(EventRoutine):
+    name = "Test.Parse"
+    pure = True
+    
+    def _occur(self,message):
+        return message
+
+class Record(ActionRoutine):
+    name = "Test.Record"
+    
+    def _execute(self,message):
+        return message
+
+class Application(object):
+    def __init__(self):
+        object.__init__(self)
+        
+        self.processor = agenda.Processor()
+        self.behaviors = list()
+
+def build(application,name):
+    """Behavior with one scenario (tick, parse, record)"""
+    behavior = engine.Behavior(name)
+    behavior.application = application
+    
+    scenario = engine.Scenario(name)
+    scenario.behavior = behavior
+    scenario.From("tick",Tick()).When("parse",Parse()).Then("record",Record())
+    
+    behavior.scenarios.append(scenario)
+    application.behaviors.append(behavior)
+    
+    return scenario
+
+class MergeTest(unittest.TestCase):
+    def setUp(self):
+        agenda.Processor.reset()
+        
+        self.application = Application()
+        self.processor = self.application.processor
+    
+    def tearDown(self):
+        agenda.Processor.reset()
+    
+    def test_teardown_after_merge(self):
+        """Tearing down the kept source's scenario leaves the other fed"""
+        first = build(self.application,"First")
+        second = build(self.application,"Second")
+        
+        tick,parse,_ = first.routines
+        _,_,record = second.routines
+        
+        report = optimizer.optimize(self.application)
+        
+        self.assertEqual(len(report["merged"]),2)#tick and parse
+        self.assertIn(tick,second.routines)
+        
+        first.teardown()
+        
+        self.assertIs(self.processor.sources.get(tick),second)
+        self.assertIn(tick,self.processor.timers)
+        self.assertIs(tick.target,parse)
+        self.assertEqual(parse.target.target,[record])#split to the second
+        self.assertEqual(record.source,[parse.target])
+        
+        second.teardown()
+        
+        self.assertNotIn(tick,self.processor.sources)
+        self.assertEqual(record.source,[])
+
+if __name__ == '__main__':unittest.main()
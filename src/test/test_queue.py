@@ -0,0 +1,116 @@
+#!/usr/bin/env python2.7
+
+"""Queue routine tests
+
+Author(s):  Sean Henely
+Language:   Python 2.x
+Modified:   18 October 2026
+
+Run from src with:  python -m unittest discover -s test -t .
+"""
+
+
+##################
+# Import section #
+#
+#Built-in libraries
+import os
+import shutil
+import tempfile
+import unittest
+
+#External libraries
+
+#Internal libraries
+from core.mapped import MappedQueue
+from core.routine.queue import QueueObject,QueuePut,queue_object
+#
+##################
+
+
+class Keyed(object):
+    def __init__(self,key,value):
+        object.__init__(self)
+        
+        self.key = key
+        self.value = value
+
+class MaxsizeTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+    
+    def test_persisted(self):
+        self.assertIn("maxsize",[prop.func_name
+                                 for prop in queue_object.properties])
+    
+    def test_standard(self):
+        for order in ((("type","standard"),("maxsize",2)),
+                      (("maxsize",2),("type","priority"))):
+            queue = QueueObject()
+            
+            for name,value in order:
+                setattr(queue,name,value)
+            
+            queue.queue.put(1)
+            self.assertFalse(queue.queue.full())
+            
+            queue.queue.put(2)
+            self.assertTrue(queue.queue.full())
+    
+    def test_mapped(self):
+        queue = QueueObject()
+        queue.type = "mapped"
+        queue.maxsize = 2
+        queue.path = os.path.join(self.directory,"queue")
+        
+        queue.queue.put(1)
+        queue.queue.put(2)
+        
+        self.assertTrue(queue.queue.full())
+        
+        queue.queue.close()
+
+class LatestTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.mapped = MappedQueue(os.path.join(self.directory,"queue"),
+                                  capacity=2)
+    
+    def tearDown(self):
+        self.mapped.close()
+        
+        shutil.rmtree(self.directory)
+    
+    def test_mapped_rejected(self):
+        put = QueuePut()
+        put.policy = "latest"
+        
+        self.assertRaises(ValueError,setattr,put,"queue",self.mapped)
+        
+        put = QueuePut()
+        put.queue = self.mapped
+        
+        self.assertRaises(ValueError,setattr,put,"policy","latest")
+    
+    def test_standard_replaced(self):
+        queue = QueueObject()
+        queue.type = "standard"
+        queue.maxsize = 2
+        
+        put = QueuePut()
+        put.queue = queue.queue
+        put.policy = "latest"
+        put.key = "key"
+        
+        for message in (Keyed("a",1),Keyed("b",1),Keyed("a",2)):
+            put._execute(message)
+        
+        self.assertEqual([(message.key,message.value)
+                          for message in queue.queue.queue],
+                         [("a",2),("b",1)])
+        self.assertEqual(put.dropped["latest"],1)
+
+if __name__ == '__main__':unittest.main()
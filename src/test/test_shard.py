@@ -0,0 +1,87 @@
+#!/usr/bin/env python2.7
+
+"""Shard partition tests
+
+Author(s):  Sean Henely
+Language:   Python 2.x
+Modified:   18 October 2026
+
+Run from src with:  python -m unittest discover -s test -t .
+"""
+
+
+##################
+# Import section #
+#
+#Built-in libraries
+import unittest
+
+#External libraries
+from bson.objectid import ObjectId
+
+#Internal libraries
+from core import engine
+from asset.routine.model import ParseModel
+#
+##################
+
+
+SHARD_COUNT = 4
+ASSETS = ["ISS","HST","Landsat","Terra","Aqua"] + \
+         ["Sat-{0:d}".format(index) for index in range(100)]
+
+class Segment(object):
+    def __init__(self,application):
+        self.application = application
+
+def shards(stories):
+    """Applications of every shard (without a database)"""
+    result = list()
+    
+    for index in range(SHARD_COUNT):
+        application = object.__new__(engine.Application)
+        application.shard = index
+        application.shards = SHARD_COUNT
+        application.versions = dict([(_id,None) for _id in stories
+                                     if application.owns(_id)])
+        
+        result.append(application)
+    
+    return result
+
+class PartitionTest(unittest.TestCase):
+    def assertOwnedOnce(self,parsers):
+        for name in ASSETS:
+            owners = [parser for parser in parsers if parser.owns(name)]
+            
+            self.assertEqual(len(owners),1,name)
+    
+    def test_replicated_behavior(self):
+        """Segment built in every shard (e.g. by the setup function)"""
+        behavior = ObjectId()
+        
+        parsers = list()
+        for application in shards([]):
+            parser = ParseModel(Segment(application))
+            parser.behavior = behavior
+            
+            parsers.append(parser)
+        
+        self.assertOwnedOnce(parsers)
+    
+    def test_story_behavior(self):
+        """Story built only by the shard that owns it"""
+        story = ObjectId()
+        
+        parsers = list()
+        for application in shards([story]):
+            if application.partitioned(story):
+                parser = ParseModel(Segment(application))
+                parser.behavior = story
+                
+                parsers.append(parser)
+        
+        self.assertEqual(len(parsers),1)
+        self.assertOwnedOnce(parsers)
+
+if __name__ == '__main__':unittest.main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python2.7
+
+"""Virtual-time tests
+
+Author(s):  Sean Henely
+Language:   Python 2.x
+Modified:   18 October 2026
+
+Run from src with:  python -m unittest discover -s test -t .
+"""
+
+
+##################
+# Import section #
+#
+#Built-in libraries
+from datetime import datetime,timedelta
+import time
+import unittest
+
+#External libraries
+import zmq
+
+#Internal libraries
+from core import agenda
+from core.routine import ActionRoutine
+from core.routine.socket import SocketSubscribe,SocketPublish
+from epoch.routine.clock import DiscreteClock
+#
+##################
+
+
+TICK_COUNT = 3
+SAFETY_TIMEOUT = 5#seconds before a stuck run is stopped
+
+class Stamp(ActionRoutine):
+    """Records a tick and publishes its epoch"""
+    name = "Test.Stamp"
+    
+    def __init__(self,seen):
+        ActionRoutine.__init__(self)
+        
+        self.seen = seen
+    
+    def _execute(self,message):
+        self.seen.append(("fire",str(message.epoch)))
+        
+        return str(message.epoch)
+
+class Record(ActionRoutine):
+    """Records a received epoch (and stops after the last tick)"""
+    name = "Test.Record"
+    
+    def __init__(self,seen):
+        ActionRoutine.__init__(self)
+        
+        self.seen = seen
+        self.processor = agenda.Processor()
+    
+    def _execute(self,message):
+        self.seen.append(("recv",message))
+        
+        if len(self.seen) == 2 * TICK_COUNT:
+            self.processor.loop.add_callback(self.processor.stop)
+        
+        return message
+
+def link(source,target):
+    source.set_target(target)
+    target.set_source(source)
+
+class HopTest(unittest.TestCase):
+    def setUp(self):
+        agenda.Processor.reset()
+        
+        self.processor = agenda.Processor()
+        self.processor.virtual = True
+        
+        self.context = zmq.Context()
+    
+    def tearDown(self):
+        self.processor.virtual = False
+        
+        agenda.Processor.reset()
+        
+        self.context.destroy(linger=0)
+    
+    def test_cross_socket_hop(self):
+        """Each tick is received before the next tick is fired"""
+        seen = list()
+        
+        publish = SocketPublish()
+        publish.socket = self.context.socket(zmq.PUB)
+        publish.socket.bind("inproc://virtual")
+        publish.address = "Test"
+        
+        subscribe = SocketSubscribe()
+        subscribe.socket = self.context.socket(zmq.SUB)
+        subscribe.socket.connect("inproc://virtual")
+        subscribe.address = "Test"
+        
+        epoch = datetime(2000,1,1)
+        
+        clock = DiscreteClock()
+        clock.epoch = epoch
+        clock._step = timedelta(minutes=1)
+        
+        link(clock,Stamp(seen))
+        link(clock.target,publish)
+        link(subscribe,Record(seen))
+        
+        self.processor.horizon = epoch + timedelta(minutes=TICK_COUNT)
+        self.processor.handler(subscribe,subscribe.handle,subscribe.event)
+        self.processor.periodic(clock,60000).start()
+        self.processor.loop.add_timeout(time.time() + SAFETY_TIMEOUT,
+                                        self.processor.stop)
+        
+        self.processor.start()
+        
+        epochs = [str(epoch + timedelta(minutes=index))
+                  for index in range(1,TICK_COUNT + 1)]
+        
+        self.assertEqual(seen,[(event,epoch) for epoch in epochs
+                               for event in ("fire","recv")])
+        self.assertEqual(self.processor.inflight,0)
+
+if __name__ == '__main__':unittest.main()